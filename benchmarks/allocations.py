@@ -0,0 +1,87 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time and memory allocated per `to_dict` and `render`.
+
+`to_dict` is timed for the classes which override it (to validate first) and
+so call the mixin's `to_dict` themselves, with `card_framework.codec`'s mixin
+and, if it is installed, `dataclasses_json`'s. The peak memory allocated
+while rendering a whole message is measured with `tracemalloc`.
+
+Run from the repository root:
+  python -m benchmarks.allocations [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from benchmarks import cards
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import ImageType
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.open_link import OpenLink
+
+try:
+  import dataclasses_json
+except ImportError:
+  dataclasses_json = None
+
+
+def measure(call: Callable[[], Any], number: int) -> Tuple[float, int]:
+  """Returns the time per call in microseconds and the peak bytes allocated."""
+  call()
+  tracemalloc.start()
+  base = tracemalloc.get_traced_memory()[0]
+  call()
+  peak = tracemalloc.get_traced_memory()[1] - base
+  tracemalloc.stop()
+
+  elapsed = min(timeit.repeat(call, number=number, repeat=5)) / number
+  return (elapsed * 1e6, peak)
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--number', type=int, default=2_000)
+  args = parser.parse_args(argv)
+
+  objects = [
+      CardHeader(title='The Princess Bride', subtitle='As you wish',
+                 image_url='https://pb', image_type=ImageType.CIRCLE),
+      OnClick(open_link=OpenLink(url='https://www.imdb.com/title/tt0093779/')),
+      Icon(known_icon=Icon.KnownIcon.PERSON),
+  ]
+  variants = {}
+  for obj in objects:
+    name = type(obj).__name__
+    variants[f'{name}.to_dict'] = (obj.to_dict, args.number)
+    if dataclasses_json:
+      variants[f'{name} dataclasses_json'] = (
+          lambda obj=obj: dataclasses_json.DataClassJsonMixin.to_dict(obj),
+          args.number)
+  message = cards.message(args.widgets)
+  variants[f'Message.render ({args.widgets:,} widgets)'] = (message.render, 20)
+
+  print(f'{"":40}{"us/call":>12}{"peak bytes":>12}')
+  for (name, (call, number)) in variants.items():
+    (elapsed, peak) = measure(call, number)
+    print(f'{name:40}{elapsed:12.2f}{peak:12,}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,72 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rendering a message through a `RenderCache`.
+
+Compares rendering a message afresh with looking it up in a warm
+`cache.RenderCache`: a mutable message, whose JSON is written to fingerprint
+it, a frozen message and an equal frozen copy of it, which only hash the JSON
+they keep, and a mutable message looked up by a key of the caller's, which
+costs a dictionary lookup.
+
+Run from the repository root:
+  python -m benchmarks.cache [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import timeit
+from typing import List
+
+from card_framework import cache
+
+from . import cards
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  message = cards.message(args.widgets)
+  frozen_message = message.freeze()
+  # Built again, so it is equal to `frozen_message` but not the same object.
+  equal_message = copy.deepcopy(message).freeze()
+  render_cache = cache.RenderCache()
+  assert render_cache.render(message) == message.render()
+  assert render_cache.render(frozen_message) == message.render()
+  assert render_cache.render_json(equal_message) == message.render_json()
+  assert render_cache.render_json(message, key='help') == message.render_json()
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  print(f'{args.widgets} widgets')
+  for (name, f) in [
+      ('render', message.render),
+      ('render and dumps', lambda: json.dumps(message.render())),
+      ('render_json', message.render_json),
+      ('cached render', lambda: render_cache.render(message)),
+      ('cached render_json', lambda: render_cache.render_json(message)),
+      ('frozen', lambda: render_cache.render_json(frozen_message)),
+      ('equal frozen', lambda: render_cache.render_json(equal_message)),
+      ('caller key', lambda: render_cache.render_json(message, key='help'))]:
+    print(f'{name + ":":20}{best(f):8.3f} ms')
+  print(render_cache.stats)
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,20 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Card shapes shared by the benchmarks.
+
+These are the shapes the tests use (see `card_framework/fixtures_test.py`): a
+header, `Section`s of `DecoratedText`, a `ButtonList` and a `Grid`.
+"""
+from card_framework.fixtures_test import (  # noqa: F401
+    button_list, card, decorated_text, grid, message)
@@ -0,0 +1,81 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Time to decode Chat event payloads with `from_dict`.
+
+The payloads are those of `benchmarks.events`: the sender of an event, one
+of the message's annotations and the whole message. Each is decoded with the
+compiled decoders of `card_framework.codec` and, if it is installed, with
+`dataclasses_json`'s generic decoder. Finally the message is decoded as a
+`LazyMessage`, reading only the fields a typical handler reads.
+
+Run from the repository root:
+  python -m benchmarks.decode [--number 2000]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+import warnings
+from typing import Any, List
+
+from benchmarks import events
+from card_framework.v2.annotation import Annotation
+from card_framework.v2.message import LazyMessage, Message
+from card_framework.v2.user import User
+
+try:
+  import dataclasses_json
+except ImportError:
+  dataclasses_json = None
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--number', type=int, default=2_000)
+  args = parser.parse_args(argv)
+
+  message = events.message()
+  payloads = [(User, events.user('inigo', 'Inigo Montoya')),
+              (Annotation, message['annotations'][1]),
+              (Message, message)]
+  decoders = {'codec': lambda cls, kvs: cls.from_dict(kvs)}
+  if dataclasses_json:
+    decoders['dataclasses_json'] = (
+        dataclasses_json.DataClassJsonMixin.from_dict.__func__)
+
+  print(f'{"us/call":24}' + ''.join(f'{name:>18}' for name in decoders))
+  # The library warns about every `None` it finds.
+  warnings.simplefilter('ignore')
+  for (cls, kvs) in payloads:
+    times = []
+    for (name, decode) in decoders.items():
+      number = args.number if name == 'codec' else max(args.number // 10, 1)
+
+      def call(decode=decode, cls=cls, kvs=kvs) -> Any:
+        return decode(cls, kvs)
+
+      call()
+      times.append(min(timeit.repeat(call, number=number, repeat=5)) / number)
+    print(f'{cls.__name__:24}' + ''.join(f'{t * 1e6:18.2f}' for t in times))
+
+  def handle() -> None:
+    event = LazyMessage.from_dict(message)
+    (event.text, event.sender.name, event.space.name)
+
+  elapsed = min(timeit.repeat(handle, number=args.number, repeat=5))
+  print(f'{"LazyMessage (3 fields)":24}{elapsed / args.number * 1e6:18.2f}')
+
+
+if __name__ == '__main__':
+  main()
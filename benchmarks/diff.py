@@ -0,0 +1,64 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Working out what an update to a message changes.
+
+Times `diff.update_mask` and `diff.changes` on the renders of two messages
+which differ in one widget (the usual update) and in every widget, against
+rendering one of the messages.
+
+Run from the repository root:
+  python -m benchmarks.diff [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List
+
+from card_framework import diff
+
+from . import cards
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  old = cards.message(args.widgets)
+  one = cards.message(args.widgets)
+  one.cards_v2[0].sections[-1].widgets[0].text = 'Inconceivable!'
+  every = cards.message(args.widgets)
+  for section in every.cards_v2[0].sections:
+    for widget in section.widgets:
+      if hasattr(widget, 'text'):
+        widget.text = 'Inconceivable!'
+  old, one, every = old.render(), one.render(), every.render()
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  message = cards.message(args.widgets)
+  print(f'{args.widgets} widgets')
+  for (name, f) in [
+      ('render', message.render),
+      ('update_mask, one widget', lambda: diff.update_mask(old, one)),
+      ('changes, one widget', lambda: diff.changes(old, one)),
+      ('changes, every widget', lambda: diff.changes(old, every))]:
+    print(f'{name + ":":26}{best(f):8.3f} ms')
+
+
+if __name__ == '__main__':
+  main()
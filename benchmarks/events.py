@@ -0,0 +1,21 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Chat event payloads shared by the benchmarks.
+
+`message(i)` is the `message` of a typical MESSAGE event, as the tests use
+it (see `card_framework/fixtures_test.py`): a slash command mentioning the
+app in a threaded space, with an attachment and reactions.
+"""
+from card_framework.fixtures_test import event_message as message  # noqa: F401
+from card_framework.fixtures_test import user  # noqa: F401
@@ -0,0 +1,78 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Fingerprinting a message.
+
+Compares `fingerprint` with hashing `json.dumps(render(), sort_keys=True)`,
+the usual way of fingerprinting a tree of dictionaries, for a mutable
+message, a message built from frozen sections and a frozen message.
+
+Run from the repository root:
+  python -m benchmarks.fingerprint [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import timeit
+from typing import Any, List
+
+from card_framework import fingerprint
+from card_framework.v2.card import CardWithId
+from card_framework.v2.message import Message
+
+from . import cards
+
+
+def dumps_fingerprint(message: Any) -> str:
+  return hashlib.blake2b(
+      json.dumps(message.render(), sort_keys=True).encode('utf-8'),
+      digest_size=fingerprint.DIGEST_SIZE).hexdigest()
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  message = cards.message(args.widgets)
+  card = message.cards_v2[0]
+  sections = [s.freeze() for s in card.sections]
+
+  def shared() -> Message:
+    # A new message each time, around the same frozen sections.
+    result = CardWithId(header=card.header, sections=list(sections))
+    result.card_id = card.card_id
+    return Message(text=message.text, cards_v2=[result])
+
+  frozen_message = message.freeze()
+  expected = fingerprint.fingerprint(message)
+  assert fingerprint.fingerprint(shared()) == expected
+  assert fingerprint.fingerprint(frozen_message) == expected
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  print(f'{args.widgets} widgets')
+  for (name, f) in [
+      ('render and dumps', lambda: dumps_fingerprint(message)),
+      ('fingerprint', lambda: fingerprint.fingerprint(message)),
+      ('frozen sections', lambda: fingerprint.fingerprint(shared())),
+      ('frozen message', lambda: fingerprint.fingerprint(frozen_message))]:
+    print(f'{name + ":":18}{best(f):8.3f} ms')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,78 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Cold import time of the card framework's modules.
+
+Each module is imported in a fresh interpreter with `python -X importtime`,
+which is most of what a card framework handler adds to a Cloud Functions or
+Cloud Run cold start. The median over a number of runs is reported, with the
+slowest modules each import pulls in.
+
+Run from the repository root:
+  python -m benchmarks.import_time [--modules card_framework.v2.message]
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# `import time: self [us] | cumulative | imported package`
+_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def import_times(module: str) -> Dict[str, int]:
+  """Imports a module in a fresh interpreter.
+
+  Args:
+      module (str): the module to import
+
+  Returns:
+      Dict[str, int]: the cumulative import time of each module imported, in
+        microseconds
+  """
+  result = subprocess.run([sys.executable, '-X', 'importtime', '-c',
+                           f'import {module}'],
+                          capture_output=True, text=True, check=True)
+  times = {}
+  for line in result.stderr.splitlines():
+    if match := _LINE.match(line):
+      times[match.group(4)] = int(match.group(2))
+  return times
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--modules', nargs='+', default=[
+      'card_framework', 'card_framework.v2', 'card_framework.v2.message',
+      'card_framework.v2.widgets.decorated_text'])
+  parser.add_argument('--runs', type=int, default=9)
+  parser.add_argument('--top', type=int, default=5)
+  args = parser.parse_args(argv)
+
+  for module in args.modules:
+    runs = [import_times(module) for _ in range(args.runs)]
+    total = statistics.median(times[module] for times in runs) / 1000
+    print(f'{module:48}{total:10.1f} ms')
+
+    slowest = sorted(((statistics.median(t.get(name, 0) for t in runs), name)
+                      for name in runs[0] if name != module), reverse=True)
+    for (elapsed, name) in slowest[:args.top]:
+      print(f'  {name:46}{elapsed / 1000:10.1f} ms')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,66 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Encoding cost of each JSON backend.
+
+Renders the benchmark message once, then times encoding the rendered tree
+with each installed backend, alongside `json.dumps` of the same tree and the
+streaming `render_json` (which renders as well as encodes, so it is shown
+end to end next to `render` plus each backend).
+
+Run from the repository root:
+  python -m benchmarks.json_backends [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from typing import Callable, List
+
+from card_framework import backends
+
+from . import cards
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  message = cards.message(args.widgets)
+  rendered = message.render()
+  outputs = {backends.dumps(rendered, name) for name in backends.BACKENDS}
+  assert len(outputs) == 1, 'backends disagree'
+
+  def best(f: Callable[[], bytes]) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  size = len(outputs.pop())
+  print(f'{args.widgets} widgets, {size:,} bytes compact')
+  print('encode only:')
+  print(f'  {"json.dumps (default)":22} {best(lambda: json.dumps(rendered)):8.2f} ms')
+  for name in backends.BACKENDS:
+    backend = backends.get_backend(name)
+    print(f'  {name:22} {best(lambda: backend.dumps(rendered)):8.2f} ms')
+
+  print('render and encode:')
+  print(f'  {"render_json()":22} {best(message.render_json):8.2f} ms')
+  for name in backends.BACKENDS:
+    ms = best(lambda: message.render_json(backend=name))
+    print(f'  {"render + " + name:22} {ms:8.2f} ms')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,107 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Memory per widget, regular and compact.
+
+The bytes per instance are measured with `tracemalloc` while building many
+instances of each class (with only atomic field values, so just the object
+itself is counted) from the regular class and from its compact, slotted
+variant. Since Python 3.11 a new object keeps its attributes inline until
+something asks for its `__dict__` (`vars`, `copy`, `pickle`...), so regular
+objects are measured both fresh and once they have one.
+
+A whole card is measured built from scratch, unpickled (as from a cache) and
+compacted, along with the time taken to render it.
+
+Run from the repository root:
+  python -m benchmarks.memory [--instances 10000] [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import pickle
+import timeit
+import tracemalloc
+from typing import Any, Callable, List
+
+from benchmarks import cards
+from card_framework import compact
+from card_framework.v2.widgets.action import ActionParameter
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.grid import GridItem
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.selection_item import SelectionItem
+
+_INSTANCES = {
+    DecoratedText: dict(top_label='Inigo Montoya', text='Prepare to die.'),
+    Button: dict(text='As you wish'),
+    SelectionItem: dict(text='Buttercup', value='buttercup', selected=True),
+    GridItem: dict(id='1', title='R.O.U.S.'),
+    Icon: dict(icon_url='https://example.com/rous.png'),
+    OnClick: dict(),
+    ActionParameter: dict(key='six', value='fingers'),
+}
+
+
+def allocated(build: Callable[[], Any]) -> int:
+  """Returns the bytes still allocated by whatever `build` returns."""
+  tracemalloc.start()
+  base = tracemalloc.get_traced_memory()[0]
+  kept = build()
+  size = tracemalloc.get_traced_memory()[0] - base
+  tracemalloc.stop()
+  del kept
+  return size
+
+
+def _with_dict(obj: Any) -> Any:
+  vars(obj)
+  return obj
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--instances', type=int, default=10_000)
+  parser.add_argument('--widgets', type=int, default=500)
+  args = parser.parse_args(argv)
+
+  print(f'{"bytes per instance":24}{"fresh":>10}{"__dict__":>10}'
+        f'{"compact":>10}')
+  for (cls, kwargs) in _INSTANCES.items():
+    n = args.instances
+    slotted = compact.compact_class(cls)
+    sizes = [allocated(lambda: [cls(**kwargs) for _ in range(n)]),
+             allocated(lambda: [_with_dict(cls(**kwargs)) for _ in range(n)]),
+             allocated(lambda: [slotted(**kwargs) for _ in range(n)])]
+    print(f'{cls.__name__:24}' + ''.join(f'{s // n:10,}' for s in sizes))
+
+  # Each is built from scratch, so all of them count their own strings. The
+  # first `compact` creates the compact classes, which isn't counted.
+  data = pickle.dumps(cards.card(args.widgets))
+  compact.compact(pickle.loads(data))
+  sizes = [allocated(lambda: cards.card(args.widgets)),
+           allocated(lambda: pickle.loads(data)),
+           allocated(lambda: compact.compact(cards.card(args.widgets)))]
+  print(f'{f"card ({args.widgets:,} widgets)":24}' +
+        ''.join(f'{s:10,}' for s in sizes))
+
+  card = cards.card(args.widgets)
+  times = [min(timeit.repeat(c.render, number=10, repeat=5)) / 10 * 1e3
+           for c in (card, compact.compact(card))]
+  print(f'{"card render (ms)":24}{times[0]:10.2f}{"":10}{times[1]:10.2f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,83 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""How long rendering a huge message blocks the event loop.
+
+A ticker task records the longest gap between its turns on the loop while a
+message is rendered with `render` (which holds the loop for the whole render)
+and with `render_async` at a few `every` settings.
+
+Run from the repository root:
+  python -m benchmarks.render_async [--widgets 2000] [--every 10 100 1000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+from benchmarks import cards
+
+
+async def measure(render: Callable[[], Awaitable]) -> Tuple[float, float]:
+  """Returns the total time and the longest stall, in milliseconds."""
+  longest = 0.0
+  running = True
+
+  async def ticker() -> None:
+    nonlocal longest
+    last = time.perf_counter()
+    while running:
+      await asyncio.sleep(0)
+      now = time.perf_counter()
+      longest = max(longest, now - last)
+      last = now
+
+  task = asyncio.create_task(ticker())
+  await asyncio.sleep(0)
+  start = time.perf_counter()
+  await render()
+  total = time.perf_counter() - start
+  running = False
+  await task
+  return (total * 1000, longest * 1000)
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=2_000)
+  parser.add_argument('--every', type=int, nargs='+', default=[10, 100, 1_000])
+  parser.add_argument('--repeat', type=int, default=5)
+  args = parser.parse_args(argv)
+
+  message = cards.message(args.widgets)
+
+  async def sync() -> None:
+    message.render()
+
+  variants = {'render': sync}
+  for every in args.every:
+    variants[f'render_async every={every}'] = (
+        lambda every=every: message.render_async(every=every))
+
+  print(f'{args.widgets:,} widgets, best of {args.repeat}')
+  print(f'{"":28}{"total ms":>12}{"stall ms":>12}')
+  for (name, render) in variants.items():
+    (total, stall) = min(asyncio.run(measure(render))
+                         for _ in range(args.repeat))
+    print(f'{name:28}{total:12.2f}{stall:12.2f}')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,76 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Re-rendering a card after a few widgets change, with and without the cache.
+
+Builds the benchmark card, changes the text of `--changes` widgets and renders
+it again, repeatedly. With `__CACHE_RENDER__` set only the changed widgets and
+the sections and card containing them are rebuilt.
+
+Run from the repository root:
+  python -m benchmarks.render_cache [--widgets 200] [--changes 5]
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import timeit
+from typing import List
+
+from card_framework import Renderable
+
+from . import cards
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=200)
+  parser.add_argument('--changes', type=int, default=5)
+  parser.add_argument('--repeat', type=int, default=50)
+  args = parser.parse_args(argv)
+
+  def update(cache: bool) -> float:
+    Renderable.__CACHE_RENDER__ = cache
+    try:
+      card = cards.card(args.widgets, per_section=20)
+      texts = [w for s in card.sections for w in s.widgets
+               if hasattr(w, 'text')]
+      step = max(1, len(texts) // args.changes)
+      changed = texts[::step][:args.changes]
+      counter = itertools.count()
+      card.render()
+
+      def tick():
+        n = next(counter)
+        for widget in changed:
+          widget.text = f'Prepare to die ({n})'
+        return card.render()
+
+      best = min(timeit.repeat(tick, number=1, repeat=args.repeat)) * 1e3
+      rendered = json.dumps(tick())
+      Renderable.__CACHE_RENDER__ = False
+      assert rendered == json.dumps(card.render())
+      return best
+    finally:
+      Renderable.__CACHE_RENDER__ = False
+
+  full = update(False)
+  cached = update(True)
+  print(f'{args.widgets} widgets, {args.changes} changed per render')
+  print(f'full render:   {full:8.3f} ms')
+  print(f'cached render: {cached:8.3f} ms ({full / cached:.1f}x)')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,79 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput of `render_many` against rendering messages one at a time.
+
+The messages are small digest messages (text and a one widget card), the
+case where per-call overhead matters most. A pool of distinct messages is
+cycled through to make up each batch, so large batches don't need millions of
+objects in memory.
+
+Run from the repository root:
+  python -m benchmarks.render_many [--sizes 1000 100000 1000000]
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import itertools
+import time
+from typing import Callable, Iterable, List
+
+from card_framework import backends, render_many
+from card_framework.v2.card import CardWithId
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.decorated_text import DecoratedText
+
+
+def digest(i: int) -> Message:
+  card = CardWithId(sections=[Section(widgets=[
+      DecoratedText(top_label='Daily digest',
+                    text=f'{i} new messages in Florin')])])
+  card.card_id = f'digest-{i}'
+  return Message(text=f'Good morning, Westley ({i})', cards_v2=[card])
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--sizes', type=int, nargs='+',
+                      default=[1_000, 100_000, 1_000_000])
+  parser.add_argument('--pool', type=int, default=1_000)
+  args = parser.parse_args(argv)
+
+  pool = [digest(i) for i in range(args.pool)]
+  fastest = backends.get_backend().name
+  variants = {
+      'render() loop': lambda ms: (m.render() for m in ms),
+      'render_many': render_many,
+      'render_json() loop': lambda ms: (m.render_json() for m in ms),
+      'render_many json': lambda ms: render_many(ms, as_json=True),
+      f'render_many {fastest}': lambda ms: render_many(ms, backend=fastest),
+  }
+
+  def throughput(run: Callable[[Iterable[Message]], Iterable], size: int
+                 ) -> float:
+    start = time.perf_counter()
+    # Consume the results without keeping them.
+    collections.deque(run(itertools.islice(itertools.cycle(pool), size)),
+                      maxlen=0)
+    return size / (time.perf_counter() - start)
+
+  print(f'{"messages/sec":24}' + ''.join(f'{size:>12,}' for size in args.sizes))
+  for (name, run) in variants.items():
+    print(f'{name:24}' + ''.join(f'{throughput(run, size):12,.0f}'
+                                 for size in args.sizes))
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,79 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-widget cost of tag and property discovery in `Renderable.render`.
+
+Compares `render` using the cached `RenderMetadata` with the previous
+approach of calling `inspect.getmembers` and `stringcase.camelcase` on every
+render. Both produce the widget body with the compiled plan, so the difference
+is the discovery cost alone.
+
+Run from the repository root:
+  python -m benchmarks.render_metadata [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import inspect
+import timeit
+from typing import Any, List, Mapping
+
+import stringcase
+
+from card_framework import compiler
+
+from . import cards
+
+
+def legacy_render(widget: Any) -> Mapping[str, Any]:
+  if getattr(widget, '__SUPPRESS_TAG__', False):
+    return compiler.to_dict(widget)
+
+  render = {
+      (getattr(widget, '__TAG_OVERRIDE__', False) or
+       stringcase.camelcase(widget.__class__.__name__)):
+      compiler.to_dict(widget)}
+  properties = inspect.getmembers(widget.__class__,
+                                  lambda v: isinstance(v, property))
+  for (name, value) in properties:
+    if widget_value := value.fget(widget):
+      render[stringcase.camelcase(name)] = widget_value
+
+  return render
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  widgets = [w for s in cards.card(args.widgets).sections for w in s.widgets]
+  assert [legacy_render(w) for w in widgets] == [w.render() for w in widgets]
+
+  def per_widget(render) -> float:
+    best = min(timeit.repeat(lambda: [render(w) for w in widgets],
+                             number=1, repeat=args.repeat))
+    return best / len(widgets) * 1e6
+
+  legacy = per_widget(legacy_render)
+  cached = per_widget(lambda w: w.render())
+  print(f'{len(widgets)} widgets')
+  print(f'getmembers per render: {legacy:8.2f} µs/widget')
+  print(f'cached metadata:       {cached:8.2f} µs/widget')
+  print(f'saving:                {legacy - cached:8.2f} µs/widget '
+        f'({legacy / cached:.1f}x)')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,71 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Throughput of `render_parallel` with different numbers of processes.
+
+Compares rendering in this process with `render_parallel`, both sending
+objects built here (in the compact transfer format) and building them in the
+workers. Also shows the size of a chunk pickled directly and packed.
+
+Run from the repository root:
+  python -m benchmarks.render_parallel [--messages 100000] [--workers 1 4 16]
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import os
+import pickle
+import time
+from typing import Iterable, List
+
+from card_framework import render_many, render_parallel, transfer
+
+from .render_many import digest
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--messages', type=int, default=100_000)
+  parser.add_argument('--workers', type=int, nargs='+',
+                      default=sorted({1, os.cpu_count() or 1}))
+  parser.add_argument('--chunk-size', type=int, default=256)
+  args = parser.parse_args(argv)
+
+  messages = [digest(i) for i in range(args.messages)]
+  chunk = messages[:args.chunk_size]
+  print(f'{args.messages:,} messages, {os.cpu_count()} CPUs')
+  print(f'chunk of {args.chunk_size}: '
+        f'{len(pickle.dumps(chunk)):,} bytes pickled, '
+        f'{len(pickle.dumps(transfer.pack(chunk))):,} bytes packed')
+
+  def throughput(results: Iterable[bytes]) -> float:
+    start = time.perf_counter()
+    collections.deque(results, maxlen=0)
+    return args.messages / (time.perf_counter() - start)
+
+  print(f'{"messages/sec":32}{throughput(render_many(messages, as_json=True)):12,.0f}'
+        '  (render_many, in process)')
+  for workers in args.workers:
+    sent = throughput(render_parallel(
+        messages, as_json=True, chunk_size=args.chunk_size,
+        max_workers=workers))
+    built = throughput(render_parallel(
+        range(args.messages), build=digest, as_json=True,
+        chunk_size=args.chunk_size, max_workers=workers))
+    print(f'{workers:3} workers, objects sent     {sent:12,.0f}')
+    print(f'{workers:3} workers, built in workers {built:12,.0f}')
+
+
+if __name__ == '__main__':
+  main()
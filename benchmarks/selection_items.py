@@ -0,0 +1,79 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Building and rendering a large dropdown.
+
+Compares a `SelectionInput` whose items are a list of `SelectionItem`s with
+one whose items are `SelectionItemColumns`, built from the same rows (as a
+database query would return them): the time to build the items, to render
+and `render_json` them once, and to `render_json` them again, and the memory
+the items take.
+
+Run from the repository root:
+  python -m benchmarks.selection_items [--items 5000]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List
+
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import (SelectionItem,
+                                                      SelectionItemColumns)
+
+from .memory import allocated
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--items', type=int, default=5000)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  rows = [(f'Project {i}', f'projects/{i}') for i in range(args.items)]
+
+  def objects() -> List[SelectionItem]:
+    return [SelectionItem(text=text, value=value) for (text, value) in rows]
+
+  def columns() -> SelectionItemColumns:
+    return SelectionItemColumns.from_rows(rows)
+
+  def dropdown(items) -> SelectionInput:
+    return SelectionInput(name='project', items=items,
+                          type=SelectionInput.SelectionType.DROPDOWN)
+
+  expected = dropdown(objects()).render_json()
+  assert dropdown(columns()).render_json() == expected
+  assert dropdown(columns()).render() == dropdown(objects()).render()
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  print(f'{args.items} items')
+  for (name, build) in [('SelectionItem', objects),
+                        ('SelectionItemColumns', columns)]:
+    prebuilt = dropdown(build())
+    prebuilt.render_json()
+    print(name)
+    for (step, f) in [
+        ('build', build),
+        ('render', lambda: dropdown(build()).render()),
+        ('render_json', lambda: dropdown(build()).render_json()),
+        ('prebuilt render_json', prebuilt.render_json)]:
+      print(f'  {step + ":":24}{best(f):8.3f} ms')
+    print(f'  {"memory:":24}{allocated(build) / 1024:8.0f} KiB')
+
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,69 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measuring a message without rendering it.
+
+Compares `len(message.render_json())` with `sizing.size`, `sizing.fits`
+against the Chat API's limit (which stops as soon as the message is over it)
+and `sizing.breakdown`, which measures every card, section and widget in one
+pass, against rendering each of them separately to find the same sizes.
+
+Run from the repository root:
+  python -m benchmarks.sizing [--widgets 500]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List
+
+from card_framework import serializer, sizing
+
+from . import cards
+
+
+def render_each(message) -> List[int]:
+  sizes = [len(message.render_json())]
+  for card in message.cards_v2:
+    sizes.append(len(card.render_json()))
+    for section in card.sections:
+      sizes.append(len(section.render_json()))
+      sizes.extend(len(serializer.render_json(w)) for w in section.widgets)
+  return sizes
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=500)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  message = cards.message(args.widgets)
+  assert sizing.size(message) == len(message.render_json())
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  print(f'{args.widgets} widgets, {sizing.size(message)} bytes '
+        f'(limit {sizing.MAX_MESSAGE_BYTES})')
+  for (name, f) in [
+      ('len(render_json())', message.render_json),
+      ('size', lambda: sizing.size(message)),
+      ('fits', lambda: sizing.fits(message)),
+      ('render_json of each part', lambda: render_each(message)),
+      ('breakdown', lambda: sizing.breakdown(message))]:
+    print(f'{name + ":":26}{best(f):8.3f} ms')
+
+
+if __name__ == '__main__':
+  main()
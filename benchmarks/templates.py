@@ -0,0 +1,71 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Per-request cost of a filled template against building and rendering.
+
+The card is the benchmark card with the header title, the first widget's
+text and the card id varying per request.
+
+Run from the repository root:
+  python -m benchmarks.templates [--widgets 20]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List
+
+from card_framework.template import Slot, Template
+from card_framework.v2.message import Message
+
+from . import cards
+
+
+def build(widgets: int, name: str, quote: str, card_id: str) -> Message:
+  message = cards.message(widgets)
+  card = message.cards_v2[0]
+  card.header.title = name
+  card.sections[0].widgets[0].text = quote
+  card.card_id = card_id
+  return message
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--widgets', type=int, default=20)
+  parser.add_argument('--number', type=int, default=2000)
+  args = parser.parse_args(argv)
+
+  template = Template(build(args.widgets, Slot('name'), Slot('quote'),
+                            Slot('card_id')))
+  values = {'name': 'Inigo Montoya', 'quote': 'Prepare to die.',
+            'card_id': 'inigo'}
+  assert (template.fill_json(**values) ==
+          build(args.widgets, **values).render_json())
+
+  def per_request(f) -> float:
+    return min(timeit.repeat(f, number=args.number, repeat=5)) / args.number * 1e6
+
+  render = per_request(lambda: build(args.widgets, **values).render())
+  render_json = per_request(lambda: build(args.widgets, **values).render_json())
+  fill = per_request(lambda: template.fill(**values))
+  fill_json = per_request(lambda: template.fill_json(**values))
+  print(f'{args.widgets} widgets, 3 slots')
+  print(f'build + render:      {render:9.2f} µs')
+  print(f'build + render_json: {render_json:9.2f} µs')
+  print(f'fill:                {fill:9.2f} µs ({render / fill:.0f}x)')
+  print(f'fill_json:           {fill_json:9.2f} µs ({render_json / fill_json:.0f}x)')
+
+
+if __name__ == '__main__':
+  main()
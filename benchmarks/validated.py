@@ -0,0 +1,62 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Validating a card.
+
+Compares `render_json` of a message before and after `validate` (which
+doesn't change what rendering does: the checks of nested widgets only run in
+`validate` and `violations`), and shows what the one-off `validate` (or
+collecting every `violations`) of the same message costs.
+
+Run from the repository root:
+  python -m benchmarks.validated [--cards 5]
+"""
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import List
+
+from card_framework import validation
+from card_framework.v2.card import MAX_WIDGETS
+from card_framework.v2.message import Message
+
+from . import cards
+
+
+def main(argv: List[str] = None) -> None:
+  parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+  parser.add_argument('--cards', type=int, default=5)
+  parser.add_argument('--repeat', type=int, default=20)
+  args = parser.parse_args(argv)
+
+  def best(f) -> float:
+    return min(timeit.repeat(f, number=1, repeat=args.repeat)) * 1e3
+
+  message = Message(cards_v2=[cards.card(MAX_WIDGETS)
+                              for _ in range(args.cards)])
+  expected = message.render_json()
+  checked = best(message.render_json)
+  collected = best(lambda: validation.violations(message))
+  once = best(message.validate)
+  assert message.render_json() == expected
+  validated = best(message.render_json)
+  print(f'{args.cards} cards of {MAX_WIDGETS} widgets')
+  print(f'render_json:            {checked:8.3f} ms')
+  print(f'validated render_json:  {validated:8.3f} ms')
+  print(f'validate (once):        {once:8.3f} ms')
+  print(f'violations:             {collected:8.3f} ms')
+
+
+if __name__ == '__main__':
+  main()
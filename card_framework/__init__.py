@@ -15,12 +15,79 @@ from __future__ import annotations
 
 import dataclasses
 import enum
-import inspect
-from typing import Any, Mapping, Type, TypeVar
+import importlib
+from typing import (TYPE_CHECKING, Any, Callable, Collection, Dict, List,
+                    Mapping, Tuple, Type, TypeVar)
+
+from card_framework import codec, compiler, tracking
+
+if TYPE_CHECKING:
+  from card_framework.batch import render_many
+  from card_framework.parallel import render_parallel
+
+__all__ = [
+    'AutoNumber',
+    'Renderable',
+    'enum_field',
+    'list_field',
+    'merge_metadata',
+    'render_many',
+    'render_parallel',
+    'standard_field',
+    'string_enum',
+]
+
+# The module each lazily imported name is defined in. These, and the
+# submodules `Renderable`'s methods use, are imported the first time they are
+# used (PEP 562): `render_parallel` needs `concurrent.futures`, and
+# `render_json` the JSON backends, neither of which every program needs.
+_LAZY = {
+    'render_many': 'batch',
+    'render_parallel': 'parallel',
+}
+_SUBMODULES = frozenset(['compact', 'fingerprint', 'frozen', 'serializer',
+                         'validation'])
+
+
+def _lazy_module(
+    namespace: Dict[str, Any], names: Mapping[str, str],
+    submodules: Collection[str] = frozenset()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+  """Builds the PEP 562 `__getattr__` and `__dir__` of a package which
+  imports its public names from their submodules the first time they are
+  used.
+
+  Args:
+      namespace (Dict[str, Any]): the package's `globals()`
+      names (Mapping[str, str]): the submodule each lazily imported name is
+        defined in
+      submodules (Collection[str], optional): the submodules which are
+        themselves imported when they are first used. Defaults to none.
+
+  Returns:
+      Tuple[Callable[[str], Any], Callable[[], List[str]]]: the package's
+        `__getattr__` and `__dir__`
+  """
+  package = namespace['__name__']
+
+  def __getattr__(name: str) -> Any:
+    if name in names:
+      value = getattr(importlib.import_module(f'.{names[name]}', package), name)
+    elif name in submodules:
+      value = importlib.import_module(f'.{name}', package)
+    else:
+      raise AttributeError(f'module {package!r} has no attribute {name!r}')
+
+    namespace[name] = value
+    return value
+
+  def __dir__() -> List[str]:
+    return sorted(set(namespace) | set(namespace['__all__']) | set(submodules))
+
+  return __getattr__, __dir__
 
-import dataclasses_json
-import stringcase
-from marshmallow import fields
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY, _SUBMODULES)
 
 
 def __field(default: Any = None, default_factory: Any = None,
@@ -28,10 +95,10 @@ def __field(default: Any = None, default_factory: Any = None,
   return (
       dataclasses.field(
           default_factory=default_factory,
-          metadata=dataclasses_json.config(**metadata)
+          metadata=codec.config(**metadata)
       ) if default_factory
       else dataclasses.field(default=default,
-                             metadata=dataclasses_json.config(**metadata))
+                             metadata=codec.config(**metadata))
   )
 
 
@@ -61,8 +128,8 @@ def merge_metadata(base: Mapping[str, Any], **custom) -> Mapping[str, Any]:
 def standard_field(default: Any = None, default_factory: Any = None,
                    **kwargs) -> dataclasses.Field:
   base = merge_metadata({
-      'letter_case': dataclasses_json.LetterCase.CAMEL,
-      'exclude': lambda x: not x
+      'letter_case': codec.LetterCase.CAMEL,
+      'exclude': compiler.exclude_unset
   }, **kwargs)
 
   return __field(default=default, default_factory=default_factory, **base)
@@ -70,7 +137,7 @@ def standard_field(default: Any = None, default_factory: Any = None,
 
 def enum_field(default: Any = None, **kwargs) -> dataclasses.Field:
   base = {
-      'encoder': lambda x: x.name if x else None,
+      'encoder': compiler.encode_enum,
       **kwargs
   }
 
@@ -79,39 +146,42 @@ def enum_field(default: Any = None, **kwargs) -> dataclasses.Field:
 
 def list_field(default_factory: Any = list,
                **kwargs) -> dataclasses.Field:
-  def __value(f: Any) -> Any:
-    for a in ['render', 'to_dict']:
-      if (m := getattr(f, a, None)) and callable(m):
-        return m()
-
-  base = {'encoder': lambda x: [__value(f) or f for f in x], **kwargs}
+  base = {'encoder': compiler.encode_list, **kwargs}
 
   return standard_field(default_factory=default_factory, **base)
 
 
+class _EnumMetadata(dict):
+  """`string_enum`'s metadata, which builds its marshmallow field on first
+  use rather than importing marshmallow for every enum."""
+
+  def __init__(self, cls: Type[enum.Enum]) -> None:
+    super().__init__(encoder=compiler.encode_enum,
+                     decoder=lambda name: cls[name])
+    self.__cls = cls
+
+  def __missing__(self, key: str) -> Any:
+    if key != 'mm_field':
+      raise KeyError(key)
+    value = self[key] = codec.enum_mm_field(self.__cls)
+    return value
+
+
 E = TypeVar('E', bound=enum.Enum)
-def string_enum(cls: Type[E]) -> Type[E]:
-  class EnumField(fields.Field):
-    def _serialize(self, value, attr, obj, **kwargs):
-      return value.name
 
-    def _deserialize(self, value, attr, data, **kwargs):
-      return cls[value]
 
+def string_enum(cls: Type[E]) -> Type[E]:
   if (not hasattr(cls, '__metadata__')):
     setattr(cls, '__metadata__', dict())
 
   metadata = {
-      "dataclasses_json": {
-          "encoder": lambda v: v.name if v else None,
-          "decoder": lambda name: cls[name],
-          "mm_field": EnumField(),
-      }
+      "dataclasses_json": _EnumMetadata(cls)
   }
 
   cls.__metadata__.update(metadata)
   return cls
 
+
 @string_enum
 class AutoNumber(enum.Enum):
   def __repr__(self):
@@ -128,6 +198,9 @@ class AutoNumber(enum.Enum):
     return cls[value]
 
 
+R = TypeVar('R', bound='Renderable')
+
+
 class Renderable(object):
   """Renderable adds a 'render' method to subclasses objects.
 
@@ -174,7 +247,71 @@ class Renderable(object):
   A subclass can implement their own `render` method, but it must return the
   valid Chat API JSON. An examnple of this is the `Card` class which has to add
   the `cardId` tag level with the `card` itself at the JSON top level.
+
+  The body of the widget comes from the class's compiled render plan (see
+  `card_framework.compiler`), which produces exactly what `to_dict` would.
+
+  __CACHE_RENDER__ (bool)
+    Keeps the result of `render` and returns it again until the widget, or
+    something in it, is changed. Set it on `Renderable` itself to cache every
+    widget, or on individual classes or instances. The returned dictionaries
+    are shared and must not be modified; see `card_framework.tracking` for
+    what changes are noticed, and call `mark_dirty` after any that aren't.
   """
+  __slots__ = ()
+  __CACHE_RENDER__ = False
+
+  def __getstate__(self) -> dict[str, Any]:
+    # The render cache holds weak references, and is not worth copying.
+    state = self.__dict__.copy()
+    state.pop(tracking.STATE, None)
+    return state
+
+  def mark_dirty(self) -> None:
+    """Drops the cached render of this widget and everything containing it.
+
+    This is only needed after a change `__setattr__` can't see, such as
+    appending to a list.
+    """
+    if (state := getattr(self, tracking.STATE, None)) is not None:
+      state.invalidate()
+
+  def freeze(self: R) -> R:
+    """Returns an immutable, hashable copy of the widget.
+
+    See `card_framework.frozen`.
+
+    Returns:
+        R: the frozen copy
+    """
+    from card_framework import frozen
+
+    return frozen.freeze(self)
+
+  def validate(self) -> None:
+    """Runs the consistency checks of everything in the widget, without
+    rendering it.
+
+    See `card_framework.validation`.
+
+    Raises:
+        ValueError: from the first check which fails
+    """
+    from card_framework import validation
+
+    validation.validate(self)
+
+  def compact(self: R) -> R:
+    """Returns a copy of the widget which keeps its fields in slots.
+
+    See `card_framework.compact`.
+
+    Returns:
+        R: the compact copy
+    """
+    from card_framework import compact
+
+    return compact.compact(self)
 
   def render(self) -> Mapping[str, Any]:
     """Renders the widget in a usable form.
@@ -182,16 +319,85 @@ class Renderable(object):
     Returns:
         Mapping[str, Any]: the json representation of the widget
     """
-    if getattr(self, '__SUPPRESS_TAG__', False):
-      return self.to_dict()
-
-    render = {
-        (getattr(self, '__TAG_OVERRIDE__', False) or
-         stringcase.camelcase(self.__class__.__name__)): self.to_dict()}
-    properties = inspect.getmembers(self.__class__,
-                                    lambda v: isinstance(v, property))
-    for (name, value) in properties:
-      if widget_value := value.fget(self):
-        render[stringcase.camelcase(name)] = widget_value
+    if self.__CACHE_RENDER__:
+      state = tracking.state(self)
+      if state.render is None:
+        state.render = self.__render()
+        tracking.adopt(self)
+      return state.render
+
+    return self.__render()
+
+  def __render(self) -> Mapping[str, Any]:
+    metadata = compiler.render_metadata(self.__class__)
+    if getattr(self, '__SUPPRESS_TAG__', metadata.suppress_tag):
+      return compiler.to_dict(self)
+
+    render = {(getattr(self, '__TAG_OVERRIDE__', False) or metadata.tag):
+              compiler.to_dict(self)}
+    for (name, fget) in metadata.properties:
+      if widget_value := fget(self):
+        render[name] = widget_value
 
     return render
+
+  async def render_async(self, every: int = 100) -> Mapping[str, Any]:
+    """Renders the widget without blocking the event loop.
+
+    This yields to the event loop every `every` list entries (widgets,
+    sections, items...); see `card_framework.asynchronous`.
+
+    Args:
+        every (int, optional): the number of list entries to render between
+          each yield. Defaults to 100.
+
+    Returns:
+        Mapping[str, Any]: the json representation of the widget
+    """
+    # Imported here as `asyncio` is slow to import and rarely needed.
+    from card_framework import asynchronous
+
+    return await asynchronous.render_async(self, every)
+
+  def render_json(self, backend: Any = None) -> bytes:
+    """Renders the widget straight to JSON.
+
+    This skips building the dictionary `render` would return.
+
+    Args:
+        backend (Any, optional): a JSON backend or its name ('json', 'orjson',
+          'ujson' or 'auto'); see `card_framework.backends`. Defaults to None.
+
+    Returns:
+        bytes: the UTF-8 encoded `json.dumps(self.render())`, or the
+          backend's compact JSON if one is given
+    """
+    from card_framework import serializer
+
+    return serializer.render_json(self, backend=backend)
+
+  def write_json(self, fp: Any, backend: Any = None) -> int:
+    """Renders the widget as JSON into a binary file or a `bytearray`.
+
+    Args:
+        fp (Any): a binary file-like object, or a `bytearray` to extend
+        backend (Any, optional): as for `render_json`. Defaults to None.
+
+    Returns:
+        int: the number of bytes written
+    """
+    from card_framework import serializer
+
+    return serializer.write_json(self, fp, backend=backend)
+
+  def fingerprint(self) -> str:
+    """Fingerprints the widget by what it renders to.
+
+    See `card_framework.fingerprint`.
+
+    Returns:
+        str: the BLAKE2b digest of the widget's JSON, in hex
+    """
+    from card_framework import fingerprint
+
+    return fingerprint.fingerprint(self)
@@ -13,6 +13,8 @@
 # limitations under the License.
 from __future__ import annotations
 
+import dataclasses
+import enum
 import unittest
 from dataclasses import Field, dataclass
 from typing import Callable, List
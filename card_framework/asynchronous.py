@@ -0,0 +1,140 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rendering without blocking the event loop.
+
+`render_async` produces exactly what `render` does, but hands control back
+to the event loop every so many list entries (widgets, sections, grid items,
+selection items...), so that rendering a huge message doesn't hold up every
+other request being handled by the same loop.
+
+The tree is walked by a generator which mirrors `Renderable.render`: each
+object's body comes from its render plan, compiled so that the entries of its
+`list_field`s are left to the walker, which renders them one at a time and
+yields once it has rendered enough of them. Anything without a `list_field`
+(most widgets), rendered some other way (an object with its own `render` or
+`to_dict`, or a cached render) or nested in a field that isn't a `list_field`
+is rendered in one go.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Generator, List, Mapping
+
+from card_framework import compiler
+
+Steps = Generator[None, None, Any]
+
+_PLANS: Dict[type, compiler.Plan] = {}
+_WALKABLE: Dict[type, bool] = {}
+
+
+class _Deferred(object):
+  """A `list_field` entry left for the walker to render."""
+  __slots__ = ('value',)
+
+  def __init__(self, value: Any) -> None:
+    self.value = value
+
+
+async def render_async(obj: Any, every: int = 100) -> Mapping[str, Any]:
+  """Renders a `Renderable`, yielding to the event loop as it goes.
+
+  Args:
+      obj (Any): the `Renderable`
+      every (int, optional): the number of list entries to render between
+        each yield. Defaults to 100.
+
+  Returns:
+      Mapping[str, Any]: what `obj.render()` returns
+  """
+  steps = walk(obj, [every, every])
+  try:
+    while True:
+      next(steps)
+      await asyncio.sleep(0)
+  except StopIteration as done:
+    return done.value
+
+
+def walk(obj: Any, budget: List[int]) -> Steps:
+  """Renders a `Renderable`, yielding whenever the budget runs out.
+
+  Args:
+      obj (Any): the `Renderable`
+      budget (List[int]): the number of list entries left to render before
+        yielding, followed by the number to reset it to after
+
+  Returns:
+      Steps: a generator returning `obj.render()`
+  """
+  cls = type(obj)
+  if not _walkable(cls) or obj.__CACHE_RENDER__:
+    return obj.render()
+
+  metadata = compiler.render_metadata(cls)
+  if getattr(obj, '__SUPPRESS_TAG__', metadata.suppress_tag):
+    return (yield from _body(obj, budget))
+
+  render = {(getattr(obj, '__TAG_OVERRIDE__', False) or metadata.tag):
+            (yield from _body(obj, budget))}
+  for (name, fget) in metadata.properties:
+    if widget_value := fget(obj):
+      render[name] = widget_value
+
+  return render
+
+
+def _walkable(cls: type) -> bool:
+  """Whether a class is worth walking: a `Renderable` with `list_field`s and
+  no `render` or `to_dict` of its own."""
+  try:
+    return _WALKABLE[cls]
+  except KeyError:
+    from card_framework import Renderable
+
+    names = getattr(cls, '__dataclass_fields__', {})
+    walkable = _WALKABLE[cls] = (
+        issubclass(cls, Renderable) and cls.render is Renderable.render and
+        compiler.is_mixin_to_dict(cls.to_dict) and
+        'render' not in names and 'to_dict' not in names and
+        any(o.get('encoder') is compiler.encode_list
+            for o in compiler.field_overrides(cls).values()))
+    return walkable
+
+
+def _body(obj: Any, budget: List[int]) -> Steps:
+  cls = type(obj)
+  try:
+    plan = _PLANS[cls]
+  except KeyError:
+    plan = _PLANS[cls] = compiler.compile_plan(cls, item=_Deferred)
+
+  body = plan(obj)
+  for (key, value) in body.items():
+    if type(value) is list and value and type(value[0]) is _Deferred:
+      items = []
+      for deferred in value:
+        f = deferred.value
+        if _walkable(type(f)):
+          items.append((yield from walk(f, budget)) or f)
+        else:
+          items.append(compiler._encode_item(f))
+
+        budget[0] -= 1
+        if budget[0] <= 0:
+          budget[0] = budget[1]
+          yield
+      body[key] = items
+
+  return body
@@ -0,0 +1,95 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import asyncio
+import json
+import unittest
+
+from card_framework import fixtures_test as fixtures
+from card_framework import asynchronous
+from card_framework.serializer_test import _message
+from card_framework.v2.card import Card
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import SelectionItem
+
+
+class RenderAsyncTest(unittest.TestCase):
+  def assertSameRender(self, obj, every: int = 100) -> None:
+    self.assertEqual(json.dumps(obj.render()),
+                     json.dumps(asyncio.run(obj.render_async(every=every))))
+
+  def test_message(self) -> None:
+    self.assertSameRender(_message())
+    self.assertSameRender(_message(), every=1)
+
+  def test_large_message(self) -> None:
+    self.assertSameRender(fixtures.message(widgets=500), every=7)
+
+  def test_widgets(self) -> None:
+    for section in _message().cards_v2[0].sections:
+      self.assertSameRender(section)
+      for widget in section.widgets:
+        self.assertSameRender(widget)
+
+  def test_tag_override(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__TAG_OVERRIDE__ = 'pushCard'
+
+    self.assertSameRender(card)
+
+  def test_selection_items(self) -> None:
+    selection = SelectionInput(
+        name='suitor', type=SelectionInput.SelectionType.DROPDOWN,
+        items=[SelectionItem(text=f'Suitor {i}', value=str(i))
+               for i in range(250)])
+
+    self.assertSameRender(selection, every=10)
+
+  def test_cached_render(self) -> None:
+    section = Section(header='Florin',
+                      widgets=[DecoratedText(text='Vizzini')]).freeze()
+
+    self.assertSameRender(Card(sections=[section]))
+
+  def test_yields_to_the_loop(self) -> None:
+    message = fixtures.message(widgets=100)
+    ticks = []
+
+    async def ticker() -> None:
+      while True:
+        ticks.append(None)
+        await asyncio.sleep(0)
+
+    async def run() -> None:
+      task = asyncio.create_task(ticker())
+      await asyncio.sleep(0)
+      before = len(ticks)
+      await message.render_async(every=10)
+      task.cancel()
+      return len(ticks) - before
+
+    # Over 100 entries, rendered 10 at a time.
+    self.assertGreaterEqual(asyncio.run(run()), 10)
+
+  def test_budget_is_shared(self) -> None:
+    card = Card(sections=[
+        Section(widgets=[DecoratedText(text=f'Rodent {i}') for i in range(50)])
+        for _ in range(2)])
+    steps = asynchronous.walk(card, [25, 25])
+
+    # 2 sections and 100 widgets: 102 entries, so 4 yields.
+    self.assertEqual(4, sum(1 for _ in steps))
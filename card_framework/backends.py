@@ -0,0 +1,167 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""JSON encoder backends.
+
+A backend turns a rendered tree (the output of `render`) into compact UTF-8
+JSON: no whitespace between tokens and non-ASCII characters written as is.
+`orjson` and `ujson` are used if they are installed (and only imported when
+their backend is first used), with the standard library `json` module as the
+fallback, and every backend produces exactly the same bytes:
+  * key order is the order of the rendered dictionaries,
+  * enums have already been encoded by name by `enum_field`,
+  * floats are written as Python writes them (`1e-07`, not `1e-7`, and
+    `1e-05`, not `0.00001`), and
+  * anything a native encoder can't handle (integers wider than 64 bits, for
+    instance) is passed to the standard library encoder instead.
+
+Non-finite floats aren't valid JSON: the `json` and `ujson` backends reject
+them with a `ValueError`, while `orjson` writes `null`.
+"""
+from __future__ import annotations
+
+import importlib.util
+import json
+import re
+from typing import Any, Dict, Type, Union
+
+# Anything that might be a number in exponent notation. Starting the pattern
+# with the literal `e` lets `re` skip ahead quickly, which matters as this is
+# run over the whole output.
+_EXPONENT = re.compile(rb'e(?<=[0-9]e)[-+]?[0-9]')
+# The start of a float below 1e-4 written out in full, as `orjson` does down
+# to 1e-5 where Python has already switched to exponent notation.
+_SMALL = b'.0000'
+# A JSON string (skipped), or a number in exponent notation or a small one
+# written out in full (rewritten).
+_TOKEN = re.compile(
+    rb'"(?:[^"\\]|\\.)*"|-?\d+(?:\.\d+)?e[-+]?\d+|(?<![0-9])-?0\.0000\d+')
+
+
+def _python_float(match: re.Match) -> bytes:
+  token = match.group(0)
+  if token.startswith(b'"'):
+    return token
+  return repr(float(token)).encode('ascii')
+
+
+def _normalise_numbers(data: bytes) -> bytes:
+  """Rewrites floats which Python would write differently the way it does."""
+  if _SMALL in data or _EXPONENT.search(data):
+    return _TOKEN.sub(_python_float, data)
+  return data
+
+
+class JsonBackend(object):
+  """The standard library `json` backend, and the base of the others."""
+  name = 'json'
+
+  def dumps(self, value: Any) -> bytes:
+    """Encodes a rendered tree.
+
+    Args:
+        value (Any): the output of `render`
+
+    Returns:
+        bytes: the compact UTF-8 JSON
+    """
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'),
+                      allow_nan=False).encode('utf-8')
+
+
+class OrjsonBackend(JsonBackend):
+  """The `orjson` backend."""
+  name = 'orjson'
+
+  def __init__(self) -> None:
+    import orjson
+
+    self._orjson = orjson
+
+  def dumps(self, value: Any) -> bytes:
+    try:
+      return _normalise_numbers(self._orjson.dumps(value))
+    except self._orjson.JSONEncodeError:
+      return super().dumps(value)
+
+
+class UjsonBackend(JsonBackend):
+  """The `ujson` backend."""
+  name = 'ujson'
+
+  def __init__(self) -> None:
+    import ujson
+
+    self._ujson = ujson
+
+  def dumps(self, value: Any) -> bytes:
+    try:
+      data = self._ujson.dumps(value, ensure_ascii=False,
+                               escape_forward_slashes=False, allow_nan=False)
+    except (TypeError, ValueError, OverflowError):
+      return super().dumps(value)
+    return _normalise_numbers(data.encode('utf-8'))
+
+
+# The installed backends, found without importing them.
+BACKENDS: Dict[str, Type[JsonBackend]] = {'json': JsonBackend}
+if importlib.util.find_spec('ujson'):
+  BACKENDS['ujson'] = UjsonBackend
+if importlib.util.find_spec('orjson'):
+  BACKENDS['orjson'] = OrjsonBackend
+
+# In order of preference.
+_PREFERRED = ['orjson', 'ujson', 'json']
+_instances: Dict[str, JsonBackend] = {}
+
+
+def get_backend(backend: Union[str, JsonBackend, None] = None) -> JsonBackend:
+  """Returns a JSON backend.
+
+  Args:
+      backend (Union[str, JsonBackend, None], optional): a backend, the name of
+        one ('json', 'orjson' or 'ujson') or `None` (or 'auto') for the fastest
+        one installed. Defaults to None.
+
+  Raises:
+      ValueError: if the named backend is unknown or not installed
+
+  Returns:
+      JsonBackend: the backend
+  """
+  if isinstance(backend, JsonBackend):
+    return backend
+
+  name = (backend if backend not in (None, 'auto')
+          else next(n for n in _PREFERRED if n in BACKENDS))
+  if name not in BACKENDS:
+    raise ValueError(f'JSON backend {name} is not available; installed '
+                     f'backends are {sorted(BACKENDS)}.')
+
+  if name not in _instances:
+    _instances[name] = BACKENDS[name]()
+  return _instances[name]
+
+
+def dumps(value: Any, backend: Union[str, JsonBackend, None] = None) -> bytes:
+  """Encodes a rendered tree with a backend.
+
+  Args:
+      value (Any): the output of `render`
+      backend (Union[str, JsonBackend, None], optional): see `get_backend`.
+        Defaults to None.
+
+  Returns:
+      bytes: the compact UTF-8 JSON
+  """
+  return get_backend(backend).dumps(value)
@@ -0,0 +1,122 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import json
+import unittest
+
+from card_framework import backends
+from card_framework.v2.card import Card
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.color import Color
+
+from card_framework.serializer_test import _message
+
+
+class BackendsTest(unittest.TestCase):
+  def assertAllIdentical(self, value) -> None:
+    expected = json.dumps(value, ensure_ascii=False,
+                          separators=(',', ':')).encode('utf-8')
+    for name in backends.BACKENDS:
+      with self.subTest(backend=name):
+        self.assertEqual(expected, backends.dumps(value, name))
+
+  def test_widget_tree(self) -> None:
+    message = _message()
+
+    self.assertAllIdentical(message.render())
+    for section in message.cards_v2[0].sections:
+      for widget in section.widgets:
+        self.assertAllIdentical(widget.render())
+
+  def test_enum_is_rendered_by_name(self) -> None:
+    card = Card(display_style=Card.DisplayStyle.PEEK,
+                sections=[Section(header='Florin')])
+
+    self.assertEqual(b'{"card":{"sections":[{"header":"Florin"}],'
+                     b'"displayStyle":"PEEK"}}',
+                     card.render_json(backend='json'))
+    self.assertAllIdentical(card.render())
+
+  def test_floats(self) -> None:
+    self.assertAllIdentical(
+        Color(red=1e-07, green=0.5, blue=1e-16).to_dict())
+    self.assertAllIdentical({'1e-07': [1e16, 1.5e300, -2.5e-300, '1e-7', 0.0]})
+
+  def test_small_floats(self) -> None:
+    # 1e-5 <= |x| < 1e-4, which `orjson` writes out in full.
+    self.assertAllIdentical({'0.00005': [
+        1e-05, 9.78893343311414e-05, -1.6966879223824978e-05, 5e-05, 0.0001,
+        10.00005, -0.000099999, '0.00005', 'x.00005']})
+
+  def test_escapes(self) -> None:
+    self.assertAllIdentical(
+        {'text': 'Westley "the Dread Pirate Roberts" \\ </b> ¡Olé! 🗡\n'})
+
+  def test_unsupported_values_use_json(self) -> None:
+    self.assertAllIdentical({'guilder': 2 ** 70})
+
+  def test_nan_is_rejected(self) -> None:
+    for name in backends.BACKENDS.keys() - {'orjson'}:
+      with self.subTest(backend=name):
+        with self.assertRaises(ValueError):
+          backends.dumps({'red': float('nan')}, name)
+
+  def test_render_json(self) -> None:
+    message = Message(text='As you wish', cards_v2=[])
+    buffer = bytearray()
+
+    written = message.write_json(buffer, backend='auto')
+
+    self.assertEqual(b'{"text":"As you wish"}', message.render_json('auto'))
+    self.assertEqual(b'{"text":"As you wish"}', buffer)
+    self.assertEqual(len(buffer), written)
+
+  def test_default_backend(self) -> None:
+    self.assertIs(backends.get_backend(), backends.get_backend('auto'))
+    self.assertEqual('orjson' if 'orjson' in backends.BACKENDS else
+                     'ujson' if 'ujson' in backends.BACKENDS else 'json',
+                     backends.get_backend().name)
+
+  def test_backend_instance(self) -> None:
+    backend = backends.JsonBackend()
+
+    self.assertIs(backend, backends.get_backend(backend))
+
+  def test_unknown_backend(self) -> None:
+    with self.assertRaises(ValueError):
+      backends.get_backend('simplejson')
+
+
+@unittest.skipUnless('orjson' in backends.BACKENDS, 'orjson is not installed')
+class OrjsonBackendTest(unittest.TestCase):
+  def test_exponent_floats(self) -> None:
+    self.assertEqual(b'[1e-07,1e+16,"1e-7"]',
+                     backends.dumps([1e-7, 1e16, '1e-7'], 'orjson'))
+
+  def test_nan_is_null(self) -> None:
+    self.assertEqual(b'{"red":null}',
+                     backends.dumps({'red': float('nan')}, 'orjson'))
+
+
+@unittest.skipUnless('ujson' in backends.BACKENDS, 'ujson is not installed')
+class UjsonBackendTest(unittest.TestCase):
+  def test_exponent_floats(self) -> None:
+    self.assertEqual(b'[1e-07,"1e-7"]',
+                     backends.dumps([1e-7, '1e-7'], 'ujson'))
+
+  def test_text(self) -> None:
+    self.assertEqual('{"text":"https://imdb/¡Olé!"}'.encode('utf-8'),
+                     backends.dumps({'text': 'https://imdb/¡Olé!'}, 'ujson'))
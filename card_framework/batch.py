@@ -0,0 +1,85 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rendering many objects in one go.
+
+`render_many` renders an iterable of `Message`s, `Card`s, `ActionResponse`s
+(or any other `Renderable`s), working out how to render each class once for
+the whole batch rather than once per object. The compiled plans and writers
+behind it are shared by everything, so a batch gets the benefit of whatever
+has been rendered before it, and vice versa.
+"""
+from __future__ import annotations
+
+import functools
+import operator
+from typing import Any, Callable, Dict, Iterable, Iterator, Mapping, Union
+
+from card_framework import backends, serializer
+
+
+def render_many(
+    objects: Iterable[Any], as_json: bool = False,
+    backend: Union[str, backends.JsonBackend, None] = None
+) -> Iterator[Union[Mapping[str, Any], bytes]]:
+  """Renders each of a number of objects.
+
+  Args:
+      objects (Iterable[Any]): the objects to render; this can be a generator,
+        and is only consumed as the results are
+      as_json (bool, optional): yield `render_json()` rather than `render()`.
+        Defaults to False.
+      backend (Union[str, backends.JsonBackend, None], optional): yield the
+        JSON from this backend, as `render_json(backend=...)` would (implies
+        `as_json`). Defaults to None.
+
+  Yields:
+      Union[Mapping[str, Any], bytes]: the rendered objects, in order
+  """
+  if backend:
+    make = functools.partial(_json_renderer,
+                             dumps=backends.get_backend(backend).dumps)
+  elif as_json:
+    make = _writer
+  else:
+    make = operator.attrgetter('render')
+
+  renderers: Dict[type, Callable[[Any], Any]] = {}
+  for obj in objects:
+    try:
+      render = renderers[type(obj)]
+    except KeyError:
+      render = renderers[type(obj)] = make(type(obj))
+    yield render(obj)
+
+
+def _json_renderer(cls: type,
+                   dumps: Callable[[Any], bytes]) -> Callable[[Any], bytes]:
+  render = cls.render
+  return lambda obj: dumps(render(obj))
+
+
+def _writer(cls: type) -> Callable[[Any], bytes]:
+  from card_framework import Renderable
+
+  if cls.render is not Renderable.render:
+    return serializer.render_json
+
+  write = serializer.render_writer(cls)
+
+  def render_json(obj: Any) -> bytes:
+    out = serializer.Output()
+    write(obj, out)
+    return ''.join(out).encode('utf-8')
+
+  return render_json
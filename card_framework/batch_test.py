@@ -0,0 +1,74 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import json
+import unittest
+from typing import List
+
+from card_framework import Renderable, backends, render_many
+from card_framework.serializer_test import _message
+from card_framework.v2.action_response import ActionResponse
+from card_framework.v2.card import Card
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import SelectionItem
+
+
+def _batch() -> List[Renderable]:
+  pushed = Card(sections=[Section(header='Florin')])
+  pushed.__TAG_OVERRIDE__ = 'pushCard'
+  return [
+      _message(),
+      Message(text='Inconceivable!'),
+      Message(),
+      Card(sections=[Section(header='Guilder')]),
+      pushed,
+      _message().cards_v2[0],
+      ActionResponse(type=ActionResponse.ResponseType.NEW_MESSAGE,
+                     url='https://www.imdb.com/title/tt0093779/'),
+      SelectionInput(name='hand', items=[SelectionItem(text='left')]),
+      _message(),
+  ]
+
+
+class RenderManyTest(unittest.TestCase):
+  def test_render(self) -> None:
+    self.assertEqual([o.render() for o in _batch()],
+                     list(render_many(_batch())))
+
+  def test_render_json(self) -> None:
+    self.assertEqual([json.dumps(o.render()).encode('utf-8') for o in _batch()],
+                     list(render_many(_batch(), as_json=True)))
+
+  def test_backend(self) -> None:
+    for name in backends.BACKENDS:
+      with self.subTest(backend=name):
+        self.assertEqual([o.render_json(backend=name) for o in _batch()],
+                         list(render_many(_batch(), backend=name)))
+
+  def test_is_lazy(self) -> None:
+    def messages():
+      yield Message(text='As you wish')
+      raise RuntimeError('Never went in against a Sicilian')
+
+    rendered = render_many(messages())
+
+    self.assertEqual({'text': 'As you wish'}, next(rendered))
+    with self.assertRaises(RuntimeError):
+      next(rendered)
+
+  def test_empty(self) -> None:
+    self.assertEqual([], list(render_many([], as_json=True)))
@@ -0,0 +1,253 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A shared render cache, keyed by what is rendered.
+
+Many responses (help cards, error dialogs, settings forms) are built afresh
+for every request but come out the same every time. A `RenderCache` keeps
+their renders, keyed by their `fingerprint`, so that any widget tree which
+renders the same as one seen before gets the same render back:
+```
+CACHE = cache.RenderCache(max_entries=500, max_bytes=8 << 20, ttl=600)
+...
+return CACHE.render_json(help_card(user))
+```
+
+Working out the fingerprint of a frozen tree (see `card_framework.frozen`)
+only hashes the canonical JSON it keeps, so a lookup costs little more than
+that. Any other tree has its JSON written to be fingerprinted, so a cached
+`render_json` of it is no quicker than an uncached one, and a cached `render`
+only saves building the dictionaries. A caller which knows what a tree will
+render can pass its own `key` instead, which is looked up as it is:
+```
+return CACHE.render_json(settings_card(user), key=('settings', user.locale))
+```
+Two trees looked up with the same key get the same render, whatever they
+contain.
+
+The JSON is kept as the entry, and `render_json` returns it as it is.
+`render` builds the dictionary only on the first request for each entry, and
+returns it read-only: mappings are `ReadOnlyDict`s and lists are
+`ReadOnlyList`s, which compare equal to (and are encoded by `json.dumps` as)
+ordinary ones, so that no caller can change what the others get.
+
+The cache is bounded by the number of entries and, optionally, the total
+length of their JSON (not counting the keys, or the dictionaries `render`
+builds), evicting the least recently used first, and entries can expire
+after `ttl` seconds. It is thread safe: only the bookkeeping is
+done under a lock, so renders of different trees don't wait for each other.
+A `CardWithId` without a `card_id` is given a new one, so is never found in
+the cache, unless it uses the `card_ids.content_id` strategy.
+"""
+from __future__ import annotations
+
+import collections
+import hashlib
+import threading
+import time
+from collections.abc import Hashable, Mapping
+from typing import Any, Callable, NamedTuple, Optional
+
+from card_framework import fingerprint
+
+
+class CacheStats(NamedTuple):
+  """How a `RenderCache` has been doing.
+
+  Attributes:
+      hits (int): lookups that found an entry
+      misses (int): lookups that didn't, and rendered the tree
+      evictions (int): entries dropped to stay within the bounds, or because
+        they had expired
+      entries (int): the number of entries
+      size (int): the total length of their JSON, in bytes
+  """
+  hits: int
+  misses: int
+  evictions: int
+  entries: int
+  size: int
+
+
+def _refuse(self: Any, *args: Any, **kwargs: Any) -> None:
+  raise TypeError('cached renders are read-only')
+
+
+class ReadOnlyDict(dict):
+  """A `dict` which can't be changed once it has been built."""
+  __slots__ = ()
+
+  __setitem__ = __delitem__ = __ior__ = _refuse
+  clear = pop = popitem = setdefault = update = _refuse
+
+  def __copy__(self) -> dict:
+    return dict(self)
+
+  def __reduce__(self) -> Any:
+    return (ReadOnlyDict, (dict(self),))
+
+
+class ReadOnlyList(list):
+  """A `list` which can't be changed once it has been built."""
+  __slots__ = ()
+
+  __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+  append = clear = extend = insert = pop = remove = reverse = sort = _refuse
+
+  def __copy__(self) -> list:
+    return list(self)
+
+  def __reduce__(self) -> Any:
+    return (ReadOnlyList, (list(self),))
+
+
+class _Entry(object):
+  __slots__ = ('json', 'render', 'expires')
+
+  def __init__(self, json: bytes, expires: Optional[float]) -> None:
+    self.json = json
+    self.render: Optional[Mapping[str, Any]] = None
+    self.expires = expires
+
+
+class RenderCache(object):
+  """A bounded, thread safe cache of renders, keyed by their content.
+
+  Args:
+      max_entries (int, optional): the most renders to keep. Defaults to 1000.
+      max_bytes (Optional[int], optional): the most bytes of JSON to keep,
+        which is all that is counted. Defaults to None, for no limit.
+      ttl (Optional[float], optional): how many seconds an entry is kept.
+        Defaults to None, for as long as it is used.
+      clock (Callable[[], float], optional): the time, in seconds. Defaults
+        to `time.monotonic`.
+  """
+
+  def __init__(self, max_entries: int = 1000, max_bytes: Optional[int] = None,
+               ttl: Optional[float] = None,
+               clock: Callable[[], float] = time.monotonic) -> None:
+    self.max_entries = max_entries
+    self.max_bytes = max_bytes
+    self.ttl = ttl
+    self._clock = clock
+    self._entries: collections.OrderedDict[Hashable, _Entry] = (
+        collections.OrderedDict())
+    self._lock = threading.Lock()
+    self._size = 0
+    self._hits = 0
+    self._misses = 0
+    self._evictions = 0
+
+  def render(self, obj: Any,
+             key: Optional[Hashable] = None) -> Mapping[str, Any]:
+    """Returns `obj.render()`, from the cache if it can.
+
+    Args:
+        obj (Any): the `Renderable` (or other dataclass) to render
+        key (Optional[Hashable], optional): what to look it up by. Defaults to
+          None, for the fingerprint of `obj`.
+
+    Returns:
+        Mapping[str, Any]: the render, which is read-only
+    """
+    entry = self._entry(obj, key)
+    if (render := entry.render) is None:
+      # Two threads may both build it; either one will do.
+      render = entry.render = _read_only(_render(obj))
+    return render
+
+  def render_json(self, obj: Any, key: Optional[Hashable] = None) -> bytes:
+    """Returns `obj.render_json()`, from the cache if it can.
+
+    Args:
+        obj (Any): the `Renderable` (or other dataclass) to render
+        key (Optional[Hashable], optional): what to look it up by. Defaults to
+          None, for the fingerprint of `obj`.
+
+    Returns:
+        bytes: the JSON
+    """
+    return self._entry(obj, key).json
+
+  @property
+  def stats(self) -> CacheStats:
+    """The hit, miss and eviction counts and the cache's current size."""
+    with self._lock:
+      return CacheStats(self._hits, self._misses, self._evictions,
+                        len(self._entries), self._size)
+
+  def clear(self) -> None:
+    """Drops every entry (without counting them as evictions)."""
+    with self._lock:
+      self._entries.clear()
+      self._size = 0
+
+  def _entry(self, obj: Any, key: Optional[Hashable]) -> _Entry:
+    data = None
+    if key is None:
+      data = fingerprint.canonical_json(obj)
+      key = hashlib.blake2b(data, digest_size=fingerprint.DIGEST_SIZE).digest()
+
+    now = self._clock()
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is not None and entry.expires is not None and (
+              entry.expires <= now):
+        self._remove(key)
+        entry = None
+
+      if entry is not None:
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    if data is None:
+      # Written outside the lock, so as not to hold up other lookups.
+      data = fingerprint.canonical_json(obj)
+    with self._lock:
+      if (entry := self._entries.get(key)) is not None:
+        # Another thread has just added it.
+        self._hits += 1
+        return entry
+
+      self._misses += 1
+      entry = _Entry(data, None if self.ttl is None else now + self.ttl)
+      if self.max_bytes is not None and len(data) > self.max_bytes:
+        # Too big to keep at all.
+        return entry
+
+      self._entries[key] = entry
+      self._size += len(data)
+      while len(self._entries) > self.max_entries or (
+              self.max_bytes is not None and self._size > self.max_bytes):
+        self._remove(next(iter(self._entries)))
+      return entry
+
+  def _remove(self, key: Hashable) -> None:
+    self._size -= len(self._entries.pop(key).json)
+    self._evictions += 1
+
+
+def _render(obj: Any) -> Any:
+  if callable(getattr(obj, 'render', None)):
+    return obj.render()
+  from card_framework import compiler
+  return compiler.to_dict(obj)
+
+
+def _read_only(value: Any) -> Any:
+  if isinstance(value, Mapping):
+    return ReadOnlyDict((k, _read_only(v)) for k, v in value.items())
+  if isinstance(value, (list, tuple)):
+    return ReadOnlyList(_read_only(v) for v in value)
+  return value
@@ -0,0 +1,184 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+from card_framework import cache, fingerprint
+from card_framework.frozen_test import _card
+from card_framework.v2.message import Message
+
+
+class _Clock(object):
+  def __init__(self) -> None:
+    self.now = 0.0
+
+  def __call__(self) -> float:
+    return self.now
+
+
+def _message(text: str = 'Inconceivable!') -> Message:
+  return Message(text=text, cards_v2=[_card()]).freeze()
+
+
+class RenderCacheTest(unittest.TestCase):
+  def test_render(self) -> None:
+    render_cache = cache.RenderCache()
+    message = _message()
+
+    self.assertEqual(message.render(), render_cache.render(message))
+    self.assertEqual(message.render_json(), render_cache.render_json(message))
+    self.assertEqual(json.dumps(message.render()),
+                     json.dumps(render_cache.render(message)))
+
+  def test_keyed_by_content(self) -> None:
+    render_cache = cache.RenderCache()
+    first = render_cache.render(_message())
+
+    self.assertIs(first, render_cache.render(_message()))
+    self.assertIsNot(first, render_cache.render(_message('As you wish')))
+    self.assertIs(render_cache.render_json(_message()),
+                  render_cache.render_json(_message()))
+    self.assertEqual((3, 2, 0, 2), render_cache.stats[:4])
+
+  def test_keyed_by_caller(self) -> None:
+    render_cache = cache.RenderCache()
+    message = Message(text='Westley', cards_v2=[_card()])
+
+    self.assertEqual(message.render_json(),
+                     render_cache.render_json(message, key='farm boy'))
+    message.text = 'Dread Pirate Roberts'
+    self.assertEqual(b'{"text": "Westley"',
+                     render_cache.render_json(message, key='farm boy')[:18])
+    self.assertEqual(message.render(),
+                     render_cache.render(message, key='pirate'))
+    self.assertEqual((1, 2, 0, 2), render_cache.stats[:4])
+
+  def test_mutable_trees(self) -> None:
+    render_cache = cache.RenderCache()
+    message = Message(text='Westley', cards_v2=[_card()])
+    first = render_cache.render(message)
+
+    self.assertIs(first, render_cache.render(_message('Westley')))
+    message.text = 'Dread Pirate Roberts'
+    self.assertEqual(message.render(), render_cache.render(message))
+    self.assertEqual((1, 2, 0, 2), render_cache.stats[:4])
+
+  def test_hits_are_not_written(self) -> None:
+    render_cache = cache.RenderCache()
+    render_cache.render_json(_message())
+    render_cache.render_json(Message(text='Inigo'), key='inigo')
+
+    message = _message()
+    render_cache.render_json(message)
+    with mock.patch.object(fingerprint, '_Canonical') as canonical:
+      render_cache.render_json(message)
+      render_cache.render(message)
+      render_cache.render_json(Message(text='Inigo'), key='inigo')
+    canonical.assert_not_called()
+
+  def test_read_only(self) -> None:
+    render = cache.RenderCache().render(_message())
+
+    with self.assertRaises(TypeError):
+      render['text'] = 'As you wish'
+    with self.assertRaises(TypeError):
+      render['cardsV2'][0]['card'].update(header=None)
+    with self.assertRaises(TypeError):
+      render['cardsV2'][0]['card']['sections'].append({})
+    with self.assertRaises(TypeError):
+      render['cardsV2'] += []
+
+  def test_copies_can_be_changed(self) -> None:
+    render = cache.RenderCache().render(_message())
+    copied = copy.copy(render)
+    copied['text'] = 'As you wish'
+
+    self.assertEqual('Inconceivable!', render['text'])
+    self.assertEqual(render, pickle.loads(pickle.dumps(render)))
+
+  def test_max_entries(self) -> None:
+    render_cache = cache.RenderCache(max_entries=2)
+    render_cache.render(_message('Westley'))
+    render_cache.render(_message('Buttercup'))
+    render_cache.render(_message('Westley'))
+    render_cache.render(_message('Humperdinck'))
+
+    self.assertEqual((1, 3, 1, 2), render_cache.stats[:4])
+    # Buttercup was the least recently used.
+    render_cache.render(_message('Westley'))
+    render_cache.render(_message('Buttercup'))
+    self.assertEqual((2, 4, 2, 2), render_cache.stats[:4])
+
+  def test_max_bytes(self) -> None:
+    size = len(_message('Westley').render_json())
+    render_cache = cache.RenderCache(max_bytes=2 * size + 1)
+    for text in ['Westley', 'Vizzini', 'Inigo']:
+      render_cache.render_json(_message(text))
+
+    self.assertEqual(2, render_cache.stats.entries)
+    self.assertLessEqual(render_cache.stats.size, 2 * size + 1)
+
+  def test_too_big(self) -> None:
+    render_cache = cache.RenderCache(max_bytes=10)
+
+    self.assertEqual(_message().render_json(),
+                     render_cache.render_json(_message()))
+    self.assertEqual((0, 1, 0, 0, 0), render_cache.stats)
+
+  def test_ttl(self) -> None:
+    clock = _Clock()
+    render_cache = cache.RenderCache(ttl=60, clock=clock)
+    first = render_cache.render(_message())
+    clock.now = 59
+
+    self.assertIs(first, render_cache.render(_message()))
+    clock.now = 60
+    self.assertIsNot(first, render_cache.render(_message()))
+    self.assertEqual((1, 2, 1, 1), render_cache.stats[:4])
+
+  def test_clear(self) -> None:
+    render_cache = cache.RenderCache()
+    render_cache.render(_message())
+    render_cache.clear()
+
+    self.assertEqual((0, 1, 0, 0, 0), render_cache.stats)
+
+  def test_threads(self) -> None:
+    render_cache = cache.RenderCache(max_entries=3)
+    texts = ['Westley', 'Buttercup', 'Inigo', 'Fezzik', 'Vizzini']
+    expected = {text: _message(text).render_json() for text in texts}
+    failures = []
+
+    def run(offset: int) -> None:
+      for i in range(50):
+        text = texts[(i + offset) % len(texts)]
+        if render_cache.render_json(_message(text)) != expected[text]:
+          failures.append(text)
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    stats = render_cache.stats
+    self.assertEqual([], failures)
+    self.assertEqual(400, stats.hits + stats.misses)
+    self.assertEqual(stats.misses - stats.entries, stats.evictions)
@@ -0,0 +1,713 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A native replacement for the parts of `dataclasses_json` the framework uses.
+
+`dataclass_json`, `DataClassJsonMixin`, `config` and `LetterCase` behave like
+their `dataclasses_json` namesakes, and field configuration is stored under
+the same `'dataclasses_json'` metadata key, so classes and fields defined
+either way can be mixed freely. `to_dict` is the compiled render plan,
+`from_dict` follows `dataclasses_json`'s decoding rules (with a decoder
+generated once per class, much as a render plan is) and neither imports
+`dataclasses_json` or `marshmallow`. Only `schema()`, which is a marshmallow
+schema by definition, and the `undefined` parameter handling need
+`dataclasses_json` to be installed, and it is imported when they are used.
+"""
+from __future__ import annotations
+
+import abc
+import dataclasses
+import enum
+import functools
+import json
+import re
+import sys
+import typing
+from collections import abc as collections_abc
+from collections.abc import Collection, Mapping
+from typing import (Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar,
+                    Union)
+
+from card_framework import compiler
+
+A = TypeVar('A', bound='DataClassJsonMixin')
+Json = Union[dict, list, str, int, float, bool, None]
+
+# What to build for an abstract collection type.
+_CONCRETE = {
+    collections_abc.Collection: list,
+    collections_abc.Sequence: list,
+    collections_abc.MutableSequence: list,
+    collections_abc.Set: set,
+    collections_abc.MutableSet: set,
+    collections_abc.Mapping: dict,
+    collections_abc.MutableMapping: dict,
+}
+_HINTS: Dict[type, Dict[str, Any]] = {}
+
+Decoder = Callable[[Any, bool], Any]
+Converter = Callable[[Any, bool], Any]
+_DECODERS: Dict[type, Decoder] = {}
+
+
+# The letter case conversions are `dataclasses_json`'s own, which differ from
+# the `stringcase` package's in their handling of punctuation.
+def camelcase(string: str) -> str:
+  string = re.sub(r'^[\-_\.]', '', str(string))
+  if not string:
+    return string
+  return string[0].lower() + re.sub(r'[\-_\.\s]([a-z])',
+                                    lambda match: match.group(1).upper(),
+                                    string[1:])
+
+
+def snakecase(string: str) -> str:
+  string = re.sub(r'[\-\.\s]', '_', str(string))
+  if not string:
+    return string
+  return string[0].lower() + re.sub(r'[A-Z]',
+                                    lambda match: '_' + match.group(0).lower(),
+                                    string[1:])
+
+
+def spinalcase(string: str) -> str:
+  return snakecase(string).replace('_', '-')
+
+
+def pascalcase(string: str) -> str:
+  string = camelcase(string)
+  return string[:1].upper() + string[1:]
+
+
+class LetterCase(object):
+  """The letter case conversions, as `dataclasses_json.LetterCase`."""
+  CAMEL = camelcase
+  KEBAB = spinalcase
+  SNAKE = snakecase
+  PASCAL = pascalcase
+
+
+def config(metadata: Optional[dict] = None, *,
+           encoder: Optional[Callable] = None,
+           decoder: Optional[Callable] = None,
+           mm_field: Any = None,
+           letter_case: Optional[Callable[[str], str]] = None,
+           undefined: Any = None,
+           field_name: Optional[str] = None,
+           exclude: Optional[Callable[[Any], bool]] = None) -> Dict[str, dict]:
+  """Builds field metadata, as `dataclasses_json.config`.
+
+  Args:
+      metadata (Optional[dict], optional): metadata to add to. Defaults to
+        None.
+      encoder (Optional[Callable], optional): encodes the field's value.
+        Defaults to None.
+      decoder (Optional[Callable], optional): decodes the field's value.
+        Defaults to None.
+      mm_field (Any, optional): the marshmallow field for `schema()`.
+        Defaults to None.
+      letter_case (Optional[Callable[[str], str]], optional): converts the
+        field's name to its key. Defaults to None.
+      undefined (Any, optional): what to do with unknown keys; see
+        `dataclasses_json.Undefined`. Defaults to None.
+      field_name (Optional[str], optional): the field's key, before any
+        `letter_case` is applied. Defaults to None.
+      exclude (Optional[Callable[[Any], bool]], optional): whether to leave a
+        value out. Defaults to None.
+
+  Returns:
+      Dict[str, dict]: the metadata, with the configuration under
+        'dataclasses_json'
+  """
+  if metadata is None:
+    metadata = {}
+
+  lib_metadata = metadata.setdefault('dataclasses_json', {})
+
+  if field_name is not None:
+    letter_case = _field_name_case(field_name, letter_case)
+
+  for key, value in [('encoder', encoder), ('decoder', decoder),
+                     ('mm_field', mm_field), ('letter_case', letter_case)]:
+    if value is not None:
+      lib_metadata[key] = value
+
+  if undefined is not None:
+    # Only `dataclasses_json` knows what to do with it.
+    from dataclasses_json import cfg
+    lib_metadata.update(cfg.config(undefined=undefined)['dataclasses_json'])
+
+  if exclude is not None:
+    lib_metadata['exclude'] = exclude
+
+  return metadata
+
+
+def _field_name_case(
+    field_name: str,
+    letter_case: Optional[Callable[[str], str]]) -> Callable[[str], str]:
+  """The `letter_case` which gives a field the key `field_name`, with the
+  field's own `letter_case`, if any, applied to it."""
+  if letter_case is not None:
+    @functools.wraps(letter_case)
+    def override(_, _letter_case=letter_case, _field_name=field_name):
+      return _letter_case(_field_name)
+  else:
+    def override(_, _field_name=field_name):
+      return _field_name
+  return override
+
+
+def _loaded(module: str, name: str) -> type:
+  """Returns a class from a module if the module has been imported.
+
+  Nothing can be a datetime, say, unless `datetime` has been imported, so
+  there's no need to import it (or `decimal` or `uuid`) up front.
+  """
+  return getattr(sys.modules.get(module), name, _Never)
+
+
+class _Never(object):
+  """A class nothing is an instance or subclass of."""
+
+
+class _ExtendedEncoder(json.JSONEncoder):
+  """Encodes what `dataclasses_json` can, as well as plain JSON."""
+
+  def default(self, o: Any) -> Json:
+    if isinstance(o, Mapping):
+      return dict(o)
+    if isinstance(o, Collection) and not isinstance(o, (str, bytes)):
+      return list(o)
+    if isinstance(o, _loaded('datetime', 'datetime')):
+      return o.timestamp()
+    if isinstance(o, _loaded('uuid', 'UUID')):
+      return str(o)
+    if isinstance(o, enum.Enum):
+      return o.value
+    if isinstance(o, _loaded('decimal', 'Decimal')):
+      return str(o)
+    return super().default(o)
+
+
+def _encode_json_types(value: Any,
+                       default: Callable = _ExtendedEncoder().default) -> Json:
+  if isinstance(value, dict):
+    return {k: _encode_json_types(v) for k, v in value.items()}
+  if isinstance(value, list):
+    return [_encode_json_types(v) for v in value]
+  if isinstance(value, typing.get_args(Json)):
+    return value
+  return _encode_json_types(default(value))
+
+
+class DataClassJsonMixin(abc.ABC):
+  """The `dataclasses_json.DataClassJsonMixin` methods, without the library.
+
+  Dataclasses can inherit from this or be decorated with `dataclass_json`.
+  """
+  __slots__ = ()
+
+  def to_dict(self, encode_json: bool = False) -> Dict[str, Json]:
+    """Converts the dataclass to a dictionary.
+
+    Args:
+        encode_json (bool, optional): also convert values which aren't JSON
+          types (enums, datetimes...) as `to_json` would. Defaults to False.
+
+    Returns:
+        Dict[str, Json]: the dictionary
+    """
+    value = compiler.plan(type(self))(self)
+    return _encode_json_types(value) if encode_json else value
+
+  def to_json(self, **kwargs) -> str:
+    """Converts the dataclass to JSON.
+
+    Args:
+        **kwargs (Any): passed on to `json.dumps`
+
+    Returns:
+        str: the JSON
+    """
+    return json.dumps(self.to_dict(encode_json=False), cls=_ExtendedEncoder,
+                      **kwargs)
+
+  @classmethod
+  def from_dict(cls: Type[A], kvs: Json, *, infer_missing: bool = False) -> A:
+    """Builds a dataclass from a dictionary.
+
+    Args:
+        kvs (Json): the dictionary, such as the output of `to_dict` or a
+          decoded Chat event
+        infer_missing (bool, optional): treat missing fields without defaults
+          as `None` rather than failing. Defaults to False.
+
+    Returns:
+        A: the dataclass
+    """
+    return decode(cls, kvs, infer_missing)
+
+  @classmethod
+  def from_json(cls: Type[A], s: Union[str, bytes], *,
+                infer_missing: bool = False, **kwargs) -> A:
+    """Builds a dataclass from JSON.
+
+    Args:
+        s (Union[str, bytes]): the JSON
+        infer_missing (bool, optional): see `from_dict`. Defaults to False.
+        **kwargs (Any): passed on to `json.loads`
+
+    Returns:
+        A: the dataclass
+    """
+    return cls.from_dict(json.loads(s, **kwargs), infer_missing=infer_missing)
+
+  @classmethod
+  def schema(cls, **kwargs) -> Any:
+    """Returns the `dataclasses_json` marshmallow schema for the class.
+
+    This needs `dataclasses_json` to be installed.
+
+    Args:
+        **kwargs (Any): passed on to `DataClassJsonMixin.schema`
+
+    Returns:
+        Any: the schema
+    """
+    import dataclasses_json
+    return dataclasses_json.DataClassJsonMixin.schema.__func__(cls, **kwargs)
+
+
+def dataclass_json(cls: Optional[type] = None, *,
+                   letter_case: Optional[Callable[[str], str]] = None,
+                   undefined: Any = None) -> Any:
+  """Adds the `DataClassJsonMixin` methods to a dataclass.
+
+  As with `dataclasses_json`, the mixin's methods replace any the class
+  defines itself. Classes using `undefined` are handed over to
+  `dataclasses_json`, which must then be installed.
+
+  Args:
+      cls (Optional[type], optional): the dataclass, when used without
+        arguments. Defaults to None.
+      letter_case (Optional[Callable[[str], str]], optional): the letter case
+        for every field. Defaults to None.
+      undefined (Any, optional): what to do with unknown keys. Defaults to
+        None.
+
+  Returns:
+      Any: the class, or the decorator when called with arguments
+  """
+  def wrap(cls: type) -> type:
+    if undefined is not None:
+      import dataclasses_json
+      return dataclasses_json.dataclass_json(cls, letter_case=letter_case,
+                                             undefined=undefined)
+
+    if letter_case is not None:
+      cls.dataclass_json_config = config(
+          letter_case=letter_case)['dataclasses_json']
+
+    cls.to_json = DataClassJsonMixin.to_json
+    cls.from_json = classmethod(DataClassJsonMixin.from_json.__func__)
+    cls.to_dict = DataClassJsonMixin.to_dict
+    cls.from_dict = classmethod(DataClassJsonMixin.from_dict.__func__)
+    cls.schema = classmethod(DataClassJsonMixin.schema.__func__)
+    DataClassJsonMixin.register(cls)
+    return cls
+
+  return wrap if cls is None else wrap(cls)
+
+
+def enum_mm_field(cls: Type[enum.Enum]) -> Any:
+  """Builds a marshmallow field which (de)serializes an enum by name.
+
+  This needs `marshmallow` to be installed.
+
+  Args:
+      cls (Type[enum.Enum]): the enum
+
+  Returns:
+      Any: the marshmallow field
+  """
+  from marshmallow import fields
+
+  class EnumField(fields.Field):
+    def _serialize(self, value, attr, obj, **kwargs):
+      return value.name
+
+    def _deserialize(self, value, attr, data, **kwargs):
+      return cls[value]
+
+  return EnumField()
+
+
+def type_hints(cls: type) -> Dict[str, Any]:
+  """The resolved type of each of a dataclass's fields, cached per class."""
+  try:
+    return _HINTS[cls]
+  except KeyError:
+    hints = _HINTS[cls] = typing.get_type_hints(cls)
+    return hints
+
+
+def decoders(cls: type) -> Dict[str, Dict[str, Any]]:
+  """`compiler.field_overrides`, plus any globally registered decoders."""
+  overrides = compiler.field_overrides(cls)
+  if library := sys.modules.get('dataclasses_json'):
+    global_decoders = library.cfg.global_config.decoders
+    for field in dataclasses.fields(cls):
+      if field.type in global_decoders:
+        overrides[field.name] = {'decoder': global_decoders[field.type],
+                                 **overrides[field.name]}
+  return overrides
+
+
+def decode(cls: type, kvs: Any, infer_missing: bool = False) -> Any:
+  """Decodes a dictionary into a dataclass, as `dataclasses_json` does.
+
+  Keys are matched to fields through each field's letter case (or the field
+  name itself), unknown keys are ignored and missing fields take their
+  defaults. Values are decoded according to the field's `decoder` or its
+  type: nested dataclasses, `Optional`s, collections, enums (by value, or by
+  name for `AutoNumber`s), datetimes (from timestamps), decimals and UUIDs.
+
+  The work is done by the class's compiled decoder; see `decoder`.
+
+  Args:
+      cls (type): the dataclass
+      kvs (Any): the dictionary
+      infer_missing (bool, optional): treat missing fields without defaults
+        as `None`. Defaults to False.
+
+  Returns:
+      Any: the dataclass
+  """
+  try:
+    return _DECODERS[cls](kvs, infer_missing)
+  except KeyError:
+    return decoder(cls)(kvs, infer_missing)
+
+
+def decoder(cls: type) -> Decoder:
+  """Returns the compiled decoder for a dataclass, compiling if needed.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Decoder: a function from a dictionary and `infer_missing` to an
+        instance of `cls`
+  """
+  try:
+    return _DECODERS[cls]
+  except KeyError:
+    compiled = _DECODERS[cls] = compile_decoder(cls)
+    return compiled
+
+
+def compile_decoder(cls: type) -> Decoder:
+  """Generates the decoder for a dataclass.
+
+  Each field's key (through its letter case), default and conversion are
+  worked out once, so decoding a dictionary is a lookup per field plus
+  whatever conversion the field's type needs: none at all for strings,
+  numbers and booleans, a table lookup for enums and the nested class's own
+  decoder for dataclasses.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Decoder: the decoder
+  """
+  overrides = decoders(cls)
+  namespace = {'_cls': cls, '_missing': dataclasses.MISSING}
+  lines = ['def decode(kvs, infer_missing):',
+           '  if isinstance(kvs, _cls): return kvs',
+           '  if kvs is None and infer_missing: kvs = {}',
+           '  get = kvs.get',
+           '  out = {}']
+
+  for (i, field) in enumerate(dataclasses.fields(cls)):
+    if not field.init:
+      continue
+
+    (body, value) = _field_code(cls, i, field, overrides[field.name],
+                                namespace)
+    lines.extend(f'  {line}' for line in body)
+    if _is_required(field):
+      # Left out for the constructor to report.
+      lines.append(f'  if v is not _missing: out[{field.name!r}] = {value}')
+    else:
+      lines.append(f'  out[{field.name!r}] = {value}')
+
+  lines.append('  return _cls(**out)')
+  exec('\n'.join(lines), namespace)
+  compiled = namespace['decode']
+  compiled.__qualname__ = f'decoder<{cls.__qualname__}>'
+  return compiled
+
+
+def compile_field_decoder(cls: type, name: str) -> Decoder:
+  """Generates a decoder for a single field of a dataclass.
+
+  This is the part of `compile_decoder` which decodes the one field.
+
+  Args:
+      cls (type): the dataclass
+      name (str): the field's name
+
+  Returns:
+      Decoder: a function from a dictionary and `infer_missing` to the
+        field's value, or `dataclasses.MISSING` if a field without a default
+        is missing
+  """
+  (i, field) = next((i, f) for (i, f) in enumerate(dataclasses.fields(cls))
+                    if f.name == name)
+  namespace = {'_missing': dataclasses.MISSING}
+  (body, value) = _field_code(cls, i, field, decoders(cls)[name], namespace)
+  lines = ['def decode(kvs, infer_missing):', '  get = kvs.get',
+           *(f'  {line}' for line in body)]
+  if _is_required(field):
+    lines.append(f'  return v if v is _missing else {value}')
+  else:
+    lines.append(f'  return {value}')
+
+  exec('\n'.join(lines), namespace)
+  compiled = namespace['decode']
+  compiled.__qualname__ = f'decoder<{cls.__qualname__}.{name}>'
+  return compiled
+
+
+def _is_required(field: dataclasses.Field) -> bool:
+  return (field.default is dataclasses.MISSING and
+          field.default_factory is dataclasses.MISSING)
+
+
+def _field_code(cls: type, i: int, field: dataclasses.Field,
+                override: Dict[str, Any],
+                namespace: Dict[str, Any]) -> Tuple[List[str], str]:
+  """Generates the code which decodes a field.
+
+  Returns:
+      Tuple[List[str], str]: the lines which look the field up (or take its
+        default) into `v`, and the expression which decodes `v`
+  """
+  name = field.name
+  letter_case = override.get('letter_case')
+  key = letter_case(name) if letter_case is not None else name
+  namespace[f'_key{i}'] = key
+  lines = [f'v = get(_key{i}, _missing)']
+  if key != name:
+    lines.append(f'if v is _missing: v = get({name!r}, _missing)')
+
+  if field.default is not dataclasses.MISSING:
+    namespace[f'_default{i}'] = field.default
+    lines.append(f'if v is _missing: v = _default{i}')
+  elif field.default_factory is not dataclasses.MISSING:
+    namespace[f'_factory{i}'] = field.default_factory
+    lines.append(f'if v is _missing: v = _factory{i}()')
+  else:
+    lines.append('if v is _missing and infer_missing: v = None')
+
+  field_type = type_hints(cls)[name]
+  while hasattr(field_type, '__supertype__'):
+    field_type = field_type.__supertype__
+
+  if (decode_field := override.get('decoder')) is not None:
+    namespace[f'_type{i}'] = field_type
+    namespace[f'_decoder{i}'] = decode_field
+    value = f'v if type(v) is _type{i} else _decoder{i}(v)'
+    if not _is_optional(field_type):
+      value = f'None if v is None else ({value})'
+  elif (convert := _converter(field_type)) is not None:
+    namespace[f'_convert{i}'] = convert
+    value = f'None if v is None else _convert{i}(v, infer_missing)'
+  else:
+    value = 'v'
+  return (lines, value)
+
+
+def _converter(field_type: Any) -> Optional[Converter]:
+  """Works out once per type what `decode_value` does with a value that
+  isn't `None`.
+
+  Returns:
+      Optional[Converter]: the conversion, or `None` if the value is used as
+        it is
+  """
+  if field_type is Any or field_type in compiler._ATOMIC:
+    return None
+
+  if dataclasses.is_dataclass(field_type):
+    return _dataclass_converter(field_type)
+
+  origin = typing.get_origin(field_type)
+  args = typing.get_args(field_type)
+  if origin is Union:
+    if len(args) == 2 and type(None) in args:
+      (arg,) = (a for a in args if a is not type(None))
+      return _converter(arg)
+    return None
+
+  if isinstance(field_type, type) and issubclass(field_type, enum.Enum):
+    return _enum_converter(field_type)
+
+  if origin is list and args:
+    return _list_converter(args[0])
+
+  return lambda value, infer_missing: decode_value(field_type, value,
+                                                   infer_missing)
+
+
+def _dataclass_converter(cls: type) -> Converter:
+  """Decodes a dataclass with its compiled decoder, leaving objects which are
+  already decoded as they are."""
+  def convert(value: Any, infer_missing: bool) -> Any:
+    if dataclasses.is_dataclass(value):
+      return value
+    if value is None:
+      # Only reached for an entry of a list, which `dataclasses_json` doesn't
+      # let be `None` either.
+      raise _none_entry(cls)
+    try:
+      return _DECODERS[cls](value, infer_missing)
+    except KeyError:
+      return decoder(cls)(value, infer_missing)
+  return convert
+
+
+def _list_converter(item_type: Any) -> Converter:
+  """Decodes each entry of a list. `None` entries are kept, except in a list
+  of dataclasses, as in `dataclasses_json`."""
+  item = _converter(item_type)
+  if item is None:
+    return lambda value, infer_missing: list(value)
+  if dataclasses.is_dataclass(item_type):
+    return lambda value, infer_missing: [item(v, infer_missing)
+                                         for v in value]
+  return lambda value, infer_missing: [
+      v if v is None else item(v, infer_missing) for v in value]
+
+
+def _none_entry(cls: type) -> TypeError:
+  return TypeError(f'A collection of {cls.__name__} can\'t hold None.')
+
+
+def _enum_converter(cls: Type[enum.Enum]) -> Converter:
+  """Decodes an enum through a table of its values (and its names, for an
+  `AutoNumber`, whose `_missing_` looks names up) instead of calling it."""
+  from card_framework import AutoNumber
+
+  table = {}
+  if issubclass(cls, AutoNumber):
+    table.update(cls.__members__)
+  for member in cls.__members__.values():
+    table[member] = member
+    try:
+      table[member.value] = member
+    except TypeError:
+      # An unhashable value, left to the enum.
+      pass
+
+  def convert(value: Any, infer_missing: bool) -> Any:
+    try:
+      return table[value]
+    except (KeyError, TypeError):
+      # Let the enum decide (or report the bad value).
+      return cls(value)
+
+  return convert
+
+
+def decode_value(field_type: Any, value: Any,
+                 infer_missing: bool = False) -> Any:
+  """Decodes a value according to its type, as `dataclasses_json` does.
+
+  Args:
+      field_type (Any): the type
+      value (Any): the value
+      infer_missing (bool, optional): see `decode`. Defaults to False.
+
+  Returns:
+      Any: the decoded value
+  """
+  if value is None:
+    return value
+
+  if dataclasses.is_dataclass(field_type):
+    return (value if dataclasses.is_dataclass(value)
+            else decode(field_type, value, infer_missing))
+
+  origin = typing.get_origin(field_type)
+  args = typing.get_args(field_type)
+  if origin is Union:
+    if len(args) == 2 and type(None) in args:
+      (arg,) = (a for a in args if a is not type(None))
+      return decode_value(arg, value, infer_missing)
+    # A union other than `Optional`: left as it is.
+    return value
+
+  if isinstance(field_type, type) and issubclass(field_type, enum.Enum):
+    return field_type(value)
+
+  cons = _CONCRETE.get(origin or field_type, origin or field_type)
+  is_collection = (isinstance(cons, type) and issubclass(cons, Collection)
+                   and not issubclass(cons, (str, bytes)))
+  if is_collection:
+    return _decode_collection(cons, args, value, infer_missing)
+
+  if isinstance(field_type, type):
+    return _decode_instance(field_type, value)
+
+  return value
+
+
+def _decode_collection(cons: type, args: Tuple[Any, ...], value: Any,
+                       infer_missing: bool) -> Any:
+  if issubclass(cons, Mapping):
+    (k_type, v_type) = args or (Any, Any)
+    return cons((decode_value(k_type, k, infer_missing),
+                 _decode_entry(v_type, v, infer_missing))
+                for k, v in value.items())
+  item_type = args[0] if args else Any
+  return cons(_decode_entry(item_type, v, infer_missing) for v in value)
+
+
+def _decode_entry(field_type: Any, value: Any, infer_missing: bool) -> Any:
+  if value is None and dataclasses.is_dataclass(field_type):
+    raise _none_entry(field_type)
+  return decode_value(field_type, value, infer_missing)
+
+
+def _decode_instance(field_type: type, value: Any) -> Any:
+  """Decodes a datetime (from a timestamp), `Decimal` or `UUID`; anything
+  else is left as it is."""
+  if issubclass(field_type, (datetime := _loaded('datetime', 'datetime'))):
+    if isinstance(value, datetime):
+      return value
+    tz = datetime.now(sys.modules['datetime'].timezone.utc).astimezone().tzinfo
+    return datetime.fromtimestamp(value, tz=tz)
+  if issubclass(field_type, (decimal := _loaded('decimal', 'Decimal'))):
+    return value if isinstance(value, decimal) else decimal(value)
+  if issubclass(field_type, (uuid := _loaded('uuid', 'UUID'))):
+    return value if isinstance(value, uuid) else uuid(value)
+  return value
+
+
+def _is_optional(field_type: Any) -> bool:
+  return (field_type is Any or
+          (typing.get_origin(field_type) is Union and
+           type(None) in typing.get_args(field_type)))
@@ -0,0 +1,221 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import dataclasses
+import json
+import subprocess
+import sys
+import unittest
+import warnings
+from typing import Dict, List, Optional
+
+import dataclasses_json
+from dataclasses_json import stringcase
+
+from card_framework import fixtures_test as fixtures
+from card_framework import (AutoNumber, codec, enum_field, list_field,
+                            standard_field)
+from card_framework.serializer_test import _message
+from card_framework.v2.message import Message
+from card_framework.v2.user import User
+from card_framework.v2.widgets.decorated_text import DecoratedText
+
+
+class Fencer(AutoNumber):
+  DREAD_PIRATE_ROBERTS = ()
+  INIGO_MONTOYA = ()
+
+
+@codec.dataclass_json
+@dataclasses.dataclass
+class Sword(object):
+  maker: str = standard_field()
+  six_fingers: bool = standard_field()
+
+
+@codec.dataclass_json
+@dataclasses.dataclass
+class Duel(object):
+  fencer: Fencer = enum_field()
+  swords: List[Sword] = list_field()
+  sword: Optional[Sword] = standard_field()
+  type_: str = standard_field(field_name='type')
+  scores: Dict[str, List[int]] = standard_field()
+  location: str = 'Cliffs of Insanity'
+
+  def to_dict(self, encode_json=False):
+    return 'never called'
+
+
+@codec.dataclass_json(letter_case=codec.LetterCase.CAMEL)
+@dataclasses.dataclass
+class Giant(object):
+  rhyme_count: int
+  is_fezzik: bool = True
+
+
+class LetterCaseTest(unittest.TestCase):
+  def test_same_as_dataclasses_json(self) -> None:
+    for name in ['six_fingers', '_cliffs', 'inigo.montoya', 'fire-swamp',
+                 'ROUS', 'iocane2_powder', 'westley man', '']:
+      with self.subTest(name=name):
+        self.assertEqual(stringcase.camelcase(name), codec.camelcase(name))
+        self.assertEqual(stringcase.snakecase(name), codec.snakecase(name))
+        self.assertEqual(stringcase.spinalcase(name), codec.spinalcase(name))
+        self.assertEqual(stringcase.pascalcase(name), codec.pascalcase(name))
+
+
+class ConfigTest(unittest.TestCase):
+  def test_field_name(self) -> None:
+    metadata = codec.config(field_name='type_name',
+                            letter_case=codec.LetterCase.CAMEL)
+
+    self.assertEqual('typeName',
+                     metadata['dataclasses_json']['letter_case']('type_'))
+
+  def test_same_as_dataclasses_json(self) -> None:
+    options = dict(encoder=str, decoder=int, mm_field='field',
+                   exclude=bool, undefined='exclude')
+
+    self.assertEqual(dataclasses_json.config(**options),
+                     codec.config(**options))
+
+
+class MixinTest(unittest.TestCase):
+  def test_mixin_methods_replace_the_class_methods(self) -> None:
+    self.assertIs(codec.DataClassJsonMixin.to_dict, Duel.to_dict)
+    self.assertIsInstance(Duel(), codec.DataClassJsonMixin)
+
+  def test_to_dict(self) -> None:
+    duel = Duel(fencer=Fencer.INIGO_MONTOYA, swords=[Sword(maker='Domingo')],
+                type_='rapier')
+
+    self.assertEqual(dataclasses_json.DataClassJsonMixin.to_dict(duel),
+                     duel.to_dict())
+
+  def test_to_json(self) -> None:
+    message = _message()
+
+    self.assertEqual(json.dumps(message.to_dict()), message.to_json())
+    self.assertEqual(dataclasses_json.DataClassJsonMixin.to_json(message),
+                     message.to_json())
+
+  def test_class_letter_case(self) -> None:
+    self.assertDictEqual({'rhymeCount': 3, 'isFezzik': True},
+                         Giant(rhyme_count=3).to_dict())
+
+  def test_schema_uses_dataclasses_json(self) -> None:
+    with warnings.catch_warnings():
+      # The annotations are strings, which marshmallow warns about.
+      warnings.simplefilter('ignore')
+      schema = Giant.schema()
+
+    self.assertEqual({'rhymeCount': 3, 'isFezzik': True},
+                     schema.dump(Giant(rhyme_count=3)))
+
+
+class DecodeTest(unittest.TestCase):
+  def test_round_trip(self) -> None:
+    duel = Duel(fencer=Fencer.INIGO_MONTOYA,
+                swords=[Sword(maker='Domingo', six_fingers=True)],
+                sword=Sword(maker='Count Rugen'), type_='rapier',
+                scores={'Westley': [1, 2]})
+
+    self.assertEqual(duel, Duel.from_json(json.dumps(duel.to_dict())))
+
+  def test_defaults_and_unknown_keys(self) -> None:
+    duel = Duel.from_dict({'type': 'rapier', 'rodents': 'of unusual size'})
+
+    self.assertEqual(Duel(type_='rapier'), duel)
+
+  def test_missing(self) -> None:
+    with self.assertRaises(TypeError):
+      Giant.from_dict({})
+    self.assertEqual(Giant(rhyme_count=None),
+                     Giant.from_dict({}, infer_missing=True))
+
+  def test_none_entries(self) -> None:
+    # As in `dataclasses_json`: only entries which aren't dataclasses can be
+    # `None`.
+    self.assertEqual({'Westley': [None]},
+                     Duel.from_dict({'scores': {'Westley': [None]}}).scores)
+    with self.assertRaises(TypeError):
+      Duel.from_dict({'swords': [{'maker': 'Domingo'}, None]})
+    with self.assertRaises(TypeError):
+      codec.decode_value(Dict[str, Sword], {'Inigo': None})
+
+  def test_enum_by_name(self) -> None:
+    user = User.from_dict({'name': 'users/1', 'type': 'BOT'})
+
+    self.assertIs(User.UserType.BOT, user.type)
+
+  def test_enum_by_value_and_member(self) -> None:
+    for value in [2, Fencer.INIGO_MONTOYA, 'INIGO_MONTOYA']:
+      with self.subTest(value):
+        self.assertIs(Fencer.INIGO_MONTOYA,
+                      Duel.from_dict({'fencer': value}).fencer)
+    with self.assertRaises(KeyError):
+      Duel.from_dict({'fencer': 'FEZZIK'})
+
+  def test_field_name_keys(self) -> None:
+    sword = Sword.from_dict({'maker': 'Domingo', 'six_fingers': True})
+
+    self.assertEqual(Sword(maker='Domingo', six_fingers=True), sword)
+
+  def test_decoder_is_cached(self) -> None:
+    decoder = codec.decoder(Duel)
+
+    self.assertIs(decoder, codec.decoder(Duel))
+    self.assertEqual(Duel(type_='rapier'), decoder({'type': 'rapier'}, False))
+
+  def test_widget(self) -> None:
+    text = DecoratedText(text='Vizzini', wrap_text=True)
+
+    self.assertEqual(text, DecoratedText.from_dict(text.to_dict()))
+
+  def test_same_as_dataclasses_json(self) -> None:
+    with warnings.catch_warnings():
+      # dataclasses_json warns about every missing field.
+      warnings.simplefilter('ignore')
+      expected = dataclasses_json.DataClassJsonMixin.from_dict.__func__(
+          Message, fixtures.event_message())
+
+    self.assertEqual(expected, Message.from_dict(fixtures.event_message()))
+
+  def test_without_dataclasses_json(self) -> None:
+    # Run in a fresh interpreter with the library (and marshmallow) blocked.
+    script = '\n'.join([
+        'import sys',
+        'for m in ["dataclasses_json", "marshmallow"]: sys.modules[m] = None',
+        'from card_framework import fixtures_test as fixtures',
+        'from card_framework.serializer_test import _message',
+        'from card_framework.v2.message import Message',
+        'print(len(_message().render_json()))',
+        'print(Message.from_dict(fixtures.event_message()).sender.display_name)',
+    ])
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True,
+                            text=True, check=True).stdout.split('\n')
+
+    self.assertEqual(str(len(_message().render_json())), output[0])
+    self.assertEqual('Inigo Montoya', output[1])
+
+
+class StringEnumTest(unittest.TestCase):
+  def test_marshmallow_field(self) -> None:
+    metadata = AutoNumber.__metadata__['dataclasses_json']
+
+    self.assertEqual('INIGO_MONTOYA',
+                     metadata['mm_field']._serialize(Fencer.INIGO_MONTOYA,
+                                                     None, None))
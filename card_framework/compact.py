@@ -0,0 +1,241 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compact, slotted copies of widgets.
+
+Every dataclass instance normally carries its own `__dict__` (made when
+anything first asks for it: `vars`, `copy`, `pickle`...), which for a small
+widget such as a `SelectionItem` or `ActionParameter` is larger than
+everything else in the object put together. `compact` makes a deep copy of a
+widget tree in which each class is swapped for a variant (with the same name,
+fields and methods, so it renders exactly the same) that keeps its fields in
+`__slots__` and has no `__dict__` at all. The compact classes form a slotted
+hierarchy of their own, alongside the original one: a compact object takes
+less memory than even a freshly built one, and little over half that of one
+which has been unpickled. It is meant for processes that keep many pre-built
+cards around.
+
+Compact classes are built from the original on first use and:
+  * report the original class as their `__class__`, so `isinstance` checks
+    against it (and the original methods' `super()` calls) still work,
+    although `type()` gives the compact class,
+  * still run any `__setattr__` validation (`OnClick`, `Icon`, `Color`...),
+  * have slots for the render cache and `validation.validate`'s mark, and
+  * work with the render cache, `freeze`, `copy`, `pickle` and `transfer`.
+
+Code which makes new objects from `obj.__class__`, such as
+`dataclasses.replace`, makes ordinary ones. There is no room for attributes
+other than the fields on a compact object, so an instance `__TAG_OVERRIDE__`
+(as opposed to one set on the class) can't be kept; `compact` raises a
+`TypeError` for objects which have one.
+
+Code that reads the attributes of an instance directly should use
+`attributes` and `set_attributes`, which work for both kinds of object.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import types
+from collections.abc import Mapping
+from typing import Any, Dict, Tuple, TypeVar
+
+from card_framework import codec, compiler, lazy, tracking, validation
+
+T = TypeVar('T')
+
+_CLASSES: Dict[type, type] = {}
+_ORIGINALS: Dict[type, type] = {}
+_SLOTS: Dict[type, Tuple[str, ...]] = {}
+
+# Class attributes which belong to the original class alone.
+_SKIPPED = frozenset(['__dict__', '__weakref__', '__slots__', '_abc_impl'])
+
+
+def compact_class(cls: type) -> type:
+  """Returns the compact variant of a dataclass, creating it if needed.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      type: the slotted copy of `cls`
+  """
+  if cls in _ORIGINALS:
+    return cls
+
+  try:
+    return _CLASSES[cls]
+  except KeyError:
+    pass
+
+  if getattr(cls, '__FROZEN__', False):
+    from card_framework import frozen
+    return frozen.frozen_class(compact_class(cls.__bases__[1]))
+
+  bases = tuple(compact_class(b) if dataclasses.is_dataclass(b) else b
+                for b in cls.__bases__)
+  fields = [f.name for f in dataclasses.fields(cls)]
+  inherited = {name for base in bases for name in _slot_names(base)}
+  slots = [name for name in fields if name not in inherited]
+  for name in (tracking.STATE, validation.VALIDATED):
+    if name not in inherited:
+      slots.append(name)
+  if not any(base.__weakrefoffset__ for base in bases):
+    # The render cache keeps weak references to its parents.
+    slots.append('__weakref__')
+
+  namespace = {name: value for (name, value) in cls.__dict__.items()
+               if name not in _SKIPPED and name not in fields}
+  namespace.update(__slots__=tuple(slots), __qualname__=cls.__qualname__,
+                   __class__=property(_original_class), __reduce__=_reduce)
+
+  compact = type(cls)(cls.__name__, bases, namespace)
+  if (issubclass(cls, codec.DataClassJsonMixin) and
+      not issubclass(compact, codec.DataClassJsonMixin)):
+    codec.DataClassJsonMixin.register(compact)
+
+  _ORIGINALS[compact] = cls
+  _CLASSES[cls] = compact
+  return compact
+
+
+def original(cls: type) -> type:
+  """Returns the class a compact class was made from.
+
+  Args:
+      cls (type): the class
+
+  Returns:
+      type: the original class (the frozen variant of it, for a frozen
+        compact class), or `cls` itself if it isn't compact
+  """
+  if getattr(cls, '__FROZEN__', False) and cls.__bases__[1] in _ORIGINALS:
+    from card_framework import frozen
+    return frozen.frozen_class(_ORIGINALS[cls.__bases__[1]])
+  return _ORIGINALS.get(cls, cls)
+
+
+def compact(value: T) -> T:
+  """Makes a deep, slotted copy of a widget (or anything in one).
+
+  Args:
+      value (T): the widget, card, section or value to copy
+
+  Raises:
+      TypeError: if a dataclass has attributes other than its fields
+
+  Returns:
+      T: the compact copy; values which aren't dataclasses or containers,
+        and objects which are already compact, are returned as they are
+  """
+  cls = type(value)
+  if cls in compiler._ATOMIC or isinstance(value, enum.Enum):
+    return value
+
+  if hasattr(cls, '__dataclass_fields__'):
+    if compact_class(cls) is cls:
+      return value
+
+    from card_framework import frozen
+    state = {k: compact(v) for (k, v) in attributes(value).items()
+             if k not in (tracking.STATE, frozen._HASH, frozen._JSON,
+                          validation.VALIDATED)}
+    if extra := state.keys() - cls.__dataclass_fields__.keys():
+      raise TypeError(f'{cls.__name__} has attributes other than its fields '
+                      f'({", ".join(sorted(extra))}), which a compact '
+                      'instance has no room for.')
+
+    if getattr(cls, '__FROZEN__', False):
+      return frozen._restore(cls.__bases__[1], state, slotted=True)
+    return _restore(cls, state)
+
+  if cls is list or cls is tuple:
+    # Copying the list again leaves no room for it to grow into.
+    return cls([compact(v) for v in value])
+
+  if cls is dict or cls is types.MappingProxyType:
+    return cls({k: compact(v) for (k, v) in value.items()})
+
+  return value
+
+
+def attributes(obj: Any) -> Mapping[str, Any]:
+  """Returns the instance attributes of an object, slotted or not.
+
+  Args:
+      obj (Any): the object
+
+  Returns:
+      Mapping[str, Any]: the attributes by name, which must not be modified
+        (it is the object's own `__dict__` if it has no slots)
+  """
+  names = _slot_names(type(obj))
+  if not names:
+    if lazy.SOURCE in obj.__dict__:
+      # A lazy object's fields aren't all there until decoded.
+      lazy.materialize(obj)
+    return obj.__dict__
+
+  found = dict(getattr(obj, '__dict__', {}))
+  for name in names:
+    try:
+      found[name] = getattr(obj, name)
+    except AttributeError:
+      # An empty slot.
+      pass
+  return found
+
+
+def set_attributes(obj: Any, state: Mapping[str, Any]) -> None:
+  """Sets instance attributes directly, without calling `__setattr__`.
+
+  Args:
+      obj (Any): the object, slotted or not
+      state (Mapping[str, Any]): the attributes to set, by name
+  """
+  if not _slot_names(type(obj)):
+    obj.__dict__.update(state)
+    return
+
+  for (name, value) in state.items():
+    object.__setattr__(obj, name, value)
+
+
+def _slot_names(cls: type) -> Tuple[str, ...]:
+  try:
+    return _SLOTS[cls]
+  except KeyError:
+    names = _SLOTS[cls] = tuple(
+        name for c in cls.__mro__ for name in c.__dict__.get('__slots__', ())
+        if name not in ('__dict__', '__weakref__'))
+    return names
+
+
+def _original_class(self: Any) -> type:
+  # `isinstance` and `super()` fall back on `__class__` when the object's
+  # type isn't a subclass, so both still work with the original class: the
+  # methods copied from it call `super()` as they are.
+  return original(type(self))
+
+
+def _reduce(self: Any) -> Any:
+  # Compact classes can't be pickled by name, so the original is sent.
+  state = {k: v for (k, v) in attributes(self).items() if k != tracking.STATE}
+  return (_restore, (original(type(self)), state))
+
+
+def _restore(cls: type, state: Mapping[str, Any]) -> Any:
+  obj = object.__new__(compact_class(cls))
+  set_attributes(obj, state)
+  return obj
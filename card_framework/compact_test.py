@@ -0,0 +1,202 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import sys
+import tracemalloc
+import unittest
+
+from card_framework import compact, frozen, template, tracking, transfer
+from card_framework.v2.card import Card, CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import HorizontalAlignment
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.action import Action, ActionParameter
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.color import Color
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import SelectionItem
+
+
+def _card() -> CardWithId:
+  text = DecoratedText(text='Inigo Montoya',
+                       start_icon=Icon(known_icon=Icon.KnownIcon.PERSON))
+  text.horizontal_alignment = HorizontalAlignment.CENTER
+  card = CardWithId(header=CardHeader(title='Princess Bride'), sections=[
+      Section(header='Florin', widgets=[
+          text,
+          ButtonList(buttons=[
+              Button(text='As you wish', color=Color(red=0.5),
+                     on_click=OnClick(action=Action(
+                         function='wish', parameters=[
+                             ActionParameter(key='six', value='fingers')]))),
+              Button(text='Inconceivable!', type_=Button.Type.OUTLINED)]),
+          SelectionInput(name='hand', items=[
+              SelectionItem(text='left', value='l'),
+              SelectionItem(text='right', value='r', selected=True)])])])
+  card.card_id = 'vizzini'
+  return card
+
+
+class CompactTest(unittest.TestCase):
+  def test_renders_the_same(self) -> None:
+    card = _card()
+    compact_card = card.compact()
+
+    self.assertEqual(json.dumps(card.render()),
+                     json.dumps(compact_card.render()))
+    self.assertEqual(card.render_json(), compact_card.render_json())
+
+  def test_is_deep_and_slotted(self) -> None:
+    card = compact.compact(_card())
+    button = card.sections[0].widgets[1].buttons[0]
+
+    for obj in [card, card.header, card.sections[0], button, button.color,
+                button.on_click.action.parameters[0]]:
+      with self.subTest(type(obj).__name__):
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertIs(type(obj), compact.compact_class(compact.original(
+            type(obj))))
+        self.assertIsInstance(obj, compact.original(type(obj)))
+    self.assertEqual('CardWithId', type(card).__name__)
+    self.assertIsInstance(card, CardWithId)
+    self.assertEqual('vizzini', card.card_id)
+
+  def test_smaller(self) -> None:
+    def allocated(cls: type) -> int:
+      tracemalloc.start()
+      items = [cls(text='Buttercup', value='b') for _ in range(1000)]
+      size = tracemalloc.get_traced_memory()[0]
+      tracemalloc.stop()
+      del items
+      return size
+
+    regular = allocated(SelectionItem)
+    slotted = allocated(compact.compact_class(SelectionItem))
+
+    self.assertLess(slotted, regular)
+    # Once it has a `__dict__`, as after a copy or unpickling.
+    item = SelectionItem(text='left')
+    self.assertLess(sys.getsizeof(compact.compact(item)),
+                    sys.getsizeof(item) + sys.getsizeof(vars(item)))
+
+  def test_classes_are_cached(self) -> None:
+    cls = compact.compact_class(Button)
+
+    self.assertIs(cls, compact.compact_class(Button))
+    self.assertIs(cls, compact.compact_class(cls))
+    self.assertIs(Button, compact.original(cls))
+    self.assertIs(Button, compact.original(Button))
+
+  def test_can_be_built_directly(self) -> None:
+    item = compact.compact_class(SelectionItem)(text='Buttercup', value='b')
+
+    self.assertEqual(SelectionItem(text='Buttercup', value='b').render(),
+                     item.render())
+
+  def test_validation_still_runs(self) -> None:
+    color = compact.compact(Color(red=0.5))
+    with self.assertRaises(ValueError):
+      color.red = 2
+
+    on_click = compact.compact(OnClick(open_link='https://pb'))
+    on_click.action = Action(function='wish')
+    self.assertIsNone(on_click.open_link)
+
+    icon = compact.compact(Icon(known_icon=Icon.KnownIcon.PERSON))
+    icon.icon_url = 'https://pb'
+    self.assertIsNone(icon.known_icon)
+    icon.icon_url = None
+    with self.assertRaises(ValueError):
+      icon.to_dict()
+
+  def test_render_cache(self) -> None:
+    card = compact.compact(_card())
+    type(card).__CACHE_RENDER__ = True
+    try:
+      first = card.render()
+      self.assertIs(first, card.render())
+
+      card.sections[0].widgets[0].text = 'Fezzik'
+      second = card.render()
+    finally:
+      type(card).__CACHE_RENDER__ = False
+
+    self.assertIsNot(first, second)
+    self.assertIn('Fezzik', json.dumps(second))
+    self.assertIsInstance(getattr(card, tracking.STATE), tracking.RenderState)
+
+  def test_freeze(self) -> None:
+    card = _card()
+    frozen_card = card.compact().freeze()
+
+    self.assertIsInstance(frozen_card, frozen.Frozen)
+    self.assertFalse(hasattr(frozen_card, '__dict__'))
+    self.assertIsInstance(frozen_card, CardWithId)
+    self.assertEqual(hash(frozen_card), hash(card.compact().freeze()))
+    self.assertEqual(frozen_card, compact.compact(card.freeze()))
+    self.assertEqual(card.render(), frozen_card.render())
+
+  def test_copy_and_pickle(self) -> None:
+    card = compact.compact(_card())
+    frozen_card = card.freeze()
+
+    for copied in [copy.copy(card), copy.deepcopy(card),
+                   pickle.loads(pickle.dumps(card))]:
+      self.assertIs(type(card), type(copied))
+      self.assertEqual(card, copied)
+    self.assertEqual(frozen_card,
+                     pickle.loads(pickle.dumps(frozen_card)))
+
+  def test_transfer_sends_the_original(self) -> None:
+    card = _card()
+
+    unpacked = transfer.unpack(pickle.loads(pickle.dumps(
+        transfer.pack(card.compact()))))
+
+    self.assertIs(CardWithId, type(unpacked))
+    self.assertEqual(card, unpacked)
+    self.assertEqual(card.freeze(),
+                     transfer.unpack(transfer.pack(card.compact().freeze())))
+
+  def test_template(self) -> None:
+    card = compact.compact(Card(sections=[Section(widgets=[
+        DecoratedText(text=template.Slot('name'))])]))
+
+    expected = Card(sections=[Section(widgets=[DecoratedText(text='Fezzik')])])
+
+    self.assertEqual(expected.render(),
+                     template.Template(card).fill(name='Fezzik'))
+    self.assertEqual(expected.render(),
+                     template._substitute(card, {'name': 'Fezzik'}).render())
+
+  def test_instance_attributes_are_refused(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__SUPPRESS_TAG__ = True
+
+    with self.assertRaises(TypeError):
+      compact.compact(card)
+
+  def test_attributes(self) -> None:
+    item = SelectionItem(text='left', value='l')
+
+    self.assertEqual(dict(compact.attributes(item)),
+                     dict(compact.attributes(compact.compact(item))))
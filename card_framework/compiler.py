@@ -0,0 +1,351 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled render plans.
+
+`dataclasses_json`'s generic `to_dict` re-resolves every field's metadata
+(letter case, `exclude` predicate and `encoder`) for every object, every time
+it is called. A render plan does that work once per class and generates a
+specialised function that produces exactly the same dictionary. The plans
+are also what `codec.DataClassJsonMixin.to_dict`, the framework's own
+replacement for the library, uses.
+
+The field helpers used by `standard_field`, `enum_field` and `list_field`
+live here so that the compiler can recognise them and inline what they do
+rather than calling them for every field of every widget.
+"""
+from __future__ import annotations
+
+import copy
+import dataclasses
+import inspect
+import keyword
+import sys
+import types
+from collections.abc import Collection, Mapping
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import stringcase
+
+Plan = Callable[[Any], Dict[str, Any]]
+
+# Values `dataclasses_json` passes through untouched (`copy.deepcopy` of these
+# returns the value itself).
+_ATOMIC = frozenset([str, int, float, bool, type(None)])
+
+_PLANS: Dict[type, Plan] = {}
+_TO_DICTS: Dict[type, Plan] = {}
+_ITEMS: Dict[type, Callable[[Any], Any]] = {}
+_METADATA: Dict[type, RenderMetadata] = {}
+
+
+class RenderMetadata(NamedTuple):
+  """What `Renderable.render` needs to know about a class.
+
+  Attributes:
+      tag (str): the root tag, being `__TAG_OVERRIDE__` if the class sets one
+        or the camelCased class name if not
+      suppress_tag (bool): the class's `__SUPPRESS_TAG__`
+      properties (Tuple[Tuple[str, Callable[[Any], Any]], ...]): the
+        camelCased name and getter of each property, sorted by name
+  """
+  tag: str
+  suppress_tag: bool
+  properties: Tuple[Tuple[str, Callable[[Any], Any]], ...]
+
+
+def exclude_unset(value: Any) -> bool:
+  """The default `exclude` predicate: drop anything falsy."""
+  return not value
+
+
+def encode_enum(value: Any) -> Optional[str]:
+  """The `enum_field` encoder: enums are rendered by name."""
+  return value.name if value else None
+
+
+def encode_list(values: Any) -> List[Any]:
+  """The `list_field` encoder.
+
+  Each entry is rendered with its own `render` (or `to_dict`) method if it has
+  one, otherwise it is used as is.
+  """
+  return [_encode_item(f) for f in values]
+
+
+def is_mixin_to_dict(method: Any) -> bool:
+  """Whether a `to_dict` is the generic one of `codec.DataClassJsonMixin` or
+  `dataclasses_json.DataClassJsonMixin`, which a plan reproduces.
+
+  Args:
+      method (Any): the class's `to_dict`
+
+  Returns:
+      bool: whether the plan can be used instead
+  """
+  from card_framework import codec
+
+  if method is codec.DataClassJsonMixin.to_dict:
+    return True
+  # If a class uses the library's mixin, the library is already imported.
+  library = sys.modules.get('dataclasses_json')
+  return library is not None and method is library.DataClassJsonMixin.to_dict
+
+
+def _render_value(f: Any) -> Any:
+  for a in ['render', 'to_dict']:
+    if (m := getattr(f, a, None)) and callable(m):
+      return m()
+
+
+def _compile_item(cls: type) -> Callable[[Any], Any]:
+  """Works out once per class how `encode_list` should render an entry."""
+  names = getattr(cls, '__dataclass_fields__', {})
+  if 'render' in names or 'to_dict' in names:
+    # The methods could be shadowed per instance, so ask every time.
+    return lambda f: _render_value(f) or f
+
+  if (m := getattr(cls, 'render', None)) and callable(m):
+    return lambda f: f.render() or f
+
+  if (m := getattr(cls, 'to_dict', None)) and callable(m):
+    if is_mixin_to_dict(m):
+      return lambda f: plan(cls)(f) or f
+    return lambda f: f.to_dict() or f
+
+  return lambda f: f
+
+
+def _encode_item(f: Any) -> Any:
+  try:
+    return _ITEMS[type(f)](f)
+  except KeyError:
+    encoder = _ITEMS[type(f)] = _compile_item(type(f))
+    return encoder(f)
+
+
+def encode(value: Any) -> Any:
+  """Encodes a value the way `dataclasses_json` does for a nested field.
+
+  Nested dataclasses are converted with their plan (without their `to_dict`
+  override or tag, just as `dataclasses_json` does), mappings and collections
+  are converted element by element and anything else is copied.
+
+  Args:
+      value (Any): the value to encode
+
+  Returns:
+      Any: the encoded value
+  """
+  cls = type(value)
+  if cls in _ATOMIC:
+    return value
+
+  if hasattr(cls, '__dataclass_fields__'):
+    return plan(cls)(value)
+
+  if isinstance(value, Mapping):
+    return {encode(k): encode(v) for k, v in value.items()}
+
+  if isinstance(value, Collection) and not isinstance(value, (str, bytes)):
+    return [encode(v) for v in value]
+
+  return copy.deepcopy(value)
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+  """The compiled equivalent of `obj.to_dict()`.
+
+  Classes which override `to_dict` (to validate before rendering, for
+  instance) still have their override called.
+
+  Args:
+      obj (Any): the dataclass to convert
+
+  Returns:
+      Dict[str, Any]: the dictionary `obj.to_dict()` would have returned
+  """
+  try:
+    return _TO_DICTS[type(obj)](obj)
+  except KeyError:
+    cls = type(obj)
+    _TO_DICTS[cls] = (plan(cls) if is_mixin_to_dict(cls.to_dict)
+                      else cls.to_dict)
+    return _TO_DICTS[cls](obj)
+
+
+def plan(cls: type) -> Plan:
+  """Returns the compiled render plan for a dataclass, compiling if needed.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Plan: a function from an instance of `cls` to its dictionary
+  """
+  try:
+    return _PLANS[cls]
+  except KeyError:
+    compiled = _PLANS[cls] = compile_plan(cls)
+    return compiled
+
+
+def render_metadata(cls: type) -> RenderMetadata:
+  """Returns the `RenderMetadata` for a class, working it out if needed.
+
+  Args:
+      cls (type): the `Renderable` class
+
+  Returns:
+      RenderMetadata: the class's metadata
+  """
+  try:
+    return _METADATA[cls]
+  except KeyError:
+    properties = inspect.getmembers(cls, lambda v: isinstance(v, property))
+    metadata = _METADATA[cls] = RenderMetadata(
+        tag=(_class_setting(cls, '__TAG_OVERRIDE__') or
+             stringcase.camelcase(cls.__name__)),
+        suppress_tag=_class_setting(cls, '__SUPPRESS_TAG__'),
+        properties=tuple((stringcase.camelcase(name), value.fget)
+                         for (name, value) in properties))
+    return metadata
+
+
+def _class_setting(cls: type, name: str) -> Any:
+  value = getattr(cls, name, False)
+  if isinstance(value, types.MemberDescriptorType):
+    # A field of a compact class, whose slot has replaced the default.
+    return getattr(cls, '__dataclass_fields__')[name].default
+  return value
+
+
+def field_overrides(cls: type) -> Dict[str, Dict[str, Any]]:
+  """Resolves the `dataclasses_json` configuration for each field of `cls`.
+
+  The global configuration is applied first, then the class level
+  configuration and finally the field's own metadata, in the same order as
+  `dataclasses_json` itself.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Dict[str, Dict[str, Any]]: the configuration, keyed by field name
+  """
+  library = sys.modules.get('dataclasses_json')
+  encoders = library.cfg.global_config.encoders if library else {}
+  cls_config = getattr(cls, 'dataclass_json_config', None) or {}
+
+  overrides = {}
+  for field in dataclasses.fields(cls):
+    config = {}
+    if field.type in encoders:
+      config['encoder'] = encoders[field.type]
+    config.update(cls_config)
+    config.update(field.metadata.get('dataclasses_json', {}))
+    overrides[field.name] = config
+
+  return overrides
+
+
+def compile_plan(cls: type,
+                 item: Optional[Callable[[Any], Any]] = None) -> Plan:
+  """Generates the render plan for a dataclass.
+
+  Args:
+      cls (type): the dataclass
+      item (Optional[Callable[[Any], Any]], optional): replaces the encoding
+        of each entry of a `list_field`. Defaults to None.
+
+  Returns:
+      Plan: a function from an instance of `cls` to its dictionary
+  """
+  config = getattr(cls, 'dataclass_json_config', None) or {}
+  if getattr(config.get('undefined'), 'value', None) is not None:
+    # Undefined parameter handling is rare enough to leave to the library,
+    # which is the only way to configure it.
+    from dataclasses_json import DataClassJsonMixin
+    return lambda obj: DataClassJsonMixin.to_dict(obj)
+
+  namespace = {'_atomic': _ATOMIC, '_encode': encode,
+               '_item': item or _encode_item}
+  lines = ['def plan(obj):', '  out = {}']
+
+  for i, (name, override) in enumerate(field_overrides(cls).items()):
+    lines.extend(_field_plan(i, name, override, namespace))
+
+  lines.append('  return out')
+  exec('\n'.join(lines), namespace)
+  compiled = namespace['plan']
+  compiled.__qualname__ = f'plan<{cls.__qualname__}>'
+  return compiled
+
+
+def _field_plan(i: int, name: str, override: Dict[str, Any],
+                namespace: Dict[str, Any]) -> List[str]:
+  """The lines of a plan which write one field, adding what they refer to
+  to `namespace`."""
+  key = _plan_key(i, name, override, namespace)
+  if name.isidentifier() and not keyword.iskeyword(name):
+    lines = [f'  v = obj.{name}']
+  else:
+    lines = [f'  v = getattr(obj, {name!r})']
+
+  exclude = override.get('exclude')
+  encoder = override.get('encoder')
+  if not encoder:
+    # No encoder: the value is converted before `exclude` sees it.
+    if exclude is exclude_unset:
+      return lines + ['  if v is not None:',
+                      '    if type(v) not in _atomic: v = _encode(v)',
+                      f'    if v: out[{key}] = v']
+    lines.append('  if type(v) not in _atomic: v = _encode(v)')
+
+  condition = _plan_condition(i, exclude, namespace)
+  value = _plan_value(i, encoder, exclude, namespace)
+  lines.append(f'  {condition}out[{key}] = {value}')
+  return lines
+
+
+def _plan_key(i: int, name: str, override: Dict[str, Any],
+              namespace: Dict[str, Any]) -> str:
+  letter_case = override.get('letter_case')
+  key = letter_case(name) if letter_case is not None else name
+  if isinstance(key, str):
+    return repr(key)
+  namespace[f'_key{i}'] = key
+  return f'_key{i}'
+
+
+def _plan_condition(i: int, exclude: Optional[Callable[[Any], bool]],
+                    namespace: Dict[str, Any]) -> str:
+  if exclude is exclude_unset:
+    return 'if v: '
+  if exclude:
+    namespace[f'_exclude{i}'] = exclude
+    return f'if not _exclude{i}(v): '
+  return ''
+
+
+def _plan_value(i: int, encoder: Optional[Callable[[Any], Any]],
+                exclude: Optional[Callable[[Any], bool]],
+                namespace: Dict[str, Any]) -> str:
+  if not encoder:
+    return 'v'
+  if encoder is encode_enum:
+    return 'v.name' if exclude is exclude_unset else '(v.name if v else None)'
+  if encoder is encode_list:
+    return '[_item(f) for f in v]'
+  namespace[f'_encoder{i}'] = encoder
+  return f'_encoder{i}(v)'
@@ -0,0 +1,209 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import json
+import unittest
+from dataclasses import dataclass
+from typing import List
+
+from dataclasses_json import DataClassJsonMixin, LetterCase, dataclass_json
+
+from card_framework import (AutoNumber, compiler, enum_field, list_field,
+                            standard_field)
+from card_framework.v2.card import Card, CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import HorizontalAlignment, ImageType
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.grid import Grid, GridItem, ImageComponent
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.open_link import OpenLink
+
+
+class Fencer(AutoNumber):
+  DREAD_PIRATE_ROBERTS = ()
+  INIGO_MONTOYA = ()
+
+
+@dataclass_json
+@dataclass
+class Sword(object):
+  maker: str = standard_field()
+  six_fingers: bool = standard_field()
+
+
+@dataclass_json
+@dataclass
+class Duel(object):
+  left_hand: str = standard_field()
+  fencer: Fencer = enum_field()
+  raw_fencer: Fencer = enum_field(letter_case=None)
+  swords: List[Sword] = list_field()
+  sword: Sword = standard_field()
+  always: str = standard_field(exclude=None)
+  never: str = standard_field(exclude=lambda x: True)
+  shouted: str = standard_field(encoder=lambda x: x.upper() if x else x)
+  type_: str = standard_field(field_name='type')
+  plain: str = 'Fezzik'
+
+
+@dataclass_json(letter_case=LetterCase.CAMEL)
+@dataclass
+class ClassCased(object):
+  cliffs_of_insanity: str = 'Westley'
+
+
+def _card() -> Message:
+  section = Section(header='Florin', widgets=[
+      DecoratedText(top_label='Inigo Montoya', text='Prepare to die.',
+                    start_icon=Icon(known_icon=Icon.KnownIcon.PERSON),
+                    on_click=OnClick(open_link=OpenLink(url='https://imdb'))),
+      ButtonList(buttons=[Button(text='Inconceivable!',
+                                 type_=Button.Type.FILLED)]),
+      Grid(title='Guilder', items=[
+          GridItem(id='1', image=ImageComponent(image_uri='https://1')),
+          GridItem(id='2', title='Fezzik')]),
+  ])
+  section.widgets[1].horizontal_alignment = HorizontalAlignment.CENTER
+  card = CardWithId(header=CardHeader(title='Princess Bride',
+                                      image_url='https://pb',
+                                      image_type=ImageType.CIRCLE),
+                    sections=[section])
+  card.card_id = 'vizzini'
+  return Message(text='As you wish', cards_v2=[card])
+
+
+class CompilerTest(unittest.TestCase):
+  def assertIdentical(self, obj) -> None:
+    self.assertEqual(json.dumps(compiler.to_dict(obj)),
+                     json.dumps(DataClassJsonMixin.to_dict(obj)))
+
+  def test_empty(self) -> None:
+    self.assertDictEqual(compiler.to_dict(Duel()),
+                         {'always': None, 'plain': 'Fezzik'})
+    self.assertIdentical(Duel())
+
+  def test_field_metadata(self) -> None:
+    duel = Duel(left_hand='yes', fencer=Fencer.INIGO_MONTOYA,
+                raw_fencer=Fencer.DREAD_PIRATE_ROBERTS,
+                swords=[Sword(maker='Domingo'), Sword()], sword=Sword(),
+                always='here', never='gone', shouted='inconceivable',
+                type_='rapier')
+
+    self.assertEqual(
+        list(compiler.to_dict(duel).items()),
+        [('leftHand', 'yes'),
+         ('fencer', 'INIGO_MONTOYA'),
+         ('raw_fencer', 'DREAD_PIRATE_ROBERTS'),
+         ('swords', [{'maker': 'Domingo'}, Sword()]),
+         ('always', 'here'),
+         ('shouted', 'INCONCEIVABLE'),
+         ('type', 'rapier'),
+         ('plain', 'Fezzik')])
+
+  def test_class_letter_case(self) -> None:
+    self.assertDictEqual(compiler.to_dict(ClassCased()),
+                         {'cliffsOfInsanity': 'Westley'})
+    self.assertIdentical(ClassCased())
+
+  def test_falsy_values_are_excluded(self) -> None:
+    sword = Sword(maker='', six_fingers=False)
+
+    self.assertDictEqual(compiler.to_dict(sword), {})
+    self.assertIdentical(sword)
+
+  def test_plan_is_cached(self) -> None:
+    self.assertIs(compiler.plan(Sword), compiler.plan(Sword))
+
+  def test_to_dict_override_is_called(self) -> None:
+    with self.assertRaises(ValueError):
+      compiler.to_dict(Icon())
+
+  def test_nested_override_is_not_called(self) -> None:
+    # dataclasses_json does not call a nested object's `to_dict`, so neither
+    # does the plan.
+    text = DecoratedText(text='Vizzini', icon=Icon())
+
+    self.assertDictEqual(compiler.to_dict(text), {'text': 'Vizzini'})
+    self.assertIdentical(text)
+
+  def test_widget_tree(self) -> None:
+    message = _card()
+
+    self.assertIdentical(message)
+    self.assertIdentical(message.cards_v2[0])
+    self.assertIdentical(message.cards_v2[0].sections[0])
+    self.assertEqual(
+        json.dumps(message.render()),
+        json.dumps({
+            'text': 'As you wish',
+            'cardsV2': [{
+                'card': {
+                    'header': {'title': 'Princess Bride',
+                               'imageUrl': 'https://pb',
+                               'imageType': 'CIRCLE'},
+                    'sections': [
+                        {'header': 'Florin',
+                         'widgets': [
+                             {'decoratedText': {
+                                 'startIcon': {'knownIcon': 'PERSON'},
+                                 'topLabel': 'Inigo Montoya',
+                                 'text': 'Prepare to die.',
+                                 'onClick': {
+                                     'openLink': {'url': 'https://imdb'}}}},
+                             {'buttonList': {
+                                 'buttons': [{'text': 'Inconceivable!',
+                                              'type': 'FILLED'}]},
+                              'horizontalAlignment': 'CENTER'},
+                             {'grid': {
+                                 'title': 'Guilder',
+                                 'items': [
+                                     {'id': '1',
+                                      'image': {'imageUri': 'https://1'}},
+                                     {'id': '2', 'title': 'Fezzik'}]}}]}]},
+                'cardId': 'vizzini'}]}))
+
+
+class RenderMetadataTest(unittest.TestCase):
+  def test_widget(self) -> None:
+    metadata = compiler.render_metadata(ButtonList)
+
+    self.assertEqual('buttonList', metadata.tag)
+    self.assertFalse(metadata.suppress_tag)
+    self.assertEqual(['horizontalAlignment'],
+                     [name for (name, _) in metadata.properties])
+    self.assertIs(metadata, compiler.render_metadata(ButtonList))
+
+  def test_tag_override(self) -> None:
+    self.assertEqual('card', compiler.render_metadata(Card).tag)
+
+  def test_suppress_tag(self) -> None:
+    self.assertTrue(compiler.render_metadata(Section).suppress_tag)
+
+  def test_properties_are_sorted(self) -> None:
+    self.assertEqual(['cardId'],
+                     [name for (name, _) in
+                      compiler.render_metadata(CardWithId).properties])
+
+  def test_instance_tag_override(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__TAG_OVERRIDE__ = 'pushCard'
+
+    self.assertDictEqual(card.render(),
+                         {'pushCard': {'sections': [{'header': 'Florin'}]}})
@@ -0,0 +1,195 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Differences between two renders of a message or card.
+
+`update_mask` lists the fields of a message which an update has to send, as
+the `updateMask` of the Chat API's `spaces.messages.update`, so that
+unchanged fields (and updates which change nothing at all) can be left out:
+```
+mask = diff.update_mask(sent, message)
+if mask:
+  update(message, update_mask=','.join(mask))
+```
+`changes` lists every value which differs, with its JSON path, for logging.
+
+Both compare the rendered JSON, so two objects which render the same are the
+same, and either side can be a `Renderable`, another dataclass or something
+already rendered. Lists are compared entry by entry (moved entries aren't
+searched for), and whole subtrees which are the same are skipped in one
+comparison. A value is compared once for each level above it, so the time
+taken is the size of the renders times their depth, and cards are only a
+few levels deep. Values of different types are different, even if Python
+considers them equal (`1`, `1.0` and `True`), as their JSON is.
+
+Note that two `CardWithId`s without a `card_id` are given different ones,
+and so always differ, unless they use the `card_ids.content_id` strategy.
+"""
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from typing import Any, List, NamedTuple, Optional, Tuple
+
+from card_framework import backends, compiler
+
+# The message fields an update can change: the rendered key, and its name in
+# the `updateMask`.
+UPDATE_MASK_FIELDS = {
+    'text': 'text',
+    'attachment': 'attachment',
+    'cards': 'cards',
+    'cardsV2': 'cards_v2',
+    'accessoryWidgets': 'accessory_widgets',
+}
+
+
+class Change(NamedTuple):
+  """A value which differs between two renders.
+
+  Attributes:
+      path (str): where the value is, such as
+        `$.cardsV2[0].card.sections[1].widgets[2].decoratedText.text`
+      old (Any): the old value, or `dataclasses.MISSING` if it was added
+      new (Any): the new value, or `dataclasses.MISSING` if it was removed
+  """
+  path: str
+  old: Any
+  new: Any
+
+  def __str__(self) -> str:
+    if self.old is dataclasses.MISSING:
+      return f'{self.path}: added {self.new!r}'
+    if self.new is dataclasses.MISSING:
+      return f'{self.path}: removed {self.old!r}'
+    return f'{self.path}: {self.old!r} -> {self.new!r}'
+
+
+def update_mask(old: Any, new: Any) -> List[str]:
+  """Lists the fields an update from one message to another has to send.
+
+  Args:
+      old (Any): the message as it was sent, or its render
+      new (Any): the message as it is now, or its render
+
+  Returns:
+      List[str]: the names (in `UPDATE_MASK_FIELDS`) of the fields which
+        differ, which is empty if the update changes nothing
+  """
+  if old is new:
+    return []
+
+  old, new = _render(old), _render(new)
+  return [name for (key, name) in UPDATE_MASK_FIELDS.items()
+          if not _same(old.get(key), new.get(key))]
+
+
+def changes(old: Any, new: Any) -> List[Change]:
+  """Lists every value which differs between two renders.
+
+  Args:
+      old (Any): the old message, card or widget, or its render
+      new (Any): the new one, or its render
+
+  Returns:
+      List[Change]: the differences, in the order they are rendered
+  """
+  found = []
+  if old is not new:
+    _compare(_render(old), _render(new), None, found)
+  return found
+
+
+def _render(value: Any) -> Any:
+  if isinstance(value, (Mapping, list, tuple)):
+    return value
+  if callable(getattr(value, 'render', None)):
+    return value.render()
+  return compiler.to_dict(value)
+
+
+def _same(old: Any, new: Any) -> bool:
+  """Whether two renders are the same JSON: equal, with every value of the
+  same type."""
+  if old is new:
+    return True
+  if old != new:
+    return False
+  if not isinstance(old, (Mapping, list)):
+    return type(old) is type(new)
+
+  # Equal values can still be of different types (`1`, `1.0` and `True`),
+  # which their JSON shows. Keys in a different order make the JSON differ as
+  # well, so only then are the types compared one by one.
+  try:
+    if backends.dumps(old) == backends.dumps(new):
+      return True
+  except (TypeError, ValueError):
+    pass
+  return _same_types(old, new)
+
+
+def _same_types(old: Any, new: Any) -> bool:
+  # `old` and `new` are equal, so have the same keys and lengths.
+  if isinstance(old, Mapping):
+    return all(_same_types(value, new[key]) for key, value in old.items())
+  if isinstance(old, list):
+    return all(map(_same_types, old, new))
+  return type(old) is type(new)
+
+
+def _compare(old: Any, new: Any, path: Optional[Tuple[Any, Any]],
+             found: List[Change]) -> None:
+  # Paths are kept as (parent, step) pairs and only joined for a change.
+  if _same(old, new):
+    # Comparing a whole subtree at once is far quicker than walking it.
+    return
+
+  if isinstance(old, Mapping) and isinstance(new, Mapping):
+    _compare_mappings(old, new, path, found)
+  elif isinstance(old, list) and isinstance(new, list):
+    _compare_lists(old, new, path, found)
+  elif type(old) is not type(new) or old != new:
+    found.append(Change(_join(path), old, new))
+
+
+def _compare_mappings(old: Mapping, new: Mapping,
+                      path: Optional[Tuple[Any, Any]],
+                      found: List[Change]) -> None:
+  for key, value in old.items():
+    if key in new:
+      _compare(value, new[key], (path, key), found)
+    else:
+      found.append(Change(_join((path, key)), value, dataclasses.MISSING))
+  for key, value in new.items():
+    if key not in old:
+      found.append(Change(_join((path, key)), dataclasses.MISSING, value))
+
+
+def _compare_lists(old: list, new: list, path: Optional[Tuple[Any, Any]],
+                   found: List[Change]) -> None:
+  for i, (a, b) in enumerate(zip(old, new)):
+    _compare(a, b, (path, i), found)
+  for i in range(len(new), len(old)):
+    found.append(Change(_join((path, i)), old[i], dataclasses.MISSING))
+  for i in range(len(old), len(new)):
+    found.append(Change(_join((path, i)), dataclasses.MISSING, new[i]))
+
+
+def _join(path: Optional[Tuple[Any, Any]]) -> str:
+  steps = []
+  while path is not None:
+    path, step = path
+    steps.append(f'[{step}]' if type(step) is int else f'.{step}')
+  steps.append('$')
+  return ''.join(reversed(steps))
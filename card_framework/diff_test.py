@@ -0,0 +1,122 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import dataclasses
+import unittest
+
+from card_framework import fixtures_test as fixtures
+from card_framework import diff
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+
+
+class UpdateMaskTest(unittest.TestCase):
+  def test_no_change(self) -> None:
+    self.assertEqual([], diff.update_mask(fixtures.message(20),
+                                          fixtures.message(20)))
+
+  def test_same_object(self) -> None:
+    message = fixtures.message(20)
+
+    self.assertEqual([], diff.update_mask(message, message))
+
+  def test_text(self) -> None:
+    new = fixtures.message(20)
+    new.text = 'Inconceivable!'
+
+    self.assertEqual(['text'], diff.update_mask(fixtures.message(20), new))
+
+  def test_fields(self) -> None:
+    old = Message(text='As you wish')
+    new = Message(text='As you wish', cards_v2=[fixtures.card(5)],
+                  accessory_widgets=[])
+
+    self.assertEqual(['cards_v2'], diff.update_mask(old, new))
+    self.assertEqual(['cards_v2'], diff.update_mask(old.render(),
+                                                    new.render()))
+
+  def test_card(self) -> None:
+    new = fixtures.message(20)
+    new.cards_v2[0].sections[0].widgets[3].text = 'Inconceivable!'
+
+    self.assertEqual(['cards_v2'], diff.update_mask(fixtures.message(20), new))
+
+  def test_types(self) -> None:
+    self.assertEqual(['text'], diff.update_mask({'text': 1}, {'text': True}))
+    self.assertEqual(['cards_v2'],
+                     diff.update_mask({'cardsV2': [{'width': 1}]},
+                                      {'cardsV2': [{'width': 1.0}]}))
+
+  def test_fields_not_in_the_mask(self) -> None:
+    new = fixtures.message(20)
+    new.thread_reply = True
+
+    self.assertEqual([], diff.update_mask(fixtures.message(20), new))
+
+
+class ChangesTest(unittest.TestCase):
+  def test_no_change(self) -> None:
+    self.assertEqual([], diff.changes(fixtures.message(20), fixtures.message(20)))
+
+  def test_widget(self) -> None:
+    new = fixtures.message(20)
+    new.cards_v2[0].sections[0].widgets[3].text = 'Inconceivable!'
+
+    self.assertEqual(
+        [diff.Change(
+            path='$.cardsV2[0].card.sections[0].widgets[3].decoratedText.text',
+            old='You killed my father. Prepare to die. (3)',
+            new='Inconceivable!')],
+        diff.changes(fixtures.message(20), new))
+
+  def test_added_and_removed(self) -> None:
+    old = fixtures.message(20)
+    new = fixtures.message(20)
+    new.text = None
+    removed = new.cards_v2[0].sections[0].widgets.pop().render()
+    new.cards_v2[0].sections.append(Section(header='The Fire Swamp'))
+
+    self.assertEqual([
+        diff.Change('$.text', 'As you wish', dataclasses.MISSING),
+        diff.Change('$.cardsV2[0].card.sections[0].widgets[19]', removed,
+                    dataclasses.MISSING),
+        diff.Change('$.cardsV2[0].card.sections[1]', dataclasses.MISSING,
+                    {'header': 'The Fire Swamp'}),
+    ], diff.changes(old, new))
+
+  def test_types(self) -> None:
+    found = diff.changes({'fezzik': ['giant']}, {'fezzik': 'giant'})
+
+    self.assertEqual([diff.Change('$.fezzik', ['giant'], 'giant')], found)
+
+  def test_equal_values_of_other_types(self) -> None:
+    found = diff.changes({'miracle_max': [1, {'pill': True}]},
+                         {'miracle_max': [1.0, {'pill': 1}]})
+
+    self.assertEqual([diff.Change('$.miracle_max[0]', 1, 1.0),
+                      diff.Change('$.miracle_max[1].pill', True, 1)], found)
+
+  def test_key_order(self) -> None:
+    self.assertEqual([], diff.changes({'inigo': 1, 'fezzik': 2},
+                                      {'fezzik': 2, 'inigo': 1}))
+
+  def test_str(self) -> None:
+    found = diff.changes({'vizzini': 'Sicilian', 'westley': 'farm boy'},
+                         {'vizzini': 'dead', 'buttercup': 'princess'})
+
+    self.assertEqual(["$.vizzini: 'Sicilian' -> 'dead'",
+                      "$.westley: removed 'farm boy'",
+                      "$.buttercup: added 'princess'"],
+                     [str(c) for c in found])
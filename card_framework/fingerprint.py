@@ -0,0 +1,101 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content fingerprints of widget trees.
+
+`fingerprint` returns a BLAKE2b digest of a message, card or widget, for use
+as an ETag, a cache key or to spot identical notifications. Two trees have
+the same fingerprint if, and only if (barring collisions), they render the
+same.
+
+What is hashed is `canonical_json`, which is `render_json`'s output: keys are
+always written in the order of the class's fields, so it is already
+canonical without sorting, and is written without building the dictionaries
+`render` would. The exceptions are mappings given as field values, whose keys
+are written in their own order, and a `CardWithId` without a `card_id`, which
+is given a new one (unless it uses the `card_ids.content_id` strategy).
+
+Frozen widgets keep their canonical JSON once it has been worked out, so a
+frozen section or footer shared by many cards is only written once however
+many of them are fingerprinted, and fingerprinting a frozen card again only
+hashes it.
+"""
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Iterable
+
+from card_framework import frozen, serializer
+
+# The length of a fingerprint, in bytes (twice that in hex digits).
+DIGEST_SIZE = 16
+
+
+class _Canonical(serializer.Output):
+  """An output for the serializer's writers which uses the canonical JSON
+  frozen entries have kept, rather than writing it again."""
+  __slots__ = ()
+
+  def write_items(self, values: Iterable[Any]) -> None:
+    """Writes a `list_field`."""
+    self.append('[')
+    first = True
+    for f in values:
+      if not first:
+        self.append(', ')
+      first = False
+      if getattr(type(f), '__FROZEN__', False):
+        self.append(_frozen_json(f))
+      else:
+        serializer.write_item(f, self)
+    self.append(']')
+
+
+def canonical_json(obj: Any) -> bytes:
+  """Renders an object to its canonical JSON.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `CardWithId`...) or any
+        other dataclass
+
+  Returns:
+      bytes: the same bytes as `render_json`
+  """
+  if getattr(type(obj), '__FROZEN__', False):
+    return _frozen_json(obj).encode('utf-8')
+  return ''.join(serializer._write(obj, _Canonical())).encode('utf-8')
+
+
+def fingerprint(obj: Any) -> str:
+  """Fingerprints an object.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `CardWithId`...) or any
+        other dataclass
+
+  Returns:
+      str: the BLAKE2b digest of its `canonical_json`, in hex
+  """
+  return hashlib.blake2b(canonical_json(obj),
+                         digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _frozen_json(obj: Any) -> str:
+  try:
+    return getattr(obj, frozen._JSON)
+  except AttributeError:
+    out = _Canonical()
+    serializer.write_item(obj, out)
+    result = ''.join(out)
+    object.__setattr__(obj, frozen._JSON, result)
+    return result
@@ -0,0 +1,102 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import pickle
+import unittest
+
+from card_framework import compact, fingerprint, frozen, template, transfer
+from card_framework.frozen_test import _card, _footer
+from card_framework.v2.card import CardWithId
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.text_paragraph import TextParagraph
+
+
+class FingerprintTest(unittest.TestCase):
+  def test_canonical_json(self) -> None:
+    card = _card()
+
+    self.assertEqual(card.render_json(), fingerprint.canonical_json(card))
+
+  def test_same_render(self) -> None:
+    self.assertEqual(_card().fingerprint(), _card().fingerprint())
+    self.assertEqual(2 * fingerprint.DIGEST_SIZE, len(_card().fingerprint()))
+
+  def test_different_render(self) -> None:
+    card = _card()
+    card.sections[0].widgets[0].text = 'Count Rugen'
+
+    self.assertNotEqual(_card().fingerprint(), card.fingerprint())
+
+  def test_messages(self) -> None:
+    first = Message(text='Inconceivable!', cards_v2=[_card()])
+    second = Message(text='Inconceivable!', cards_v2=[_card()])
+
+    self.assertEqual(first.fingerprint(), second.fingerprint())
+    second.text = 'As you wish'
+    self.assertNotEqual(first.fingerprint(), second.fingerprint())
+
+
+class FrozenTest(unittest.TestCase):
+  def test_same_as_mutable(self) -> None:
+    card = _card()
+
+    self.assertEqual(card.fingerprint(), card.freeze().fingerprint())
+    self.assertEqual(card.render_json(),
+                     fingerprint.canonical_json(card.freeze()))
+
+  def test_shared_sections(self) -> None:
+    footer = Section(widgets=[_footer()]).freeze()
+    first, second = _card(), _card()
+    first.sections.append(footer)
+    second.sections.append(footer)
+
+    self.assertEqual(first.fingerprint(), second.fingerprint())
+    self.assertEqual(
+        footer.render_json(), getattr(footer, frozen._JSON).encode('utf-8'))
+    self.assertEqual(first.render_json(), fingerprint.canonical_json(first))
+
+  def test_cached(self) -> None:
+    card = _card().freeze()
+    expected = card.fingerprint()
+    object.__setattr__(card, frozen._JSON, '{}')
+
+    self.assertNotEqual(expected, card.fingerprint())
+
+  def test_compact(self) -> None:
+    card = compact.compact(_card()).freeze()
+
+    self.assertEqual(_card().fingerprint(), card.fingerprint())
+    self.assertTrue(hasattr(card, frozen._JSON))
+
+  def test_copies_leave_the_cache_behind(self) -> None:
+    for card in [_card().freeze(), compact.compact(_card()).freeze()]:
+      card.fingerprint()
+      with self.subTest(type(card).__mro__[2].__name__):
+        for copied in [pickle.loads(pickle.dumps(card)),
+                       transfer.unpack(transfer.pack(card))]:
+          self.assertFalse(hasattr(copied, frozen._JSON))
+          self.assertEqual(card.fingerprint(), copied.fingerprint())
+
+  def test_template(self) -> None:
+    card = CardWithId(sections=[Section(widgets=[
+        TextParagraph(text=template.Slot('text'))])])
+    card.card_id = 'vizzini'
+    source = template.Template(card)._source
+    source.fingerprint()
+    filled = template._substitute(source, {'text': 'Inconceivable!'})
+
+    self.assertFalse(hasattr(filled, frozen._JSON))
+    self.assertIn(b'Inconceivable!', fingerprint.canonical_json(filled))
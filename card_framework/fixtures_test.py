@@ -0,0 +1,130 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Widget trees and Chat event payloads shared by the tests (and the
+benchmarks).
+
+`message(widgets)` is a message with one card of (about) that many widgets:
+a header, `Section`s of `DecoratedText`, a `ButtonList` and a `Grid`.
+`event_message(i)` is the `message` of a typical MESSAGE event: a slash
+command mentioning the app in a threaded space, with an attachment and
+reactions.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from card_framework.v2.card import CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import ImageType
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.action import Action, ActionParameter
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.grid import Grid, GridItem, ImageComponent
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+
+
+def decorated_text(i: int) -> DecoratedText:
+  return DecoratedText(top_label='Hello, my name is Inigo Montoya',
+                       text=f'You killed my father. Prepare to die. ({i})',
+                       start_icon=Icon(known_icon=Icon.KnownIcon.PERSON))
+
+
+def button_list(i: int) -> ButtonList:
+  return ButtonList(buttons=[
+      Button(text='As you wish',
+             on_click=OnClick(action=Action(
+                 function='as_you_wish',
+                 parameters=[ActionParameter(key='row', value=str(i))]))),
+      Button(text='Inconceivable!', type_=Button.Type.OUTLINED),
+  ])
+
+
+def grid(i: int) -> Grid:
+  return Grid(title=f'Fire swamp ({i})', column_count=2, items=[
+      GridItem(id=str(n), title='R.O.U.S.',
+               image=ImageComponent(image_uri=f'https://example.com/{n}.png'))
+      for n in range(4)])
+
+
+def card(widgets: int = 500, per_section: int = 50) -> CardWithId:
+  """Builds a card with (about) `widgets` widgets.
+
+  Args:
+      widgets (int, optional): the number of widgets. Defaults to 500.
+      per_section (int, optional): widgets per section. Defaults to 50.
+
+  Returns:
+      CardWithId: the card
+  """
+  builders = [decorated_text] * 8 + [button_list, grid]
+  sections = [
+      Section(header=f'Section {s}',
+              widgets=[builders[i % len(builders)](i)
+                       for i in range(s, min(s + per_section, widgets))])
+      for s in range(0, widgets, per_section)]
+  result = CardWithId(header=CardHeader(title='The Princess Bride',
+                                        image_url='https://example.com/pb.png',
+                                        image_type=ImageType.CIRCLE),
+                      sections=sections)
+  result.card_id = 'vizzini'
+  return result
+
+
+def message(widgets: int = 500) -> Message:
+  return Message(text='As you wish', cards_v2=[card(widgets)])
+
+
+def user(name: str, display_name: str, type_: str = 'HUMAN') -> Dict[str, Any]:
+  return {'name': f'users/{name}', 'displayName': display_name,
+          'domainId': 'florin', 'type': type_, 'isAnonymous': False}
+
+
+def event_message(i: int = 0) -> Dict[str, Any]:
+  fezzik = user('fezzik', 'Fezzik', 'BOT')
+  return {
+      'name': f'spaces/AAAA/messages/{i}',
+      'sender': user(str(i), 'Inigo Montoya'),
+      'createTime': '2025-01-01T00:00:00.000000Z',
+      'text': '@Fezzik /duel Prepare to die.',
+      'annotations': [
+          {'type': 'USER_MENTION', 'startIndex': 0, 'length': 7,
+           'userMention': {'user': fezzik, 'type': 'MENTION'}},
+          {'type': 'SLASH_COMMAND', 'startIndex': 8, 'length': 5,
+           'slashCommand': {'bot': fezzik, 'type': 'INVOKE',
+                            'commandName': '/duel', 'commandId': '1',
+                            'triggersDialog': False}},
+      ],
+      'thread': {'name': 'spaces/AAAA/threads/BBBB'},
+      'space': {'name': 'spaces/AAAA', 'type': 'ROOM', 'displayName': 'Florin',
+                'spaceType': 'SPACE',
+                'spaceDetails': {'description': 'Guilder',
+                                 'guidelines': 'No rodents of unusual size'}},
+      'argumentText': ' Prepare to die.',
+      'slashCommand': {'commandId': '1'},
+      'attachment': [{'name': f'spaces/AAAA/messages/{i}/attachments/1',
+                      'contentName': 'six-fingered-man.png',
+                      'contentType': 'image/png', 'source': 'DRIVE_FILE',
+                      'driveDataRef': {'driveFileId': 'sword'}}],
+      'matchedUrl': {'url': 'https://www.imdb.com/title/tt0093779/'},
+      'emojiReactionSummaries': [{'emoji': {'unicode': '🗡'},
+                                  'reactionCount': 3}],
+      'quotedMessageMetadata': {'name': 'spaces/AAAA/messages/0',
+                                'lastUpdateTime': '2025-01-01T00:00:00Z'},
+      'threadReply': True,
+      'formattedText': '<users/fezzik> /duel Prepare to die.',
+  }
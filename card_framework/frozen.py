@@ -0,0 +1,163 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Immutable, hashable copies of widgets.
+
+`freeze` makes a deep, read-only copy of a widget, card or any other
+dataclass. Each class is swapped for a frozen subclass (with the same name,
+so it renders exactly the same) which:
+  * raises `dataclasses.FrozenInstanceError` if anything is set or deleted,
+  * is hashable, computing the structural hash once and keeping it, and
+  * caches its render for good, since it can't change.
+
+Lists become tuples, sets frozensets and mappings read-only proxies (which
+aren't hashable, so neither is anything containing one).
+
+A frozen widget can be used as a dictionary key, shared between threads and
+requests, and put inside any number of cards: a footer `ButtonList` on every
+card, for instance, is only rendered once. As with every cached render, the
+dictionaries `render` returns are shared and must not be modified.
+
+Frozen objects compare equal to each other structurally, but never to a
+mutable widget.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import types
+from collections.abc import Mapping
+from typing import Any, Dict, TypeVar
+
+from card_framework import compact, compiler, tracking
+
+T = TypeVar('T')
+
+# The instance attribute the structural hash is kept in.
+_HASH = '__frozen_hash__'
+# The instance attribute `card_framework.fingerprint` keeps the canonical
+# JSON in.
+_JSON = '__frozen_json__'
+
+_CLASSES: Dict[type, type] = {}
+
+
+class Frozen(object):
+  """The base of every frozen class, placed ahead of the original class."""
+  __slots__ = ()
+  __FROZEN__ = True
+  __CACHE_RENDER__ = True
+
+  def __setattr__(self, __name: str, __value: Any) -> None:
+    raise dataclasses.FrozenInstanceError(f'cannot assign to field {__name!r}')
+
+  def __delattr__(self, __name: str) -> None:
+    raise dataclasses.FrozenInstanceError(f'cannot delete field {__name!r}')
+
+  def __hash__(self) -> int:
+    try:
+      return getattr(self, _HASH)
+    except AttributeError:
+      result = hash((self.__class__, tuple(getattr(self, f.name)
+                                           for f in dataclasses.fields(self))))
+      object.__setattr__(self, _HASH, result)
+      return result
+
+  def __eq__(self, other: Any) -> bool:
+    if self is other:
+      return True
+    if other.__class__ is not self.__class__ or hash(self) != hash(other):
+      return False
+    return super().__eq__(other)
+
+  def __copy__(self: T) -> T:
+    return self
+
+  def __deepcopy__(self: T, memo: Dict[int, Any]) -> T:
+    return self
+
+  def __reduce__(self) -> Any:
+    state = {k: v for k, v in compact.attributes(self).items()
+             if k not in (_HASH, _JSON, tracking.STATE)}
+    # A compact class can't be pickled by name, so the original is sent.
+    cls = type(self).__bases__[1]
+    original = compact.original(cls)
+    return (_restore, (original, state, original is not cls))
+
+
+def frozen_class(cls: type) -> type:
+  """Returns the frozen variant of a dataclass, creating it if needed.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      type: the frozen subclass of `cls`
+  """
+  if getattr(cls, '__FROZEN__', False):
+    return cls
+
+  try:
+    return _CLASSES[cls]
+  except KeyError:
+    namespace = {
+        '__qualname__': cls.__qualname__,
+        '__module__': cls.__module__,
+        '__doc__': cls.__doc__,
+    }
+    if cls.__dictoffset__ == 0:
+      # A compact class, with no `__dict__` for the hash and JSON.
+      namespace['__slots__'] = (_HASH, _JSON)
+    frozen = _CLASSES[cls] = type(cls.__name__, (Frozen, cls), namespace)
+    return frozen
+
+
+def freeze(value: T) -> T:
+  """Makes a deep, immutable copy of a widget (or anything in one).
+
+  Args:
+      value (T): the widget, card, section or value to freeze
+
+  Returns:
+      T: the frozen copy; values which are already immutable, including
+        frozen widgets, are returned as they are
+  """
+  cls = type(value)
+  if cls in compiler._ATOMIC or isinstance(value, enum.Enum):
+    return value
+
+  if hasattr(cls, '__dataclass_fields__'):
+    if getattr(cls, '__FROZEN__', False):
+      return value
+    return _restore(cls, {k: freeze(v)
+                          for k, v in compact.attributes(value).items()
+                          if k != tracking.STATE})
+
+  if isinstance(value, (list, tuple)):
+    return tuple(freeze(v) for v in value)
+
+  if isinstance(value, (set, frozenset)):
+    return frozenset(freeze(v) for v in value)
+
+  if isinstance(value, Mapping):
+    return types.MappingProxyType({k: freeze(v) for k, v in value.items()})
+
+  return value
+
+
+def _restore(cls: type, state: Dict[str, Any], slotted: bool = False) -> Any:
+  if slotted:
+    cls = compact.compact_class(cls)
+  obj = object.__new__(frozen_class(cls))
+  compact.set_attributes(obj, state)
+  return obj
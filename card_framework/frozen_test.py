@@ -0,0 +1,171 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+import pickle
+import threading
+import unittest
+
+from card_framework import Renderable, frozen, tracking
+from card_framework.v2.card import Card, CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import HorizontalAlignment
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.color import Color
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.icon import Icon
+
+
+def _footer() -> ButtonList:
+  footer = ButtonList(buttons=[
+      Button(text='As you wish', color=Color(red=0.5)),
+      Button(text='Inconceivable!', type_=Button.Type.OUTLINED)])
+  footer.horizontal_alignment = HorizontalAlignment.CENTER
+  return footer
+
+
+def _card() -> CardWithId:
+  card = CardWithId(header=CardHeader(title='Princess Bride'), sections=[
+      Section(header='Florin', widgets=[
+          DecoratedText(text='Inigo Montoya',
+                        start_icon=Icon(known_icon=Icon.KnownIcon.PERSON)),
+          _footer()])])
+  card.card_id = 'vizzini'
+  return card
+
+
+class FrozenTest(unittest.TestCase):
+  def test_renders_the_same(self) -> None:
+    card = _card()
+    frozen_card = card.freeze()
+
+    self.assertEqual(json.dumps(card.render()), json.dumps(frozen_card.render()))
+    self.assertEqual(card.render_json(), frozen_card.render_json())
+
+  def test_is_deep(self) -> None:
+    card = _card().freeze()
+    section = card.sections[0]
+
+    self.assertIsInstance(card, CardWithId)
+    self.assertIsInstance(card, frozen.Frozen)
+    self.assertEqual('CardWithId', type(card).__name__)
+    self.assertIsInstance(section.widgets, tuple)
+    self.assertIsInstance(section.widgets[1].buttons[0].color, frozen.Frozen)
+
+  def test_cannot_change(self) -> None:
+    card = _card().freeze()
+
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      card.name = 'Fezzik'
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      card.card_id = 'fezzik'
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      card.sections[0].widgets[0].text = 'Vizzini'
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      del card.header
+    with self.assertRaises(AttributeError):
+      card.sections[0].add_widget(DecoratedText(text='Vizzini'))
+
+  def test_copy_is_independent(self) -> None:
+    card = _card()
+    frozen_card = card.freeze()
+
+    card.sections[0].widgets[0].text = 'Vizzini'
+
+    self.assertEqual('Inigo Montoya', frozen_card.sections[0].widgets[0].text)
+
+  def test_hash_and_equality(self) -> None:
+    first, second = _footer().freeze(), _footer().freeze()
+    other = _footer()
+    other.buttons[0].text = 'Inconceivable!'
+    other = other.freeze()
+
+    self.assertEqual(first, second)
+    self.assertEqual(hash(first), hash(second))
+    self.assertNotEqual(first, other)
+    self.assertNotEqual(first, _footer())
+    self.assertEqual({first: 'footer'}, {second: 'footer'})
+    self.assertEqual(first.__dict__[frozen._HASH], hash(first))
+
+  def test_render_is_cached(self) -> None:
+    card = _card().freeze()
+
+    self.assertIs(card.render(), card.render())
+
+  def test_shared_subtree(self) -> None:
+    footer = _footer().freeze()
+    cards = [Card(sections=[Section(header=str(i), widgets=[footer])])
+             for i in range(3)]
+
+    Renderable.__CACHE_RENDER__ = True
+    self.addCleanup(setattr, Renderable, '__CACHE_RENDER__', False)
+    renders = [card.render() for card in cards]
+
+    self.assertIs(renders[0]['card']['sections'][0]['widgets'][0],
+                  renders[2]['card']['sections'][0]['widgets'][0])
+    # Frozen objects never change, so they don't track their parents.
+    self.assertEqual([], tracking.state(footer).parents)
+
+  def test_threads(self) -> None:
+    card = _card().freeze()
+    renders = []
+    threads = [threading.Thread(target=lambda: renders.append(card.render_json()))
+               for _ in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual({_card().render_json()}, set(renders))
+
+  def test_copies(self) -> None:
+    card = _card().freeze()
+    card.render()
+    restored = pickle.loads(pickle.dumps(card))
+
+    self.assertIs(card, copy.copy(card))
+    self.assertIs(card, copy.deepcopy(card))
+    self.assertEqual(card, restored)
+    self.assertIs(type(card), type(restored))
+    self.assertNotIn(tracking.STATE, restored.__dict__)
+
+  def test_freeze_is_idempotent(self) -> None:
+    card = _card().freeze()
+
+    self.assertIs(card, frozen.freeze(card))
+    self.assertIs(frozen.frozen_class(Card), frozen.frozen_class(Card))
+
+  def test_tag_override(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__TAG_OVERRIDE__ = 'pushCard'
+
+    self.assertEqual({'pushCard': {'sections': [{'header': 'Florin'}]}},
+                     card.freeze().render())
+
+  def test_validation_is_run(self) -> None:
+    with self.assertRaises(ValueError):
+      frozen.freeze(Icon()).to_dict()
+
+  def test_values(self) -> None:
+    self.assertEqual(('a', ('b',)), frozen.freeze(['a', ['b']]))
+    self.assertEqual(frozenset(['a']), frozen.freeze({'a'}))
+    with self.assertRaises(TypeError):
+      frozen.freeze({'six': 'fingers'})['six'] = 'toes'
+    self.assertIs(HorizontalAlignment.END,
+                  frozen.freeze(HorizontalAlignment.END))
@@ -0,0 +1,184 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Lazily decoded views of dataclasses.
+
+`from_dict` builds every nested object of a Chat event up front, although
+most handlers only read a few fields (`message.text`, `message.sender.name`,
+`message.space.name`...). A lazy class is a subclass of a dataclass whose
+`from_dict` keeps the dictionary instead, and decodes each field, with the
+same rules as `from_dict`, the first time it is read. The decoded value is
+then kept on the instance, so reading it again costs no more than reading
+any other attribute.
+
+A lazy object is an instance of the original class with the same attributes,
+compares equal to the eagerly decoded object and can be rendered, frozen,
+compacted, copied and pickled. Anything which needs every field (`render`,
+`==`, `freeze`...) decodes every field.
+
+Fields are set without calling `__init__` or `__setattr__`, so a lazy class
+can't be made from a dataclass with a `__post_init__`.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Dict, Mapping, Optional, Tuple, Type, TypeVar
+
+from card_framework import codec
+
+T = TypeVar('T')
+
+# The instance attribute the dictionary (and `infer_missing`) is kept in
+# until every field has been decoded.
+SOURCE = '__lazy_source__'
+
+_CLASSES: Dict[type, type] = {}
+_REQUIRED: Dict[type, Tuple[str, ...]] = {}
+
+
+class LazyField(object):
+  """A field of a lazy class, decoded from the dictionary when first read.
+
+  This is a non-data descriptor: once the value is stored on the instance
+  (or the field is set), the instance attribute is used instead.
+  """
+  __slots__ = ('name', 'decode', 'default')
+
+  def __init__(self, cls: type, field: dataclasses.Field) -> None:
+    self.name = field.name
+    self.decode = codec.compile_field_decoder(cls, field.name)
+    self.default = field.default
+
+  def __get__(self, obj: Any, cls: Optional[type] = None) -> Any:
+    if obj is None:
+      # As for a dataclass, the class attribute is the default.
+      if self.default is dataclasses.MISSING:
+        raise AttributeError(self.name)
+      return self.default
+
+    (kvs, infer_missing) = obj.__dict__[SOURCE]
+    value = obj.__dict__[self.name] = self.decode(kvs, infer_missing)
+    return value
+
+
+def lazy_class(cls: Type[T]) -> Type[T]:
+  """Returns the lazy variant of a dataclass, creating it if needed.
+
+  Args:
+      cls (Type[T]): the dataclass
+
+  Raises:
+      TypeError: if the dataclass has a `__post_init__`
+
+  Returns:
+      Type[T]: the lazy subclass of `cls`, named `Lazy` followed by the name
+        of `cls`
+  """
+  if getattr(cls, '__LAZY__', False):
+    return cls
+
+  try:
+    return _CLASSES[cls]
+  except KeyError:
+    pass
+
+  if hasattr(cls, '__post_init__'):
+    raise TypeError(f'{cls.__name__} has a __post_init__, which a lazy '
+                    'class would never call.')
+
+  names = tuple(f.name for f in dataclasses.fields(cls))
+
+  def __eq__(self, other: Any) -> bool:
+    # The dataclass `__eq__` only compares objects of exactly the same class.
+    if self is other:
+      return True
+    if not isinstance(other, cls):
+      return NotImplemented
+    return (tuple(getattr(self, name) for name in names) ==
+            tuple(getattr(other, name) for name in names))
+
+  name = f'Lazy{cls.__name__}'
+  (outer, _, _) = cls.__qualname__.rpartition('.')
+  namespace = {
+      '__LAZY__': True,
+      '__module__': cls.__module__,
+      '__qualname__': f'{outer}.{name}' if outer else name,
+      '__doc__': f'A lazily decoded `{cls.__name__}`; see `card_framework.lazy`.',
+      '__eq__': __eq__,
+      'from_dict': classmethod(_from_dict),
+  }
+  for field in dataclasses.fields(cls):
+    namespace[field.name] = LazyField(cls, field)
+
+  result = _CLASSES[cls] = type(cls)(name, (cls,), namespace)
+  _REQUIRED[result] = tuple(
+      f.name for f in dataclasses.fields(cls)
+      if f.init and f.default is dataclasses.MISSING and
+      f.default_factory is dataclasses.MISSING)
+  return result
+
+
+def view(cls: Type[T], kvs: Mapping[str, Any],
+         infer_missing: bool = False) -> T:
+  """Wraps a dictionary in a lazy view of a dataclass.
+
+  Args:
+      cls (Type[T]): the dataclass, or its lazy class
+      kvs (Mapping[str, Any]): the dictionary, which must not be changed
+        while the view is in use
+      infer_missing (bool, optional): see `from_dict`. Defaults to False.
+
+  Raises:
+      TypeError: if a field without a default is missing
+
+  Returns:
+      T: the view
+  """
+  lazy = lazy_class(cls)
+  if isinstance(kvs, cls):
+    return kvs
+
+  if kvs is None and infer_missing:
+    kvs = {}
+
+  obj = object.__new__(lazy)
+  obj.__dict__[SOURCE] = (kvs, infer_missing)
+  for name in _REQUIRED[lazy]:
+    # Decoded now, as the constructor would have reported it missing.
+    if getattr(obj, name) is dataclasses.MISSING:
+      raise TypeError(f'{cls.__name__} is missing the required field '
+                      f'{name!r}.')
+  return obj
+
+
+def materialize(obj: T) -> T:
+  """Decodes every field of a lazy object which hasn't been read yet.
+
+  Afterwards the object no longer refers to the dictionary.
+
+  Args:
+      obj (T): the lazy object (anything else is left alone)
+
+  Returns:
+      T: the same object
+  """
+  state = getattr(obj, '__dict__', {})
+  if SOURCE in state:
+    for name in type(obj).__dataclass_fields__:
+      getattr(obj, name)
+    del state[SOURCE]
+  return obj
+
+
+def _from_dict(cls: type, kvs: Any, *, infer_missing: bool = False) -> Any:
+  return view(cls, kvs, infer_missing)
@@ -0,0 +1,114 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import copy
+import dataclasses
+import json
+import pickle
+import unittest
+
+from card_framework import fixtures_test as fixtures
+from card_framework import codec, lazy, standard_field, transfer
+from card_framework.v2.message import LazyMessage, Message
+
+
+@codec.dataclass_json
+@dataclasses.dataclass
+class Sword(object):
+  maker: str
+  six_fingers: bool = standard_field()
+
+
+@dataclasses.dataclass
+class Giant(object):
+  name: str = standard_field()
+
+  def __post_init__(self) -> None:
+    self.name = self.name or 'Fezzik'
+
+
+class LazyTest(unittest.TestCase):
+  def test_decodes_only_what_is_read(self) -> None:
+    message = LazyMessage.from_dict(fixtures.event_message())
+
+    self.assertEqual('users/0', message.sender.name)
+    self.assertEqual('spaces/AAAA', message.space.name)
+    self.assertEqual({lazy.SOURCE, 'sender', 'space'}, set(vars(message)))
+
+  def test_same_as_eager(self) -> None:
+    eager = Message.from_dict(fixtures.event_message())
+    message = LazyMessage.from_dict(fixtures.event_message())
+
+    self.assertIsInstance(message, Message)
+    for field in dataclasses.fields(Message):
+      with self.subTest(field.name):
+        self.assertEqual(getattr(eager, field.name),
+                         getattr(message, field.name))
+    self.assertEqual(eager, message)
+    self.assertEqual(message, eager)
+    self.assertNotEqual(message, Message(text='Inconceivable!'))
+
+  def test_values_are_kept(self) -> None:
+    message = LazyMessage.from_dict(fixtures.event_message())
+
+    self.assertIs(message.sender, message.sender)
+    self.assertIs(message.annotations, message.annotations)
+
+  def test_set_before_read(self) -> None:
+    message = LazyMessage.from_dict(fixtures.event_message())
+    message.text = 'As you wish'
+
+    self.assertEqual('As you wish', message.text)
+
+  def test_render(self) -> None:
+    self.assertEqual(Message.from_dict(fixtures.event_message()).render(),
+                     LazyMessage.from_dict(fixtures.event_message()).render())
+
+  def test_from_json(self) -> None:
+    message = LazyMessage.from_json(json.dumps(fixtures.event_message()))
+
+    self.assertIsInstance(message, LazyMessage)
+    self.assertEqual('@Fezzik /duel Prepare to die.', message.text)
+
+  def test_materialize(self) -> None:
+    message = lazy.materialize(LazyMessage.from_dict(fixtures.event_message()))
+
+    self.assertNotIn(lazy.SOURCE, vars(message))
+    self.assertEqual(Message.from_dict(fixtures.event_message()), message)
+
+  def test_copies(self) -> None:
+    eager = Message.from_dict(fixtures.event_message())
+
+    for copier in [copy.copy, copy.deepcopy,
+                   lambda m: pickle.loads(pickle.dumps(m)),
+                   lambda m: transfer.unpack(transfer.pack(m)),
+                   lambda m: m.freeze()]:
+      with self.subTest(copier):
+        self.assertEqual(
+            eager.render(),
+            copier(LazyMessage.from_dict(fixtures.event_message())).render())
+
+  def test_required_fields(self) -> None:
+    with self.assertRaises(TypeError):
+      lazy.view(Sword, {'sixFingers': True})
+    self.assertIsNone(lazy.view(Sword, {}, infer_missing=True).maker)
+    self.assertEqual('Domingo', lazy.view(Sword, {'maker': 'Domingo'}).maker)
+
+  def test_lazy_class(self) -> None:
+    self.assertIs(LazyMessage, lazy.lazy_class(Message))
+    self.assertIs(LazyMessage, lazy.lazy_class(LazyMessage))
+    self.assertEqual('LazyMessage', LazyMessage.__qualname__)
+    with self.assertRaises(TypeError):
+      lazy.lazy_class(Giant)
@@ -0,0 +1,142 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Rendering large batches over a pool of processes.
+
+`render_parallel` splits a batch into chunks, renders each chunk in a worker
+process with `render_many` and yields the results in their original order.
+
+The objects have to be sent to the workers, and that costs about as much as
+rendering them: even in the compact `card_framework.transfer` format, packing
+and pickling a tree takes roughly as long as rendering it. Rendering objects
+built in the parent process is therefore limited by the parent, however many
+workers there are. To scale with the number of cores, pass a `build`
+function instead: only its (small) inputs are sent, and the objects are built
+and rendered in the workers.
+
+Rendering to JSON (`as_json` or a `backend`) also makes the results much
+cheaper to send back than the rendered dictionaries.
+"""
+from __future__ import annotations
+
+import collections
+import concurrent.futures
+import os
+from typing import (Any, Callable, Deque, Iterable, Iterator, List, Mapping,
+                    Optional, Union)
+
+from card_framework import backends, transfer
+from card_framework.batch import render_many
+
+Result = Union[Mapping[str, Any], bytes]
+
+
+def render_parallel(
+    objects: Iterable[Any], as_json: bool = False,
+    backend: Union[str, backends.JsonBackend, None] = None,
+    build: Optional[Callable[[Any], Any]] = None,
+    chunk_size: int = 256, max_workers: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None
+) -> Iterator[Result]:
+  """Renders a batch of objects over a pool of processes.
+
+  ```
+  def notification(user_id: str) -> Message:
+    ...
+
+  for rendered in render_parallel(user_ids, build=notification,
+                                  backend='auto'):
+    send(rendered)
+  ```
+
+  Args:
+      objects (Iterable[Any]): the `Renderable`s, or the inputs to `build`;
+        this is consumed a few chunks ahead of the results
+      as_json (bool, optional): as for `render_many`. Defaults to False.
+      backend (Union[str, backends.JsonBackend, None], optional): as for
+        `render_many`; this must be a name, not an instance. Defaults to None.
+      build (Optional[Callable[[Any], Any]], optional): a function, run in the
+        workers, that builds each `Renderable` from an entry of `objects`; it
+        must be picklable (a module level function, say). Defaults to None.
+      chunk_size (int, optional): the number of objects rendered per task.
+        Defaults to 256.
+      max_workers (Optional[int], optional): the number of processes in the
+        pool (or in `executor`, to know how far ahead to read). Defaults to
+        the number of CPUs.
+      executor (Optional[concurrent.futures.Executor], optional): a pool to
+        use instead of creating one; it is not shut down afterwards.
+        Defaults to None.
+
+  Raises:
+      ValueError: if `chunk_size` is less than 1, when iteration starts
+
+  Yields:
+      Result: the rendered objects, in order
+  """
+  if chunk_size < 1:
+    raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+
+  max_workers = max_workers or os.cpu_count() or 1
+  if executor is None:
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as pool:
+      yield from _render(pool, max_workers, objects, as_json, backend, build,
+                         chunk_size)
+  else:
+    yield from _render(executor, max_workers, objects, as_json, backend, build,
+                       chunk_size)
+
+
+def _render(executor: concurrent.futures.Executor, workers: int,
+            objects: Iterable[Any], as_json: bool,
+            backend: Union[str, backends.JsonBackend, None],
+            build: Optional[Callable[[Any], Any]],
+            chunk_size: int) -> Iterator[Result]:
+  # Keep every worker busy, with one chunk each waiting, without reading the
+  # whole batch up front as `Executor.map` does.
+  pending: Deque[concurrent.futures.Future] = collections.deque()
+  chunk = []
+  for obj in objects:
+    chunk.append(obj)
+    if len(chunk) == chunk_size:
+      pending.append(executor.submit(
+          render_chunk, chunk if build else transfer.pack(chunk), as_json,
+          backend, build))
+      chunk = []
+      if len(pending) >= 2 * workers:
+        yield from pending.popleft().result()
+
+  if chunk:
+    pending.append(executor.submit(
+        render_chunk, chunk if build else transfer.pack(chunk), as_json,
+        backend, build))
+  while pending:
+    yield from pending.popleft().result()
+
+
+def render_chunk(chunk: List[Any], as_json: bool,
+                 backend: Union[str, backends.JsonBackend, None],
+                 build: Optional[Callable[[Any], Any]]) -> List[Result]:
+  """Renders one chunk of a batch, in a worker.
+
+  Args:
+      chunk (List[Any]): the packed objects, or the inputs to `build`
+      as_json (bool): as for `render_many`
+      backend (Union[str, backends.JsonBackend, None]): as for `render_many`
+      build (Optional[Callable[[Any], Any]]): the function building each
+        object, if any
+
+  Returns:
+      List[Result]: the rendered objects
+  """
+  objects = map(build, chunk) if build else transfer.unpack(chunk)
+  return list(render_many(objects, as_json=as_json, backend=backend))
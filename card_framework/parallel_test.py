@@ -0,0 +1,71 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import unittest
+
+from card_framework import render_parallel
+from card_framework.v2.message import Message
+
+
+def _message(i: int) -> Message:
+  return Message(text=f'Hello, my name is Inigo Montoya ({i})')
+
+
+class RenderParallelTest(unittest.TestCase):
+  def setUp(self) -> None:
+    self.executor = concurrent.futures.ThreadPoolExecutor(2)
+    self.addCleanup(self.executor.shutdown)
+
+  def test_in_order(self) -> None:
+    messages = [_message(i) for i in range(25)]
+
+    self.assertEqual([m.render() for m in messages],
+                     list(render_parallel(messages, chunk_size=4,
+                                          max_workers=2,
+                                          executor=self.executor)))
+
+  def test_json(self) -> None:
+    messages = [_message(i) for i in range(10)]
+
+    self.assertEqual([json.dumps(m.render()).encode('utf-8') for m in messages],
+                     list(render_parallel(messages, as_json=True, chunk_size=3,
+                                          executor=self.executor)))
+    self.assertEqual([m.render_json(backend='json') for m in messages],
+                     list(render_parallel(messages, backend='json',
+                                          executor=self.executor)))
+
+  def test_build(self) -> None:
+    self.assertEqual([_message(i).render() for i in range(10)],
+                     list(render_parallel(range(10), build=_message,
+                                          chunk_size=3,
+                                          executor=self.executor)))
+
+  def test_empty(self) -> None:
+    self.assertEqual([], list(render_parallel([], executor=self.executor)))
+
+  def test_chunk_size(self) -> None:
+    for chunk_size in [0, -1]:
+      with self.subTest(chunk_size=chunk_size):
+        with self.assertRaises(ValueError):
+          list(render_parallel([_message(0)], chunk_size=chunk_size,
+                               executor=self.executor))
+
+  def test_process_pool(self) -> None:
+    self.assertEqual([_message(i).render_json() for i in range(50)],
+                     list(render_parallel(range(50), build=_message,
+                                          as_json=True, chunk_size=10,
+                                          max_workers=2)))
@@ -0,0 +1,469 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Direct-to-JSON serialization.
+
+`render_json` and `write_json` produce exactly the bytes of
+`json.dumps(obj.render())`, but without building the intermediate dictionary
+tree: each class gets a compiled writer (the counterpart of its render plan in
+`card_framework.compiler`) which appends JSON text straight to an `Output`.
+
+Anything a writer doesn't specialise (custom encoders, raw mappings and so on)
+is encoded by `json.dumps` itself, so the output is always identical.
+
+Both functions can instead hand the rendered tree to one of the encoders in
+`card_framework.backends`, which produce compact JSON.
+"""
+from __future__ import annotations
+
+import json
+import keyword
+from json.encoder import encode_basestring_ascii
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from card_framework import backends, compiler
+
+Writer = Callable[[Any, 'Output'], bool]
+
+# Number of output fragments joined and written in one go by `write_json`.
+_CHUNK = 4096
+
+_WRITERS: Dict[type, Writer] = {}
+_TO_DICT_WRITERS: Dict[type, Writer] = {}
+_ITEMS: Dict[type, Writer] = {}
+_RENDER_WRITERS: Dict[type, Writer] = {}
+
+
+class Output(list):
+  """The JSON fragments a writer has written, in order.
+
+  Writers only ever use four things on their output, so anything which
+  implements them can be written to instead (`card_framework.sizing` has an
+  output which only adds up the fragments' lengths, for instance):
+    * `append(fragment)`, to write a fragment,
+    * `len(out)`, the position reached so far,
+    * `del out[position:]`, to take back everything written since a
+      position (a value which turned out to be empty), and
+    * `out.write_items(values)`, to write a `list_field`.
+  """
+  __slots__ = ()
+
+  def write_items(self, values: Iterable[Any]) -> None:
+    """Writes `compiler.encode_list(values)`."""
+    write_items(values, self)
+
+
+def render_json(obj: Any,
+                backend: Union[str, backends.JsonBackend, None] = None) -> bytes:
+  """Renders an object straight to JSON.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `CardWithId`,
+        `ActionResponse`...) or any other dataclass
+      backend (Union[str, backends.JsonBackend, None], optional): if set, the
+        rendered tree is encoded with this backend (see
+        `backends.get_backend`; 'auto' picks the fastest installed) instead.
+        Defaults to None.
+
+  Returns:
+      bytes: the UTF-8 encoded `json.dumps(obj.render())`, or the backend's
+        compact JSON
+  """
+  if backend:
+    return backends.dumps(_render(obj), backend)
+  return ''.join(_write(obj, Output())).encode('utf-8')
+
+
+def write_json(obj: Any, fp: Union[Any, bytearray],
+               backend: Union[str, backends.JsonBackend, None] = None) -> int:
+  """Renders an object as JSON into a binary file or a `bytearray`.
+
+  Args:
+      obj (Any): a `Renderable` or any other dataclass
+      fp (Union[Any, bytearray]): a binary file-like object with a `write`
+        method, or a `bytearray` to extend
+      backend (Union[str, backends.JsonBackend, None], optional): as for
+        `render_json`. Defaults to None.
+
+  Returns:
+      int: the number of bytes written
+  """
+  write = fp.extend if isinstance(fp, bytearray) else fp.write
+  if backend:
+    data = backends.dumps(_render(obj), backend)
+    write(data)
+    return len(data)
+
+  out = _write(obj, Output())
+  written = 0
+  for i in range(0, len(out), _CHUNK):
+    chunk = ''.join(out[i:i + _CHUNK]).encode('utf-8')
+    write(chunk)
+    written += len(chunk)
+
+  return written
+
+
+def _render(obj: Any) -> Any:
+  if callable(getattr(obj, 'render', None)):
+    return obj.render()
+  return compiler.to_dict(obj)
+
+
+def _write(obj: Any, out: Output) -> Output:
+  from card_framework import Renderable
+
+  if getattr(obj.__class__, 'render', None) is Renderable.render:
+    write_render(obj, out)
+  elif callable(getattr(obj, 'render', None)):
+    write_value(obj.render(), out)
+  else:
+    write_to_dict(obj, out)
+  return out
+
+
+def write_value(value: Any, out: Output) -> None:
+  """Writes a value that is already in its rendered form."""
+  cls = type(value)
+  if cls is str:
+    out.append(encode_basestring_ascii(value))
+  elif cls is int:
+    out.append(int.__repr__(value))
+  elif value is None:
+    out.append('null')
+  elif cls is bool:
+    out.append('true' if value else 'false')
+  else:
+    out.append(json.dumps(value))
+
+
+def write_encoded(value: Any, out: Output) -> bool:
+  """Writes `compiler.encode(value)`.
+
+  Args:
+      value (Any): the raw field value
+      out (Output): the output
+
+  Returns:
+      bool: whether the encoded value is truthy (the default `exclude` test)
+  """
+  cls = type(value)
+  if cls is str:
+    out.append(encode_basestring_ascii(value))
+    return value != ''
+
+  if hasattr(cls, '__dataclass_fields__'):
+    return writer(cls)(value, out)
+
+  if cls is list or cls is tuple:
+    if not value:
+      out.append('[]')
+      return False
+    out.append('[')
+    write_encoded(value[0], out)
+    for v in value[1:]:
+      out.append(', ')
+      write_encoded(v, out)
+    out.append(']')
+    return True
+
+  if cls in compiler._ATOMIC:
+    write_value(value, out)
+    return bool(value)
+
+  encoded = compiler.encode(value)
+  write_value(encoded, out)
+  return bool(encoded)
+
+
+def write_items(values: Any, out: Output) -> None:
+  """Writes `compiler.encode_list(values)`, as `Output.write_items` does.
+
+  Outputs which write lists differently can still call this for the usual
+  behaviour.
+  """
+  if (write := getattr(type(values), '__write_items__', None)) is not None:
+    # A container which writes (and can keep) its own entries' JSON, such as
+    # `SelectionItemColumns`.
+    return write(values, out)
+
+  out.append('[')
+  first = True
+  for f in values:
+    if not first:
+      out.append(', ')
+    first = False
+    try:
+      _ITEMS[type(f)](f, out)
+    except KeyError:
+      item = _ITEMS[type(f)] = _compile_item(type(f))
+      item(f, out)
+  out.append(']')
+
+
+def write_item(f: Any, out: Output) -> None:
+  """Writes one entry of `compiler.encode_list`."""
+  try:
+    _ITEMS[type(f)](f, out)
+  except KeyError:
+    item = _ITEMS[type(f)] = _compile_item(type(f))
+    item(f, out)
+
+
+def _compile_item(cls: type) -> Writer:
+  """The streaming counterpart of `compiler._compile_item`."""
+  from card_framework import Renderable
+
+  def unless_empty(write: Writer) -> Writer:
+    # An item that renders to an empty dict is used as is, as in
+    # `compiler.encode_list`.
+    def item(f: Any, out: Output) -> None:
+      mark = len(out)
+      if not write(f, out):
+        del out[mark:]
+        write_value(f, out)
+    return item
+
+  names = getattr(cls, '__dataclass_fields__', {})
+  if 'render' not in names and 'to_dict' not in names:
+    if (m := getattr(cls, 'render', None)) and callable(m):
+      if m is Renderable.render:
+        return unless_empty(write_render)
+    elif (m := getattr(cls, 'to_dict', None)) and callable(m):
+      if compiler.is_mixin_to_dict(m):
+        return unless_empty(writer(cls))
+    elif cls in compiler._ATOMIC:
+      return lambda f, out: write_value(f, out)
+
+  return lambda f, out: write_value(compiler._encode_item(f), out)
+
+
+def write_render(obj: Any, out: Output) -> bool:
+  """Writes `obj.render()` for a `Renderable`.
+
+  Args:
+      obj (Any): the `Renderable`
+      out (Output): the output
+
+  Returns:
+      bool: whether anything other than `{}` was written
+  """
+  try:
+    return _RENDER_WRITERS[type(obj)](obj, out)
+  except KeyError:
+    write = _RENDER_WRITERS[type(obj)] = render_writer(type(obj))
+    return write(obj, out)
+
+
+def render_writer(cls: type) -> Writer:
+  """Works out once per class how to write `render()` for a `Renderable`.
+
+  The tag and property names are encoded up front. The `__CACHE_RENDER__`,
+  `__SUPPRESS_TAG__` and `__TAG_OVERRIDE__` settings are still read from each
+  object, as they can be changed on classes and instances at any time.
+
+  Args:
+      cls (type): the `Renderable` class
+
+  Returns:
+      Writer: the writer
+  """
+  metadata = compiler.render_metadata(cls)
+  names = {name for (name, _) in metadata.properties}
+  properties = [(f', {encode_basestring_ascii(name)}: ', fget)
+                for (name, fget) in metadata.properties]
+  opening = '{' + encode_basestring_ascii(metadata.tag) + ': '
+
+  def write(obj: Any, out: Output) -> bool:
+    if obj.__CACHE_RENDER__:
+      rendered = obj.render()
+      write_value(rendered, out)
+      return bool(rendered)
+
+    if getattr(obj, '__SUPPRESS_TAG__', metadata.suppress_tag):
+      return write_to_dict(obj, out)
+
+    if tag := getattr(obj, '__TAG_OVERRIDE__', False):
+      if tag in names:
+        # The property would replace the body; leave that to `json.dumps`.
+        write_value(obj.render(), out)
+        return True
+      out.append('{' + encode_basestring_ascii(tag) + ': ')
+    elif metadata.tag in names:
+      write_value(obj.render(), out)
+      return True
+    else:
+      out.append(opening)
+
+    write_to_dict(obj, out)
+    for (key, fget) in properties:
+      if value := fget(obj):
+        out.append(key)
+        write_value(value, out)
+    out.append('}')
+    return True
+
+  return write
+
+
+def write_to_dict(obj: Any, out: Output) -> bool:
+  """Writes `obj.to_dict()`, calling any `to_dict` override.
+
+  Args:
+      obj (Any): the dataclass
+      out (Output): the output
+
+  Returns:
+      bool: whether anything other than `{}` was written
+  """
+  try:
+    return _TO_DICT_WRITERS[type(obj)](obj, out)
+  except KeyError:
+    cls = type(obj)
+    if compiler.is_mixin_to_dict(cls.to_dict):
+      _TO_DICT_WRITERS[cls] = writer(cls)
+    else:
+      _TO_DICT_WRITERS[cls] = _write_dict(cls.to_dict)
+    return _TO_DICT_WRITERS[cls](obj, out)
+
+
+def _write_dict(to_dict: Callable[[Any], Dict[str, Any]]) -> Writer:
+  def write(obj: Any, out: Output) -> bool:
+    value = to_dict(obj)
+    write_value(value, out)
+    return bool(value)
+  return write
+
+
+def writer(cls: type) -> Writer:
+  """Returns the compiled writer for a dataclass, compiling if needed.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Writer: a function writing the JSON for `compiler.plan(cls)(obj)`
+  """
+  try:
+    return _WRITERS[cls]
+  except KeyError:
+    compiled = _WRITERS[cls] = compile_writer(cls)
+    return compiled
+
+
+def compile_writer(cls: type) -> Writer:
+  """Generates the writer for a dataclass.
+
+  This follows `compiler.compile_plan` field by field, appending JSON text
+  instead of building a dictionary.
+
+  Args:
+      cls (type): the dataclass
+
+  Returns:
+      Writer: a function writing the JSON for `compiler.plan(cls)(obj)`
+  """
+  config = getattr(cls, 'dataclass_json_config', None) or {}
+  overrides = compiler.field_overrides(cls)
+  keys = [(o['letter_case'](name) if o.get('letter_case') is not None
+           else name) for (name, o) in overrides.items()]
+  plain = (getattr(config.get('undefined'), 'value', None) is None
+           and all(isinstance(k, str) for k in keys)
+           and len(set(keys)) == len(keys))
+  if not plain:
+    return _write_dict(compiler.plan(cls))
+
+  namespace = {
+      '_encode': compiler.encode,
+      '_str': encode_basestring_ascii,
+      '_value': write_value,
+      '_encoded': write_encoded,
+  }
+  lines = ['def write(obj, out):', '  first = True', "  out.append('{')"]
+
+  for i, ((name, override), key) in enumerate(zip(overrides.items(), keys)):
+    lines.extend(_field_writer(i, name, key, override, namespace))
+
+  lines.extend(["  out.append('}')", '  return not first'])
+  exec('\n'.join(lines), namespace)
+  compiled = namespace['write']
+  compiled.__qualname__ = f'writer<{cls.__qualname__}>'
+  return compiled
+
+
+def _field_writer(i: int, name: str, key: str, override: Dict[str, Any],
+                  namespace: Dict[str, Any]) -> List[str]:
+  """The lines of a writer which write one field, adding what they refer to
+  to `namespace`."""
+  key = encode_basestring_ascii(key) + ': '
+  namespace[f'_key{i}'] = (', ' + key, key)
+  emit = f'out.append(_key{i}[first])'
+
+  if name.isidentifier() and not keyword.iskeyword(name):
+    lines = [f'  v = obj.{name}']
+  else:
+    lines = [f'  v = getattr(obj, {name!r})']
+
+  exclude = override.get('exclude')
+  encoder = override.get('encoder')
+  condition = _writer_condition(i, exclude, namespace)
+  if not encoder:
+    return lines + _unencoded_writer(emit, exclude, condition)
+
+  write = _encoded_write(i, encoder, exclude, namespace)
+  if condition:
+    lines.extend([f'  {condition}',
+                  f'    {emit}; {write}; first = False'])
+  else:
+    lines.append(f'  {emit}; {write}; first = False')
+  return lines
+
+
+def _writer_condition(i: int, exclude: Optional[Callable[[Any], bool]],
+                      namespace: Dict[str, Any]) -> Optional[str]:
+  if exclude is compiler.exclude_unset:
+    return 'if v:'
+  if exclude:
+    namespace[f'_exclude{i}'] = exclude
+    return f'if not _exclude{i}(v):'
+  return None
+
+
+def _unencoded_writer(emit: str, exclude: Optional[Callable[[Any], bool]],
+                      condition: Optional[str]) -> List[str]:
+  """Writes a field without an encoder, which is converted before `exclude`
+  sees it."""
+  if exclude is compiler.exclude_unset:
+    return ['  if v is not None:',
+            '    mark = len(out)',
+            f'    {emit}',
+            '    if _encoded(v, out): first = False',
+            '    else: del out[mark:]']
+  if condition:
+    return ['  v = _encode(v)',
+            f'  {condition}',
+            f'    {emit}; _value(v, out); first = False']
+  return [f'  {emit}; _encoded(v, out); first = False']
+
+
+def _encoded_write(i: int, encoder: Callable[[Any], Any],
+                   exclude: Optional[Callable[[Any], bool]],
+                   namespace: Dict[str, Any]) -> str:
+  if encoder is compiler.encode_enum:
+    if exclude is compiler.exclude_unset:
+      return 'out.append(_str(v.name))'
+    return "out.append(_str(v.name) if v else 'null')"
+  if encoder is compiler.encode_list:
+    return 'out.write_items(v)'
+  namespace[f'_encoder{i}'] = encoder
+  return f'_value(_encoder{i}(v), out)'
@@ -0,0 +1,139 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import io
+import json
+import unittest
+
+from card_framework import serializer
+from card_framework.v2.action_response import ActionResponse
+from card_framework.v2.card import Card, CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.enums import HorizontalAlignment, ImageType
+from card_framework.v2.message import Message, Thread
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.action import Action, ActionParameter
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.color import Color
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.grid import Grid, GridItem, ImageComponent
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import SelectionItem
+
+
+def _message() -> Message:
+  text = DecoratedText(top_label='Inigo Montoya',
+                       text='You killed my father. "Prepare" to die. ¡Olé!',
+                       wrap_text=True,
+                       start_icon=Icon(known_icon=Icon.KnownIcon.PERSON),
+                       button=Button(text='Hello', on_click=OnClick(
+                           action=Action(function='hello', parameters=[
+                               ActionParameter(key='six', value='fingers')]))))
+  text.horizontal_alignment = HorizontalAlignment.END
+  card = CardWithId(
+      header=CardHeader(title='Princess Bride', image_url='https://pb',
+                        image_type=ImageType.SQUARE),
+      sections=[
+          Section(header='Florin', widgets=[
+              text,
+              ButtonList(buttons=[
+                  Button(text='As you wish', color=Color(red=0.5, blue=1.0)),
+                  Button(text='Inconceivable!', type_=Button.Type.FILLED)]),
+              Grid(title='Guilder', column_count=2, items=[
+                  GridItem(id='1', image=ImageComponent(image_uri='https://1')),
+                  GridItem(id='2', title='Fezzik')]),
+              SelectionInput(name='hand', type=SelectionInput.SelectionType.RADIO_BUTTON,
+                             items=[SelectionItem(text='left', value='l'),
+                                    SelectionItem(text='right', value='r',
+                                                  selected=True)]),
+          ]),
+          Section(collapsible=True, uncollapsible_widgets_count=1, widgets=[
+              DecoratedText(text='Vizzini')]),
+      ])
+  card.card_id = 'vizzini'
+  return Message(text='As you wish', thread=Thread(name='spaces/florin'),
+                 cards_v2=[card])
+
+
+class SerializerTest(unittest.TestCase):
+  def assertSameJson(self, obj) -> None:
+    self.assertEqual(json.dumps(obj.render()).encode('utf-8'),
+                     obj.render_json())
+
+  def test_message(self) -> None:
+    self.assertSameJson(_message())
+
+  def test_empty_message(self) -> None:
+    self.assertEqual(b'{}', Message().render_json())
+
+  def test_cards(self) -> None:
+    card = _message().cards_v2[0]
+
+    self.assertSameJson(card)
+    self.assertSameJson(card.card())
+
+  def test_tag_override(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__TAG_OVERRIDE__ = 'pushCard'
+
+    self.assertEqual(b'{"pushCard": {"sections": [{"header": "Florin"}]}}',
+                     card.render_json())
+
+  def test_widgets(self) -> None:
+    for section in _message().cards_v2[0].sections:
+      self.assertSameJson(section)
+      for widget in section.widgets:
+        self.assertSameJson(widget)
+
+  def test_action_response(self) -> None:
+    self.assertSameJson(ActionResponse(
+        type=ActionResponse.ResponseType.NEW_MESSAGE,
+        url='https://www.imdb.com/title/tt0093779/'))
+
+  def test_write_json_file(self) -> None:
+    message = _message()
+    fp = io.BytesIO()
+
+    written = message.write_json(fp)
+
+    self.assertEqual(json.dumps(message.render()).encode('utf-8'),
+                     fp.getvalue())
+    self.assertEqual(len(fp.getvalue()), written)
+
+  def test_write_json_bytearray(self) -> None:
+    message = _message()
+    buffer = bytearray(b'>')
+
+    serializer.write_json(message, buffer)
+
+    self.assertEqual(b'>' + json.dumps(message.render()).encode('utf-8'),
+                     buffer)
+
+  def test_validation_is_run(self) -> None:
+    with self.assertRaises(ValueError):
+      serializer.render_json(Icon())
+
+  def test_unserializable_is_unserializable(self) -> None:
+    # An empty section is rendered as the `Section` object itself, which
+    # `json.dumps` cannot handle.
+    card = Card(sections=[Section()])
+
+    with self.assertRaises(TypeError):
+      json.dumps(card.render())
+    with self.assertRaises(TypeError):
+      card.render_json()
@@ -0,0 +1,203 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Measuring rendered JSON without building it.
+
+`size` returns the length in bytes of `obj.render_json()` (the default
+encoding, `json.dumps(obj.render())`) by running the same compiled writers
+as `card_framework.serializer`, without building the dictionary or encoding
+the JSON. As the JSON is ASCII, its length in characters is its length in
+bytes.
+
+`breakdown` also measures every entry of every list in the tree (each card,
+section, widget, button, item...), so that a message which is too big can be
+cut down where it will make a difference:
+```
+tree = sizing.breakdown(message)
+if tree.size > sizing.MAX_MESSAGE_BYTES:
+  largest = max(tree.children[0].children, key=lambda s: s.size)
+```
+and `fits` checks a tree against a budget, stopping as soon as it is over.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Iterable, List, NamedTuple, Optional, Tuple
+
+from card_framework import serializer
+
+# The largest message the Chat API accepts, in bytes.
+MAX_MESSAGE_BYTES = 32000
+
+
+class Subtree(NamedTuple):
+  """The rendered size of part of a tree.
+
+  Attributes:
+      name (str): where the value is in its parent, such as `sections[1]`, or
+        `$` for the root
+      value (Any): the object (the `Section`, say) that was measured
+      size (int): the length of its JSON, in bytes
+      children (Tuple[Subtree, ...]): the entries of the lists inside it, in
+        the order they are rendered
+  """
+  name: str
+  value: Any
+  size: int
+  children: Tuple[Subtree, ...]
+
+
+class _OverBudget(Exception):
+  pass
+
+
+class _Count(object):
+  """An output for the serializer's writers which only adds up the lengths
+  of the fragments written to it, keeping none of them."""
+
+  __slots__ = ('total',)
+
+  def __init__(self) -> None:
+    self.total = 0
+
+  def append(self, fragment: str) -> None:
+    self.total += len(fragment)
+
+  def __len__(self) -> int:
+    return self.total
+
+  def __delitem__(self, position: slice) -> None:
+    # Everything written since `position` was an empty value, taken back.
+    self.total = position.start
+
+  def write_items(self, values: Iterable[Any]) -> None:
+    serializer.write_items(values, self)
+
+
+class _Measure(serializer.Output):
+  """An output for the serializer's writers which measures each entry of a
+  `list_field`.
+
+  The writers append fragments as usual (which they do far faster with
+  `list.append` than with anything written in Python), and the fragments are
+  only counted at the start and end of each entry.
+  """
+
+  __slots__ = ('budget', 'children', '_total', '_counted')
+
+  def __init__(self, budget: Optional[int] = None,
+               breakdown: bool = False) -> None:
+    super().__init__()
+    self.budget = budget
+    self.children: Optional[List[Subtree]] = [] if breakdown else None
+    self._total = 0
+    self._counted = 0
+
+  def total(self) -> int:
+    """The length of everything written so far."""
+    if self._counted > len(self):
+      # Something counted has been deleted, which only happens when an empty
+      # value is replaced.
+      self._total, self._counted = 0, 0
+    self._total += len(''.join(self[self._counted:]))
+    self._counted = len(self)
+    return self._total
+
+  def write_items(self, values: Iterable[Any]) -> None:
+    """Writes a `list_field`, measuring each entry."""
+    if self.children is None:
+      self.append('[')
+      first = True
+      for f in values:
+        if not first:
+          self.append(', ')
+        first = False
+        serializer.write_item(f, self)
+        if self.total() > self.budget:
+          raise _OverBudget()
+      self.append(']')
+      return
+
+    key = self._key()
+    self.append('[')
+    first = True
+    for i, f in enumerate(values):
+      if not first:
+        self.append(', ')
+      first = False
+      outer, self.children = self.children, []
+      start = self.total()
+      try:
+        serializer.write_item(f, self)
+      finally:
+        inner, self.children = self.children, outer
+      outer.append(Subtree(f'{key}[{i}]', f, self.total() - start,
+                           tuple(inner)))
+    self.append(']')
+
+  def _key(self) -> str:
+    # A list is written straight after its key (`"sections": `).
+    last = self[-1] if self else ''
+    if last.endswith(': '):
+      return json.loads(last.lstrip(', ')[:-2])
+    return ''
+
+
+def size(obj: Any) -> int:
+  """Measures `obj.render_json()` without rendering it.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `Section`...) or any other
+        dataclass
+
+  Returns:
+      int: the length of the JSON, in bytes
+  """
+  return serializer._write(obj, _Count()).total
+
+
+def breakdown(obj: Any) -> Subtree:
+  """Measures `obj.render_json()`, and every list entry inside it, without
+  rendering it.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `Section`...) or any other
+        dataclass
+
+  Returns:
+      Subtree: the size of the whole tree, whose `children` are the sizes of
+        the entries of its lists, and so on
+  """
+  out = serializer._write(obj, _Measure(breakdown=True))
+  return Subtree('$', obj, out.total(), tuple(out.children))
+
+
+def fits(obj: Any, budget: int = MAX_MESSAGE_BYTES) -> bool:
+  """Whether `obj.render_json()` is at most `budget` bytes long.
+
+  This stops measuring at the end of the first list entry (widget, section
+  and so on) which takes it over budget.
+
+  Args:
+      obj (Any): a `Renderable` (`Message`, `Card`, `Section`...) or any other
+        dataclass
+      budget (int, optional): the most bytes allowed. Defaults to
+        `MAX_MESSAGE_BYTES`.
+
+  Returns:
+      bool: whether the JSON fits
+  """
+  try:
+    return serializer._write(obj, _Measure(budget=budget)).total() <= budget
+  except _OverBudget:
+    return False
@@ -0,0 +1,112 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import unittest
+from typing import Iterator
+
+from card_framework import fixtures_test as fixtures
+from card_framework import serializer, sizing
+from card_framework.serializer_test import _message
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import (SelectionItem,
+                                                      SelectionItemColumns)
+
+
+def _selection(items: int) -> Section:
+  return Section(header='Choose your weapon', widgets=[SelectionInput(
+      name='weapon', label='Weapon',
+      items=[SelectionItem(text=f'Rapier {i}', value=str(i))
+             for i in range(items)])])
+
+
+def _subtrees(subtree: sizing.Subtree) -> Iterator[sizing.Subtree]:
+  yield subtree
+  for child in subtree.children:
+    yield from _subtrees(child)
+
+
+class SizeTest(unittest.TestCase):
+  def test_same_as_render_json(self) -> None:
+    tests = {
+        'message': _message(),
+        'card': fixtures.card(50),
+        'section': _selection(3),
+        'unicode': Message(text='Anybody want a peanut? 🥜'),
+        'empty': Message(),
+        'empty value': Section(widgets=[
+            DecoratedText(text='Fezzik', on_click=OnClick())]),
+        'columns': Section(widgets=[SelectionInput(
+            name='weapon', items=SelectionItemColumns.from_rows(
+                [('Rapier', 'r'), ('Dagger', 'd')]))]),
+    }
+    for name, value in tests.items():
+      with self.subTest(name):
+        self.assertEqual(len(value.render_json()), sizing.size(value))
+
+
+class BreakdownTest(unittest.TestCase):
+  def test_every_entry(self) -> None:
+    message = fixtures.message(30)
+    tree = sizing.breakdown(message)
+
+    self.assertEqual(('$', message, len(message.render_json())),
+                     tree[:3])
+    self.assertEqual(['cardsV2[0]'], [c.name for c in tree.children])
+    sections = tree.children[0].children
+    self.assertEqual(['sections[0]'], [s.name for s in sections])
+    self.assertEqual([f'widgets[{i}]' for i in range(30)],
+                     [w.name for w in sections[0].children])
+
+  def test_sizes_are_those_of_each_entry(self) -> None:
+    subtrees = list(_subtrees(sizing.breakdown(fixtures.message(30))))
+
+    self.assertGreater(len(subtrees), 30)
+    for subtree in subtrees:
+      with self.subTest(subtree.name):
+        self.assertEqual(len(serializer.render_json(subtree.value)),
+                         subtree.size)
+
+  def test_selection_items(self) -> None:
+    section = _selection(3)
+    widget = sizing.breakdown(section).children[0]
+
+    self.assertEqual(['items[0]', 'items[1]', 'items[2]'],
+                     [i.name for i in widget.children])
+    self.assertEqual(len(section.widgets[0].items[2].render_json()),
+                     widget.children[2].size)
+
+
+class FitsTest(unittest.TestCase):
+  def test_fits(self) -> None:
+    message = fixtures.message(30)
+    size = len(message.render_json())
+
+    self.assertTrue(sizing.fits(message, size))
+    self.assertFalse(sizing.fits(message, size - 1))
+    self.assertFalse(sizing.fits(message, 100))
+    self.assertTrue(sizing.fits(message))
+
+  def test_without_lists(self) -> None:
+    message = Message(text='Hello. My name is Inigo Montoya.')
+
+    self.assertTrue(sizing.fits(message, sizing.size(message)))
+    self.assertFalse(sizing.fits(message, sizing.size(message) - 1))
+
+  def test_limit(self) -> None:
+    self.assertFalse(sizing.fits(_selection(2000)))
@@ -0,0 +1,109 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import unittest
+
+from card_framework.template import Slot, Template
+from card_framework.v2.card import CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.message import Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.color import Color
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.icon import Icon
+
+
+def _message(name: str, quote: str, card_id: str) -> Message:
+  card = CardWithId(
+      header=CardHeader(title=name, subtitle='The Princess Bride'),
+      sections=[Section(header='Florin', widgets=[
+          DecoratedText(top_label=name, text=quote,
+                        start_icon=Icon(known_icon=Icon.KnownIcon.PERSON)),
+          ButtonList(buttons=[
+              Button(text='As you wish', color=Color(red=0.5, blue=1e-07)),
+              Button(text=name)])])])
+  card.card_id = card_id
+  return Message(text=quote, cards_v2=[card])
+
+
+_TEMPLATE = Template(_message(Slot('name'), Slot('quote'), Slot('card_id')))
+
+
+class TemplateTest(unittest.TestCase):
+  def assertFills(self, **values) -> None:
+    expected = _message(**values)
+
+    self.assertEqual(expected.render(), _TEMPLATE.fill(**values))
+    self.assertEqual(expected.render_json(), _TEMPLATE.fill_json(**values))
+
+  def test_slots(self) -> None:
+    self.assertEqual({'name', 'quote', 'card_id'}, _TEMPLATE.slots)
+
+  def test_fill(self) -> None:
+    self.assertFills(name='Inigo Montoya', quote='Prepare to die.',
+                     card_id='inigo')
+
+  def test_escaping(self) -> None:
+    self.assertFills(name='Iñigo "the Spaniard" Montoya',
+                     quote='You killed my father.\n¡Prepárate a morir! 🗡',
+                     card_id='\\inigo</b>')
+
+  def test_empty_values(self) -> None:
+    self.assertFills(name='Westley', quote='', card_id='westley')
+    self.assertFills(name='Westley', quote=None, card_id='westley')
+
+  def test_fills_are_independent(self) -> None:
+    first = _TEMPLATE.fill(name='Fezzik', quote='Anybody want a peanut?',
+                           card_id='fezzik')
+    first['cardsV2'][0]['card']['header']['title'] = 'Vizzini'
+
+    second = _TEMPLATE.fill(name='Fezzik', quote='Anybody want a peanut?',
+                            card_id='fezzik')
+
+    self.assertEqual('Fezzik', second['cardsV2'][0]['card']['header']['title'])
+
+  def test_missing_and_unknown_slots(self) -> None:
+    with self.assertRaises(TypeError):
+      _TEMPLATE.fill(name='Vizzini', quote='Inconceivable!')
+    with self.assertRaises(TypeError):
+      _TEMPLATE.fill_json(name='Vizzini', quote='Inconceivable!',
+                          card_id='vizzini', iocane='powder')
+
+  def test_source_changes_are_ignored(self) -> None:
+    message = _message(Slot('name'), 'Inconceivable!', 'vizzini')
+    template = Template(message)
+
+    message.text = 'You keep using that word.'
+
+    self.assertEqual('Inconceivable!', template.fill(name='Vizzini')['text'])
+
+  def test_no_slots(self) -> None:
+    message = _message('Vizzini', 'Inconceivable!', 'vizzini')
+
+    self.assertEqual(message.render_json(), Template(message).fill_json())
+
+  def test_slot_names(self) -> None:
+    self.assertEqual('name', Slot('name').name)
+    for name in ['', 'six fingers', 'class', '_name', 'type()']:
+      with self.subTest(name=name), self.assertRaises(ValueError):
+        Slot(name)
+
+  def test_slots_must_survive_rendering(self) -> None:
+    # Enums are rendered by name, so a slot can't stand in for one.
+    with self.assertRaises(ValueError):
+      Template(ButtonList(buttons=[Button(text='Duel',
+                                          type_=Slot('button_type'))]))
@@ -0,0 +1,178 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Dirty tracking for the opt-in render cache.
+
+A `Renderable` with `__CACHE_RENDER__` set keeps the dictionary `render`
+returned and returns it again until the widget changes. Setting an attribute
+on a `Renderable` marks it dirty, along with every cached ancestor which
+rendered it, so re-rendering a card after one widget changed rebuilds only
+that widget and the path above it; everything else comes from the cache.
+
+The `__setattr__` hook which does this is added to each class the first time
+one of its instances is tracked, so widgets which are never cached don't pay
+for it.
+
+Ancestors are found by registering each cached object, when it renders, as a
+parent of every `Renderable` beneath it, down to (and including) the nearest
+ones which hold their own cache.
+
+Changes which don't go through a `Renderable`'s `__setattr__` can't be seen:
+in-place changes to lists (`section.widgets.append(...)`), dicts, or objects
+which aren't `Renderable` (a button's `Color`, say). After one of those, call
+`mark_dirty()` on the `Renderable` containing it, or assign a new value
+instead.
+
+The cached dictionaries are shared: parents hold their children's cached
+dictionaries, and repeated calls to `render` return the same object, so they
+must not be modified. Anything a render generates (the id of a `CardWithId`
+without one, say) stays the same for as long as it is cached.
+
+This is not thread safe; don't change and render the same tree concurrently.
+"""
+from __future__ import annotations
+
+import dataclasses
+import enum
+import weakref
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from card_framework import compiler
+
+# The instance attribute the `RenderState` is kept in.
+STATE = '__render_state__'
+
+_FIELD_NAMES: Dict[type, Tuple[str, ...]] = {}
+
+
+class RenderState(object):
+  """The render cache of a single object.
+
+  Attributes:
+      render (Optional[Any]): the cached render, or `None` if dirty
+      parents (List[weakref.ref]): the cached objects that rendered this one
+  """
+  __slots__ = ('render', 'parents')
+
+  def __init__(self) -> None:
+    self.render: Optional[Any] = None
+    self.parents: List[weakref.ref] = []
+
+  def add_parent(self, parent: Any) -> None:
+    """Registers a parent, unless it is already registered."""
+    live = []
+    for ref in self.parents:
+      if (p := ref()) is parent:
+        return
+      if p is not None:
+        live.append(ref)
+
+    live.append(weakref.ref(parent))
+    self.parents = live
+
+  def invalidate(self) -> None:
+    """Drops the cached render, and those of all the parents."""
+    self.render = None
+    for ref in self.parents:
+      if (parent := ref()) is not None:
+        parent.mark_dirty()
+
+
+def state(obj: Any) -> RenderState:
+  """Returns an object's `RenderState`, creating it if needed."""
+  try:
+    return getattr(obj, STATE)
+  except AttributeError:
+    track(type(obj))
+    # Bypass `__setattr__`, which would mark the object dirty.
+    result = RenderState()
+    object.__setattr__(obj, STATE, result)
+    return result
+
+
+def track(cls: type) -> None:
+  """Makes setting an attribute of `cls` mark the instance dirty.
+
+  The class's existing `__setattr__` (its own, inherited or `object`'s) is
+  wrapped, so validation such as `Attachment`'s still runs.
+
+  Args:
+      cls (type): the `Renderable` class
+  """
+  setattr_ = cls.__setattr__
+  if getattr(setattr_, '__tracks_renders__', False):
+    return
+
+  def __setattr__(self, __name: str, __value: Any) -> None:
+    setattr_(self, __name, __value)
+    if (state := getattr(self, STATE, None)) is not None:
+      state.invalidate()
+
+  __setattr__.__tracks_renders__ = True
+  cls.__setattr__ = __setattr__
+
+
+def adopt(parent: Any) -> None:
+  """Registers `parent` with every `Renderable` whose changes affect it.
+
+  Args:
+      parent (Any): the `Renderable` that has just been rendered and cached
+  """
+  from card_framework import Renderable
+
+  if getattr(parent, '__FROZEN__', False):
+    # Nothing inside a frozen object can change.
+    return
+
+  pending = [getattr(parent, name) for name in _field_names(type(parent))]
+  while pending:
+    value = pending.pop()
+    if type(value) not in compiler._ATOMIC:
+      pending.extend(_contents(value, parent, Renderable))
+
+
+def _contents(value: Any, parent: Any, renderable: type) -> Iterable[Any]:
+  """The values inside `value` whose changes affect `parent`, which is
+  registered with `value` itself if that is a (mutable) `Renderable`."""
+  cls = type(value)
+  if isinstance(value, renderable):
+    if getattr(cls, '__FROZEN__', False):
+      return ()
+    child = state(value)
+    child.add_parent(parent)
+    if child.render is not None:
+      # A cached child tracks its own contents.
+      return ()
+    return [getattr(value, name) for name in _field_names(cls)]
+  if cls is list or cls is tuple:
+    return value
+  if hasattr(cls, '__dataclass_fields__'):
+    if getattr(cls, '__FROZEN__', False):
+      return ()
+    return [getattr(value, name) for name in _field_names(cls)]
+  if isinstance(value, enum.Enum):
+    return ()
+  if isinstance(value, Mapping):
+    return value.values()
+  if isinstance(value, (list, tuple, set, frozenset)):
+    return value
+  return ()
+
+
+def _field_names(cls: type) -> Tuple[str, ...]:
+  try:
+    return _FIELD_NAMES[cls]
+  except KeyError:
+    names = _FIELD_NAMES[cls] = tuple(f.name for f in dataclasses.fields(cls))
+    return names
@@ -0,0 +1,175 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import copy
+import json
+import pickle
+import unittest
+
+from card_framework import Renderable, tracking
+from card_framework.v2.card import CardWithId
+from card_framework.v2.enums import HorizontalAlignment
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.button import Button
+from card_framework.v2.widgets.button_list import ButtonList
+from card_framework.v2.widgets.color import Color
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.text_paragraph import TextParagraph
+
+
+def _card() -> CardWithId:
+  card = CardWithId(sections=[
+      Section(header='Florin', widgets=[
+          DecoratedText(text='Inigo Montoya', button=Button(text='Duel')),
+          TextParagraph(text='Inconceivable!')]),
+      Section(header='Guilder', widgets=[
+          ButtonList(buttons=[Button(text='As you wish')])]),
+  ])
+  card.card_id = 'vizzini'
+  return card
+
+
+class TrackingTest(unittest.TestCase):
+  def setUp(self) -> None:
+    Renderable.__CACHE_RENDER__ = True
+    self.addCleanup(setattr, Renderable, '__CACHE_RENDER__', False)
+
+  def assertRenders(self, card: CardWithId) -> None:
+    cached = card.render()
+    Renderable.__CACHE_RENDER__ = False
+    try:
+      self.assertEqual(json.dumps(card.render()), json.dumps(cached))
+    finally:
+      Renderable.__CACHE_RENDER__ = True
+
+  def test_render_is_cached(self) -> None:
+    card = _card()
+
+    self.assertIs(card.render(), card.render())
+
+  def test_not_cached_by_default(self) -> None:
+    Renderable.__CACHE_RENDER__ = False
+    card = _card()
+
+    self.assertIsNot(card.render(), card.render())
+    self.assertNotIn(tracking.STATE, card.__dict__)
+
+  def test_instance_opt_in(self) -> None:
+    Renderable.__CACHE_RENDER__ = False
+    text = TextParagraph(text='Inconceivable!')
+    text.__CACHE_RENDER__ = True
+
+    self.assertIs(text.render(), text.render())
+
+  def test_change_rebuilds_path(self) -> None:
+    card = _card()
+    before = card.render()
+    florin, guilder = card.sections
+
+    florin.widgets[1].text = 'You keep using that word.'
+    after = card.render()
+
+    self.assertIsNot(before, after)
+    self.assertEqual('You keep using that word.',
+                     after['card']['sections'][0]['widgets'][1]
+                     ['textParagraph']['text'])
+    # The untouched widget and section come from the cache.
+    self.assertIs(before['card']['sections'][0]['widgets'][0],
+                  after['card']['sections'][0]['widgets'][0])
+    self.assertIs(before['card']['sections'][1],
+                  after['card']['sections'][1])
+    self.assertRenders(card)
+
+  def test_nested_change(self) -> None:
+    card = _card()
+    card.render()
+
+    card.sections[0].widgets[0].button.text = 'Prepare to die'
+
+    self.assertEqual({'text': 'Prepare to die'},
+                     card.render()['card']['sections'][0]['widgets'][0]
+                     ['decoratedText']['button'])
+
+  def test_property_change(self) -> None:
+    card = _card()
+    card.render()
+
+    card.sections[1].widgets[0].horizontal_alignment = HorizontalAlignment.END
+    card.card_id = 'fezzik'
+
+    self.assertEqual('fezzik', card.render()['cardId'])
+    self.assertEqual('END', card.render()['card']['sections'][1]['widgets'][0]
+                     ['horizontalAlignment'])
+
+  def test_replaced_child(self) -> None:
+    card = _card()
+    card.render()
+    old = card.sections[1]
+
+    card.sections = [Section(header='Fire swamp')]
+    old.header = 'Guilder'
+
+    self.assertEqual([{'header': 'Fire swamp'}],
+                     card.render()['card']['sections'])
+
+  def test_list_changes(self) -> None:
+    card = _card()
+    card.render()
+    section = card.sections[1]
+
+    section.widgets.append(TextParagraph(text='Stale'))
+    self.assertEqual(1, len(card.render()['card']['sections'][1]['widgets']))
+
+    section.mark_dirty()
+    self.assertEqual(2, len(card.render()['card']['sections'][1]['widgets']))
+
+    section.add_widget(TextParagraph(text='Fresh'))
+    self.assertEqual(3, len(card.render()['card']['sections'][1]['widgets']))
+
+  def test_untracked_change(self) -> None:
+    card = _card()
+    button = card.sections[1].widgets[0].buttons[0]
+    card.render()
+
+    button.color = Color(red=1.0)
+    card.render()
+    button.color.red = 0.5
+
+    self.assertEqual({'red': 1.0}, card.render()['card']['sections'][1]
+                     ['widgets'][0]['buttonList']['buttons'][0]['color'])
+
+    button.mark_dirty()
+    self.assertRenders(card)
+
+  def test_render_json(self) -> None:
+    card = _card()
+    card.render()
+
+    card.sections[0].header = 'Fire swamp'
+
+    self.assertEqual(json.dumps(card.render()).encode('utf-8'),
+                     card.render_json())
+
+  def test_copies_are_not_tracked(self) -> None:
+    card = _card()
+    card.render()
+
+    for clone in (copy.deepcopy(card), pickle.loads(pickle.dumps(card))):
+      self.assertNotIn(tracking.STATE, clone.__dict__)
+      self.assertNotIn(tracking.STATE, clone.sections[0].__dict__)
+      clone.sections[0].header = 'Fire swamp'
+      self.assertEqual('Florin', card.render()['card']['sections'][0]['header'])
+      self.assertEqual('Fire swamp',
+                       clone.render()['card']['sections'][0]['header'])
@@ -0,0 +1,181 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A compact format for sending widget trees between processes.
+
+Pickling a widget tree pickles every field of every dataclass by name,
+including the (many) which are `None`. `pack` turns a tree into nested
+tuples instead, each dataclass becoming a record of its class followed by
+the index and value of each field which is set:
+```
+DecoratedText(text='Inconceivable!')  ->  (DecoratedText, 5, 'Inconceivable!')
+```
+which is about half the size once pickled, and much quicker to unpickle.
+`unpack` turns the records back into objects, without running `__init__`
+or any validation again.
+
+Records are recognised by their first element being a class, so real tuples
+are packed as records of `tuple`, and frozen objects (whose classes can't be
+pickled) as records of `Frozen` followed by the original class. Compact
+objects (see `card_framework.compact`) are sent as their original classes.
+
+Both ends must be running the same version of the classes, as fields are
+identified by position.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Any, Callable, Dict, Tuple
+
+from card_framework import compact, compiler, frozen, tracking
+
+_PACKERS: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {}
+_FIELDS: Dict[type, Tuple[Tuple[str, ...], Dict[str, None]]] = {}
+
+# Bookkeeping kept in an instance that isn't sent.
+_LOCAL = frozenset([tracking.STATE, frozen._HASH, frozen._JSON])
+
+
+def pack(value: Any) -> Any:
+  """Packs a widget tree (or list of them) for sending to another process.
+
+  Args:
+      value (Any): the widget, card, message or other value
+
+  Returns:
+      Any: the packed value, which can be pickled
+  """
+  cls = type(value)
+  if cls in compiler._ATOMIC:
+    return value
+
+  if cls is list:
+    return [v if v.__class__ in compiler._ATOMIC else pack(v) for v in value]
+
+  if hasattr(cls, '__dataclass_fields__'):
+    try:
+      return _PACKERS[cls](value)
+    except KeyError:
+      packer = _PACKERS[cls] = _compile_packer(cls)
+      return packer(value)
+
+  if cls is tuple:
+    return (tuple, *(pack(v) for v in value))
+
+  if cls is dict:
+    return {k: pack(v) for (k, v) in value.items()}
+
+  return value
+
+
+def unpack(value: Any) -> Any:
+  """Rebuilds a value packed by `pack`.
+
+  Args:
+      value (Any): the packed value
+
+  Returns:
+      Any: the widget tree
+  """
+  cls = value.__class__
+  if cls in compiler._ATOMIC:
+    return value
+
+  if cls is list:
+    return [unpack(v) for v in value]
+
+  if cls is tuple and value and isinstance(value[0], type):
+    record = value[0]
+    if record is tuple:
+      return tuple(unpack(v) for v in value[1:])
+    if record is frozen.Frozen:
+      return frozen._restore(value[1], _state(value[1], value, 2))
+
+    obj = object.__new__(record)
+    compact.set_attributes(obj, _state(record, value, 1))
+    return obj
+
+  if cls is dict:
+    return {k: unpack(v) for (k, v) in value.items()}
+
+  return value
+
+
+def _fields(cls: type) -> Tuple[Tuple[str, ...], Dict[str, None]]:
+  try:
+    return _FIELDS[cls]
+  except KeyError:
+    names = tuple(f.name for f in dataclasses.fields(cls))
+    result = _FIELDS[cls] = (names, dict.fromkeys(names))
+    return result
+
+
+def _state(cls: type, record: Tuple[Any, ...], start: int) -> Dict[str, Any]:
+  (names, state) = _fields(cls)
+  state = state.copy()
+  atomic = compiler._ATOMIC
+  for i in range(start, len(record), 2):
+    key = record[i]
+    value = record[i + 1]
+    if value.__class__ not in atomic:
+      value = unpack(value)
+    state[names[key] if key.__class__ is int else key] = value
+  return state
+
+
+def _pack_any(obj: Any) -> Tuple[Any, ...]:
+  """Packs a dataclass with attributes other than its fields."""
+  cls = type(obj)
+  if getattr(cls, '__FROZEN__', False):
+    out = [frozen.Frozen, compact.original(cls.__bases__[1])]
+  else:
+    out = [compact.original(cls)]
+
+  index = {name: i for (i, name) in enumerate(_fields(cls)[0])}
+  for (name, value) in compact.attributes(obj).items():
+    if value is not None and name not in _LOCAL:
+      out += (index.get(name, name), pack(value))
+  return tuple(out)
+
+
+def _compile_packer(cls: type) -> Callable[[Any], Tuple[Any, ...]]:
+  """Generates the packer for a dataclass.
+
+  The common case, an object with nothing but its fields, is handled by
+  generated code; anything else goes to `_pack_any`.
+  """
+  names = _fields(cls)[0]
+  if getattr(cls, '__FROZEN__', False) or getattr(cls, '__LAZY__', False):
+    return _pack_any
+
+  namespace = {'_atomic': compiler._ATOMIC, '_pack': pack,
+               '_pack_any': _pack_any, '_cls': compact.original(cls)}
+  if cls is compact.original(cls):
+    lines = ['def packer(obj):',
+             '  d = obj.__dict__',
+             f'  if len(d) != {len(names)}: return _pack_any(obj)',
+             '  out = [_cls]']
+    value = 'd[{!r}]'
+  else:
+    # A compact object has nothing but its fields (and cache).
+    lines = ['def packer(obj):', '  out = [_cls]']
+    value = 'obj.{}'
+  for (i, name) in enumerate(names):
+    lines.append(f'  if (v := {value.format(name)}) is not None: '
+                 f'out += ({i}, v if v.__class__ in _atomic else _pack(v))')
+  lines.append('  return tuple(out)')
+
+  exec('\n'.join(lines), namespace)
+  compiled = namespace['packer']
+  compiled.__qualname__ = f'packer<{cls.__qualname__}>'
+  return compiled
@@ -0,0 +1,71 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import pickle
+import unittest
+
+from card_framework import frozen, transfer
+from card_framework.serializer_test import _message
+from card_framework.v2.card import Card
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.decorated_text import DecoratedText
+
+
+def _round_trip(value):
+  return transfer.unpack(pickle.loads(pickle.dumps(transfer.pack(value))))
+
+
+class TransferTest(unittest.TestCase):
+  def test_round_trip(self) -> None:
+    message = _message()
+    restored = _round_trip(message)
+
+    self.assertEqual(message, restored)
+    self.assertIsNot(message, restored)
+    self.assertEqual(message.render_json(), restored.render_json())
+
+  def test_record(self) -> None:
+    text = DecoratedText(text='Inconceivable!')
+    index = list(DecoratedText.__dataclass_fields__).index('text')
+
+    self.assertEqual((DecoratedText, index, 'Inconceivable!'),
+                     transfer.pack(text))
+
+  def test_is_smaller(self) -> None:
+    messages = [_message() for _ in range(10)]
+
+    self.assertLess(len(pickle.dumps(transfer.pack(messages))),
+                    len(pickle.dumps(messages)) * 0.75)
+
+  def test_instance_attributes(self) -> None:
+    card = Card(sections=[Section(header='Florin')])
+    card.__TAG_OVERRIDE__ = 'pushCard'
+    card.sections[0].__SUPPRESS_TAG__ = False
+
+    self.assertEqual(card.render(), _round_trip(card).render())
+
+  def test_frozen(self) -> None:
+    message = _message().freeze()
+    restored = _round_trip(message)
+
+    self.assertIsInstance(restored, frozen.Frozen)
+    self.assertIsInstance(restored.cards_v2, tuple)
+    self.assertEqual(message, restored)
+
+  def test_values(self) -> None:
+    value = [('Inigo', 'Montoya'), {'six': ['fingers']}, {'sword'}, None, 1.5]
+
+    self.assertEqual(value, _round_trip(value))
+    self.assertEqual((tuple, 'Inigo', 'Montoya'), transfer.pack(value)[0])
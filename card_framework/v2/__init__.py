@@ -11,22 +11,64 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+"""The Google Chat card framework, v2.
 
-from .action_response import ActionResponse
-from .action_status import ActionStatus
-from .annotation import Annotation, SlashCommandMetadata, UserMentionMetadata
-from .attachment import Attachment, AttachmentDataRef, DriveDataRef
-from .card import Card
-from .card_action import CardAction
-from .card_fixed_footer import CardFixedFooter
-from .card_header import CardHeader
-from .dialog_action import Dialog, DialogAction
-from .enums import HorizontalAlignment, ImageType
-from .message import MatchedUrl, Message, SlashCommand, Thread
-from .section import CollapseControl, Section
-from .space import Space, SpaceDetail
-from .user import User
-from .widget import Widget
+The public names are imported from their submodules the first time they are
+used (PEP 562) rather than all at once, so that importing one widget doesn't
+import every other one as well.
+"""
+from typing import TYPE_CHECKING
+
+from card_framework import _lazy_module
+
+if TYPE_CHECKING:
+  from .action_response import ActionResponse
+  from .action_status import ActionStatus
+  from .annotation import Annotation, SlashCommandMetadata, UserMentionMetadata
+  from .attachment import Attachment, AttachmentDataRef, DriveDataRef
+  from .card import Card
+  from .card_action import CardAction
+  from .card_fixed_footer import CardFixedFooter
+  from .card_header import CardHeader
+  from .dialog_action import Dialog, DialogAction
+  from .enums import HorizontalAlignment, ImageType
+  from .message import LazyMessage, MatchedUrl, Message, SlashCommand, Thread
+  from .section import CollapseControl, Section
+  from .space import Space, SpaceDetail
+  from .user import User
+  from .widget import Widget
+
+# The submodule each public name is defined in.
+_LAZY = {
+    "ActionResponse": "action_response",
+    "ActionStatus": "action_status",
+    "Annotation": "annotation",
+    "SlashCommandMetadata": "annotation",
+    "UserMentionMetadata": "annotation",
+    "Attachment": "attachment",
+    "AttachmentDataRef": "attachment",
+    "DriveDataRef": "attachment",
+    "Card": "card",
+    "CardAction": "card_action",
+    "CardFixedFooter": "card_fixed_footer",
+    "CardHeader": "card_header",
+    "Dialog": "dialog_action",
+    "DialogAction": "dialog_action",
+    "HorizontalAlignment": "enums",
+    "ImageType": "enums",
+    "LazyMessage": "message",
+    "MatchedUrl": "message",
+    "Message": "message",
+    "SlashCommand": "message",
+    "Thread": "message",
+    "CollapseControl": "section",
+    "Section": "section",
+    "Space": "space",
+    "SpaceDetail": "space",
+    "User": "user",
+    "Widget": "widget",
+}
+_SUBMODULES = frozenset(_LAZY.values()) | {"emoji", "widgets"}
 
 __all__ = [
     "ActionResponse",
@@ -46,6 +88,7 @@ __all__ = [
     "HorizontalAlignment",
     "ImageType",
     "Message",
+    "LazyMessage",
     "Thread",
     "SlashCommand",
     "MatchedUrl",
@@ -56,3 +99,6 @@ __all__ = [
     "User",
     "Widget",
 ]
+
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY, _SUBMODULES)
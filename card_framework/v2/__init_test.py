@@ -0,0 +1,74 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import subprocess
+import sys
+import unittest
+
+import card_framework.v2
+import card_framework.v2.widgets
+
+
+class LazyImportTest(unittest.TestCase):
+  def test_public_names(self) -> None:
+    for package in [card_framework.v2, card_framework.v2.widgets]:
+      for name in package.__all__:
+        with self.subTest(name=name):
+          value = getattr(package, name)
+          self.assertEqual(name, value.__name__)
+          self.assertIn(name, dir(package))
+
+  def test_star_import(self) -> None:
+    names = {}
+    exec('from card_framework.v2.widgets import *', names)
+
+    self.assertEqual(set(card_framework.v2.widgets.__all__),
+                     set(names) - {'__builtins__'})
+
+  def test_submodules(self) -> None:
+    self.assertIs(card_framework.v2.widgets,
+                  sys.modules['card_framework.v2.widgets'])
+    self.assertEqual('card_framework.v2.emoji', card_framework.v2.emoji.__name__)
+
+  def test_unknown_name(self) -> None:
+    with self.assertRaises(AttributeError):
+      card_framework.v2.InigoMontoya
+
+  def test_only_what_is_used_is_imported(self) -> None:
+    # Run in a fresh interpreter, as this one has imported everything.
+    imported = subprocess.run(
+        [sys.executable, '-c',
+         'import sys; from card_framework.v2.widgets import DecoratedText; '
+         'print(" ".join(sys.modules))'],
+        capture_output=True, text=True, check=True).stdout.split()
+
+    self.assertIn('card_framework.v2.widgets.decorated_text', imported)
+    self.assertNotIn('card_framework.v2.widgets.grid', imported)
+    self.assertNotIn('card_framework.v2.message', imported)
+    self.assertNotIn('asyncio', imported)
+
+  def test_card_does_not_import_the_backends(self) -> None:
+    imported = subprocess.run(
+        [sys.executable, '-c',
+         'import sys; import card_framework.v2.card; '
+         'print(" ".join(sys.modules))'],
+        capture_output=True, text=True, check=True).stdout.split()
+
+    for module in ['orjson', 'ujson', 'card_framework.backends',
+                   'card_framework.fingerprint', 'card_framework.frozen',
+                   'card_framework.compact', 'card_framework.lazy',
+                   'card_framework.validation']:
+      with self.subTest(module=module):
+        self.assertNotIn(module, imported)
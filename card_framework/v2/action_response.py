@@ -15,13 +15,13 @@ from __future__ import annotations
 
 import dataclasses
 
-import dataclasses_json
-from card_framework import AutoNumber, Renderable, enum_field, standard_field
+from card_framework import (AutoNumber, Renderable, codec, enum_field,
+                            standard_field)
 
 from .dialog_action import DialogAction
 from .widgets.selection_input import UpdatedWidget
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class ActionResponse(Renderable):
   class ResponseType(AutoNumber):
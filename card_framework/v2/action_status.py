@@ -13,11 +13,10 @@
 # limitations under the License.
 import dataclasses
 
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, standard_field
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class ActionStatus(object):
   """ActionStatus
@@ -14,16 +14,15 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Dict, Mapping
+from typing import Any, Mapping
 
 import card_framework
-import dataclasses_json
-from dataclasses_json.core import Json
+from card_framework import codec
 
 from .user import User
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Annotation(card_framework.Renderable):
   class AnnotationType(card_framework.AutoNumber):
@@ -62,30 +61,20 @@ class Annotation(card_framework.Renderable):
 
     super().__setattr__(__name, __value)
 
-  def to_dict(self, encode_json=False) -> Dict[str, Json]:
-    """Converts the dataclass to a dict.
-
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
-
-    Args:
-        encode_json (bool, optional): encode the json strings. Defaults to False.
+  def check(self) -> None:
+    """Checks that one, and only one, of `slash_command` and `user_mention` is
+    set.
 
     Raises:
-        ValueError: if both `known_icon` and `icon_url` are set.
-
-    Returns:
-        Dict[str, Json]: The header
+        ValueError: if neither or both of them are set.
     """
-    if all([self.slash_command, self.user_mention]):
+    if self.slash_command and self.user_mention:
       raise ValueError('Only one of [slash_command, user_mention] can be set.')
-    elif not (any([self.slash_command, self.user_mention])):
-      raise ValueError(f'One of [slash_command, user_mention] must be set.')
-
-    return super().to_dict(encode_json)
+    elif not (self.slash_command or self.user_mention):
+      raise ValueError('One of [slash_command, user_mention] must be set.')
 
 
-@dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
+@codec.dataclass_json(letter_case=codec.LetterCase.CAMEL)
 @dataclasses.dataclass
 class UserMentionMetadata(object):
   class UserMentionMetadataType(card_framework.AutoNumber):
@@ -97,7 +86,7 @@ class UserMentionMetadata(object):
   type: UserMentionMetadataType = card_framework.enum_field()
 
 
-@dataclasses_json.dataclass_json(letter_case=dataclasses_json.LetterCase.CAMEL)
+@codec.dataclass_json(letter_case=codec.LetterCase.CAMEL)
 @dataclasses.dataclass
 class SlashCommandMetadata(object):
   class SlashCommandMetadataType(card_framework.AutoNumber):
@@ -14,14 +14,13 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Dict
+from typing import Any
 
-import dataclasses_json
-from card_framework import AutoNumber, Renderable, enum_field, standard_field
-from dataclasses_json.core import Json
+from card_framework import (AutoNumber, Renderable, codec, enum_field,
+                            standard_field)
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Attachment(Renderable):
   class Source(AutoNumber):
@@ -66,37 +65,27 @@ class Attachment(Renderable):
 
     super().__setattr__(__name, __value)
 
-  def to_dict(self, encode_json=False) -> Dict[str, Json]:
-    """Converts the dataclass to a dict.
-
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
-
-    Args:
-        encode_json (bool, optional): encode the json strings. Defaults to False.
+  def check(self) -> None:
+    """Checks that one, and only one, of `attachment_data_ref` and
+    `drive_data_ref` is set.
 
     Raises:
-        ValueError: if both `known_icon` and `icon_url` are set.
-
-    Returns:
-        Dict[str, Json]: The header
+        ValueError: if neither or both of them are set.
     """
-    if all([self.attachment_data_ref, self.drive_data_ref]):
+    if self.attachment_data_ref and self.drive_data_ref:
       raise ValueError(
           'Only one of [attachmentDataRef, driveDataRef] can be set.')
-    elif not (any([self.attachment_data_ref, self.drive_data_ref])):
-      raise ValueError(f'One of [attachmentDataRef, driveDataRef] must be set.')
-
-    return super().to_dict(encode_json)
+    elif not (self.attachment_data_ref or self.drive_data_ref):
+      raise ValueError('One of [attachmentDataRef, driveDataRef] must be set.')
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class AttachmentDataRef(object):
   resource_name: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class DriveDataRef(object):
   drive_file_id: str = standard_field()
@@ -14,21 +14,23 @@
 from __future__ import annotations
 
 import dataclasses
-import uuid
+import threading
 from typing import List, Optional
 
-import dataclasses_json
-
-from card_framework import (AutoNumber, Renderable, enum_field, list_field,
-                            standard_field)
+from card_framework import (AutoNumber, Renderable, codec, enum_field,
+                            list_field, standard_field)
 
+from . import card_ids
 from .card_action import CardAction
 from .card_fixed_footer import CardFixedFooter
 from .card_header import CardHeader
 from .section import Section
 
+# The most widgets the Chat API will show in one card; any more are ignored.
+MAX_WIDGETS = 100
+
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Card(Renderable):
   """Response
@@ -55,12 +57,26 @@ class Card(Renderable):
   card_actions: Optional[List[CardAction]] = standard_field()
   section_divider_style: Optional[DividerStyle] = enum_field()
   fixed_footer: Optional[CardFixedFooter] = standard_field()
-  display_style: Optional[Card.DisplayStyle] = standard_field()
+  display_style: Optional[Card.DisplayStyle] = enum_field()
   peek_card_header: Optional[CardHeader] = standard_field()
 
   __TAG_OVERRIDE__: str = standard_field(default='card', exclude=lambda x: True)
   # __TAG_OVERRIDE__: str = 'card'
 
+  def check(self) -> None:
+    """Checks that the card is within the Chat API's limits.
+
+    Raises:
+        ValueError: if the sections have more than `MAX_WIDGETS` widgets
+          between them.
+    """
+    count = 0
+    for section in self.sections or ():
+      count += len(section.widgets or ())
+    if count > MAX_WIDGETS:
+      raise ValueError(f'The card has {count} widgets, but can have at most '
+                       f'{MAX_WIDGETS}.')
+
   def add_section(self, section: Section) -> None:
     """Adds a section to the report.
 
@@ -68,21 +84,49 @@ class Card(Renderable):
         section (Section): The section to add.
     """
     self.sections.append(section)
+    self.mark_dirty()
+
 
+# Held while a card keeps its first ID, so concurrent reads agree on it.
+_KEEP_LOCK = threading.Lock()
 
-@dataclasses_json.dataclass_json
+
+@codec.dataclass_json
 @dataclasses.dataclass
 class CardWithId(Card):
+  """A card with the `cardId` a message's `cards_v2` entries need.
+
+  A card which isn't given a `card_id` gets one the first time it is read,
+  from the current `card_ids` strategy.
+  """
   __card_id: str = standard_field(default=None, exclude=lambda x: True)
 
   @property
   def card_id(self) -> str:
-    return self.__card_id if self.__card_id else str(uuid.uuid4())
+    return self.__card_id or card_ids.new_id(self)
 
   @card_id.setter
   def card_id(self, value: str) -> None:
     self.__card_id = value
 
+  def keep_id(self, value: str) -> str:
+    """Keeps the ID `card_ids.new_id` gave the card, unless another thread
+    kept one first.
+
+    This isn't an assignment: the card has only ever rendered with this ID,
+    so neither it nor anything which rendered it is marked as changed.
+
+    Args:
+        value (str): the new ID
+
+    Returns:
+        str: the ID the card keeps
+    """
+    with _KEEP_LOCK:
+      if not self.__card_id:
+        object.__setattr__(self, '_CardWithId__card_id', value)
+      return self.__card_id
+
   def card(self) -> Card:
     return Card(header=self.header, name=self.name, sections=self.sections,
                 card_actions=self.card_actions,
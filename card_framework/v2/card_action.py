@@ -14,11 +14,10 @@
 import dataclasses
 from typing import Optional
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class CardAction(object):
   action_label: Optional[str] = standard_field()
@@ -14,13 +14,12 @@
 import dataclasses
 from typing import Optional
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 
 from .widgets.button import Button
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class CardFixedFooter(object):
   primary_button: Optional[Button] = standard_field()
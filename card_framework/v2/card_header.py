@@ -14,15 +14,13 @@
 import dataclasses
 from typing import Dict, Optional
 
-import dataclasses_json
-from card_framework import enum_field, standard_field
-from dataclasses_json import core
+from card_framework import codec, enum_field, standard_field
 
 from .enums import ImageType
 
 
 @dataclasses.dataclass
-class CardHeader(dataclasses_json.DataClassJsonMixin):
+class CardHeader(codec.DataClassJsonMixin):
   """CardHeader
 
   Describes a Google Chat App response header.
@@ -35,22 +33,35 @@ class CardHeader(dataclasses_json.DataClassJsonMixin):
   image_type: Optional[ImageType] = enum_field()
   image_alt_text: Optional[str] = standard_field()
 
-  def to_dict(self, encode_json=False) -> Dict[str, core.Json]:
+  def check(self) -> None:
+    """Checks that `image_type` is set if `image_url` is.
+
+    Raises:
+        ValueError: if the `image_style` is not set with the `image_url`
+    """
+    if self.image_url and not self.image_type:
+      raise ValueError('If image_url is used, image_style must be set.')
+
+  def to_dict(self, encode_json=False) -> Dict[str, codec.Json]:
     """Converts the dataclass to a dict.
 
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `image_style` is set if `image_url` is provided.
+    This is an override of the standard dataclass `to_dict` method which runs
+    `check` first, so that a header with an `image_url` but no `image_type`
+    can't be converted on its own. A header which has passed
+    `validation.validate`, and not been changed since, isn't checked again.
 
     Args:
         encode_json (bool, optional): encode the json strings. Defaults to False.
 
     Raises:
-        ValueError: if the `image_style` is not set with the `image_url`
+        ValueError: if the `image_url` is set without the `image_type`
 
     Returns:
         Dict[str, Json]: The header
     """
-    if self.image_url and not self.image_type:
-      raise ValueError('If image_url is used, image_style must be set.')
+    from card_framework import validation
+
+    if not validation.is_validated(self):
+      self.check()
 
     return super().to_dict(encode_json)
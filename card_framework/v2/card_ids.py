@@ -0,0 +1,159 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""How a `CardWithId` without a `card_id` gets one.
+
+The first time the `card_id` of a `CardWithId` which wasn't given one is
+read (normally when it is rendered), the current strategy is called with the
+card and the ID it returns is kept, so the card renders with the same ID
+every time. The strategies are:
+
+* `random_id`, the default: a `uuid4`, unique across processes.
+* `Counter`: `card-1`, `card-2`... which is the cheapest, but only unique
+  within a process (and per `Counter`).
+* `content_id`: a digest of what the card renders to (without its ID), so
+  cards which render the same get the same ID in any process. This is not
+  kept, as it follows changes to the card, so it costs writing the card's
+  JSON again for each read; cards built from frozen sections only write the
+  parts which aren't frozen.
+
+A frozen card can't keep an ID, so is given a new one each time it is
+rendered, unless it was given one (or its `card_id` was read) before it was
+frozen.
+
+Any other function from a card to a string will do as well; give it a
+`keep` attribute of False if its IDs shouldn't be kept. The strategy is set
+for a block of code:
+```
+with card_ids.using(card_ids.content_id):
+  return message.render_json()
+```
+or for the whole process, with `set_strategy(card_ids.Counter())`.
+"""
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import hashlib
+import itertools
+import uuid
+from typing import Any, Callable, Iterator, Optional
+
+Strategy = Callable[[Any], str]
+
+
+def random_id(card: Any) -> str:
+  """A random ID, which is kept.
+
+  Args:
+      card (Any): the `CardWithId`
+
+  Returns:
+      str: a new `uuid4`
+  """
+  return str(uuid.uuid4())
+
+
+def content_id(card: Any) -> str:
+  """An ID derived from what the card renders to, which is not kept.
+
+  Args:
+      card (Any): the `CardWithId`
+
+  Returns:
+      str: the BLAKE2b digest of the card's JSON, without the ID, in hex
+  """
+  from card_framework import fingerprint, serializer
+
+  out = fingerprint._Canonical()
+  serializer.write_to_dict(card, out)
+  return hashlib.blake2b(''.join(out).encode('utf-8'),
+                         digest_size=fingerprint.DIGEST_SIZE).hexdigest()
+
+
+content_id.keep = False
+
+
+class Counter(object):
+  """Numbers cards in the order their IDs are first read.
+
+  Args:
+      prefix (str, optional): what goes before the number. Defaults to
+        'card-'.
+      start (int, optional): the first number. Defaults to 1.
+  """
+
+  def __init__(self, prefix: str = 'card-', start: int = 1) -> None:
+    self.prefix = prefix
+    # `next` on a count is atomic, so the numbers are unique across threads.
+    self._count = itertools.count(start)
+
+  def __call__(self, card: Any) -> str:
+    return f'{self.prefix}{next(self._count)}'
+
+
+_STRATEGY: contextvars.ContextVar[Optional[Strategy]] = (
+    contextvars.ContextVar('card_id_strategy', default=None))
+_default: Strategy = random_id
+
+
+def strategy() -> Strategy:
+  """The strategy in use for the current thread (or `asyncio` task)."""
+  return _STRATEGY.get() or _default
+
+
+@contextlib.contextmanager
+def using(value: Strategy) -> Iterator[None]:
+  """Uses a strategy for the IDs cards are given inside the block.
+
+  This applies to the current thread (or `asyncio` task) only.
+
+  Args:
+      value (Strategy): the strategy
+  """
+  token = _STRATEGY.set(value)
+  try:
+    yield
+  finally:
+    _STRATEGY.reset(token)
+
+
+def set_strategy(value: Strategy) -> None:
+  """Sets the strategy for every card in the process.
+
+  Args:
+      value (Strategy): the strategy, such as `random_id` (the default)
+  """
+  global _default
+  _default = value
+
+
+def new_id(card: Any) -> str:
+  """Gives a card without a `card_id` one, keeping it unless the strategy
+  says not to (or the card is frozen).
+
+  Keeping the ID doesn't count as changing the card, and if two threads read
+  the ID of the same card at once, both get the one which is kept.
+
+  Args:
+      card (Any): the `CardWithId`
+
+  Returns:
+      str: the ID
+  """
+  current = strategy()
+  card_id = current(card)
+  frozen = getattr(type(card), '__FROZEN__', False)
+  if getattr(current, 'keep', True) and not frozen:
+    return card.keep_id(card_id)
+  return card_id
@@ -0,0 +1,134 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+import unittest
+
+from card_framework import validation
+from card_framework.frozen_test import _card
+
+from . import card_ids
+from .card import CardWithId
+from .message import Message
+from .section import Section
+from .widgets.text_paragraph import TextParagraph
+
+
+def _unnamed(text: str = 'Inconceivable!') -> CardWithId:
+  return CardWithId(
+      sections=[Section(widgets=[TextParagraph(text=text)])])
+
+
+class CardIdsTest(unittest.TestCase):
+  def test_random_id_is_kept(self) -> None:
+    card = _unnamed()
+    first = card.render()['cardId']
+
+    self.assertEqual(first, card.render()['cardId'])
+    self.assertEqual(first, card.card_id)
+    self.assertNotEqual(first, _unnamed().card_id)
+
+  def test_reading_does_not_change_the_card(self) -> None:
+    card = _unnamed()
+    validation.validate(card)
+    card.card_id
+
+    self.assertTrue(validation.is_validated(card))
+
+  def test_threads_agree(self) -> None:
+    card = _unnamed()
+    ids = set()
+    barrier = threading.Barrier(8)
+
+    def run() -> None:
+      barrier.wait()
+      ids.add(card.card_id)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual({card.card_id}, ids)
+
+  def test_given_id(self) -> None:
+    with card_ids.using(card_ids.content_id):
+      self.assertEqual('vizzini', _card().card_id)
+
+  def test_counter(self) -> None:
+    with card_ids.using(card_ids.Counter(prefix='rous-')):
+      cards = [_unnamed() for _ in range(3)]
+      message = Message(cards_v2=cards)
+
+      self.assertEqual(['rous-1', 'rous-2', 'rous-3'],
+                       [c['cardId'] for c in message.render()['cardsV2']])
+      self.assertEqual(message.render(), message.render())
+
+  def test_counter_threads(self) -> None:
+    counter = card_ids.Counter()
+    ids = []
+
+    def run() -> None:
+      with card_ids.using(counter):
+        ids.extend(_unnamed().card_id for _ in range(100))
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+      thread.start()
+    for thread in threads:
+      thread.join()
+
+    self.assertEqual(400, len(set(ids)))
+
+  def test_content_id(self) -> None:
+    with card_ids.using(card_ids.content_id):
+      card = _unnamed()
+      first = card.card_id
+
+      self.assertEqual(first, _unnamed().card_id)
+      self.assertEqual(_unnamed().render_json(), card.render_json())
+      self.assertNotEqual(first, _unnamed('As you wish').card_id)
+      # Not kept, so it follows changes to the card.
+      card.sections[0].widgets[0].text = 'As you wish'
+      self.assertEqual(_unnamed('As you wish').card_id, card.card_id)
+
+  def test_content_id_of_frozen_sections(self) -> None:
+    with card_ids.using(card_ids.content_id):
+      card = _unnamed()
+      frozen = CardWithId(sections=[s.freeze() for s in card.sections])
+
+      self.assertEqual(card.card_id, frozen.card_id)
+
+  def test_frozen(self) -> None:
+    card = _unnamed()
+    card.card_id  # Given an ID before it is frozen.
+    frozen = card.freeze()
+
+    self.assertEqual(card.card_id, frozen.card_id)
+
+  def test_using_is_restored(self) -> None:
+    with card_ids.using(card_ids.content_id):
+      with card_ids.using(card_ids.random_id):
+        self.assertIs(card_ids.random_id, card_ids.strategy())
+      self.assertIs(card_ids.content_id, card_ids.strategy())
+    self.assertIs(card_ids.random_id, card_ids.strategy())
+
+  def test_set_strategy(self) -> None:
+    counter = card_ids.Counter(start=7)
+    card_ids.set_strategy(counter)
+    try:
+      self.assertIs(counter, card_ids.strategy())
+      self.assertEqual('card-7', _unnamed().card_id)
+    finally:
+      card_ids.set_strategy(card_ids.random_id)
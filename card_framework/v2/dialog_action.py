@@ -15,21 +15,20 @@ from __future__ import annotations
 
 import dataclasses
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 
 from .action_status import ActionStatus
 from .card import Card
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class DialogAction(object):
   action_status: ActionStatus = standard_field()
   dialog: Dialog = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Dialog(object):
   body: Card = standard_field()
@@ -12,21 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import dataclasses
-import dataclasses_json
 
-from typing import Any, List, Dict
-from card_framework import AutoNumber, enum_field, standard_field
-from dataclasses_json import core
+from typing import Any, List
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class CustomEmojiPayload(object):
   file_content: str = standard_field()
   filename: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class CustomEmoji(object):
   name: str = standard_field()
@@ -36,7 +34,7 @@ class CustomEmoji(object):
   payload: CustomEmojiPayload = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Emoji(object):
   unicode: str = standard_field()
@@ -67,30 +65,19 @@ class Emoji(object):
 
     super().__setattr__(__name, __value)
 
-  def to_dict(self, encode_json=False) -> Dict[str, core.Json]:
-    """Converts the dataclass to a dict.
-
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
-
-    Args:
-        encode_json (bool, optional): encode the json strings. Defaults to False.
+  def check(self) -> None:
+    """Checks that one, and only one, of `unicode` and `custom_emoji` is set.
 
     Raises:
-        ValueError: if both `known_icon` and `icon_url` are set.
-
-    Returns:
-        Dict[str, Json]: The header
+        ValueError: if neither or both of them are set.
     """
-    if all([self.unicode, self.custom_emoji]):
+    if self.unicode and self.custom_emoji:
       raise ValueError('Only one of [unicode, custom_emoji] can be set.')
-    elif not (any([self.unicode, self.custom_emoji])):
+    elif not (self.unicode or self.custom_emoji):
       raise ValueError('One of [unicode, custom_emoji] must be set.')
 
-    return super().to_dict(encode_json)
-
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class EmojiReactionSummary(object):
   # class UserType(AutoNumber):
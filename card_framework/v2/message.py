@@ -16,10 +16,8 @@ from __future__ import annotations
 import dataclasses
 from typing import List
 
-import dataclasses_json
-
-from card_framework import (AutoNumber, Renderable, enum_field, list_field,
-                            standard_field)
+from card_framework import (AutoNumber, Renderable, codec, enum_field, lazy,
+                            list_field, standard_field)
 
 from .action_response import ActionResponse
 from .annotation import Annotation
@@ -30,8 +28,11 @@ from .space import Space
 from .user import User
 from .widgets.button_list import ButtonList
 
+# The longest `text` the Chat API accepts, in characters.
+MAX_TEXT_LENGTH = 4096
+
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Message(Renderable):
   __SUPPRESS_TAG__ = True
@@ -44,7 +45,7 @@ class Message(Renderable):
   text: str = standard_field()
   cards: List[Card] = list_field()
   cards_v2: List[CardWithId] = list_field(
-      letter_case=dataclasses_json.LetterCase.CAMEL)
+      letter_case=codec.LetterCase.CAMEL)
   annotations: List[Annotation] = list_field()
   thread: Thread = standard_field()
   space: Space = standard_field()
@@ -63,8 +64,18 @@ class Message(Renderable):
   attached_gifs: List[AttachedGif] = list_field()
   accessory_widgets: List[AccessoryWidget] = list_field()
 
+  def check(self) -> None:
+    """Checks that the message is within the Chat API's limits.
+
+    Raises:
+        ValueError: if the `text` is longer than `MAX_TEXT_LENGTH` characters.
+    """
+    if self.text and len(self.text) > MAX_TEXT_LENGTH:
+      raise ValueError(f'The text is {len(self.text)} characters long, but '
+                       f'can be at most {MAX_TEXT_LENGTH}.')
 
-@dataclasses_json.dataclass_json
+
+@codec.dataclass_json
 @dataclasses.dataclass
 class DeletionMetadata(object):
   class DeletionType(AutoNumber):
@@ -79,38 +90,43 @@ class DeletionMetadata(object):
   deletion_type: DeletionType = enum_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Thread(object):
   name: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SlashCommand(object):
   command_id: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class MatchedUrl(object):
   url: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class QuotedMessageMetadata(object):
   name: str = standard_field()
   last_update_time: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class AttachedGif(object):
   uri: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class AccessoryWidget(object):
   button_list: ButtonList = standard_field()
+
+
+# `LazyMessage.from_dict(event['message'])` decodes each field only when it is
+# first read; see `card_framework.lazy`.
+LazyMessage = lazy.lazy_class(Message)
@@ -0,0 +1,175 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Splitting a card which is too big into several.
+
+A card can only show `card.MAX_WIDGETS` widgets, and a message can be at most
+`sizing.MAX_MESSAGE_BYTES` long. `split_card` cuts a card into as few
+`CardWithId`s as it can, each within a widget and (optionally) byte budget,
+and `split_message` puts each of those in a message of its own:
+```
+for message in pagination.split_message(report):
+  send(message.render_json())
+```
+
+The card is split between widgets, keeping them in order: each part has a
+copy of the card (its header, footer and so on) and copies of the sections
+its widgets came from, with the same headers. Every widget is measured once,
+with `sizing.size`, and parts are generated as soon as they are full, so the
+card is only gone through once.
+"""
+from __future__ import annotations
+
+import dataclasses
+from typing import Callable, Iterator, Optional, TypeVar
+
+from card_framework import sizing
+
+from .card import MAX_WIDGETS, Card, CardWithId
+from .message import Message
+from .section import Section
+from .widgets.divider import Divider
+
+T = TypeVar('T')
+
+
+def split_card(card: Card,
+               max_bytes: Optional[int] = None,
+               max_widgets: int = MAX_WIDGETS) -> Iterator[CardWithId]:
+  """Splits a card into parts with at most `max_widgets` widgets and
+  `max_bytes` bytes of JSON each.
+
+  A part has the card's `card_id` if it has one, followed by `-2`, `-3`...
+  for the second part onwards. A widget which is over the byte budget on its
+  own is put in a part by itself.
+
+  Args:
+      card (Card): the card to split
+      max_bytes (Optional[int], optional): the longest `render_json` of a
+        part. Defaults to None, for no limit.
+      max_widgets (int, optional): the most widgets in a part. Defaults to
+        `MAX_WIDGETS`.
+
+  Yields:
+      CardWithId: the parts, in order
+  """
+  return _split(card, lambda part: part, max_bytes, max_widgets)
+
+
+def split_message(card: Card,
+                  message: Optional[Message] = None,
+                  max_bytes: int = sizing.MAX_MESSAGE_BYTES,
+                  max_widgets: int = MAX_WIDGETS) -> Iterator[Message]:
+  """Splits a card into as many messages as it needs, each with one part of
+  the card (see `split_card`) as its only `cards_v2` entry.
+
+  Args:
+      card (Card): the card to split
+      message (Optional[Message], optional): the rest of each message (its
+        `text`, `thread` and so on), which is copied for each part. Defaults
+        to None, for messages with only the card.
+      max_bytes (int, optional): the longest `render_json` of a message.
+        Defaults to `sizing.MAX_MESSAGE_BYTES`.
+      max_widgets (int, optional): the most widgets in a part. Defaults to
+        `MAX_WIDGETS`.
+
+  Yields:
+      Message: the messages, in order
+  """
+  message = message or Message()
+  return _split(card,
+                lambda part: dataclasses.replace(message, cards_v2=[part]),
+                max_bytes, max_widgets)
+
+
+def _split(card: Card, wrap: Callable[[CardWithId], T],
+           max_bytes: Optional[int], max_widgets: int) -> Iterator[T]:
+  """Splits a card, wrapping each part in what is measured and generated.
+
+  The size of a part is kept up to date as widgets are added to it, from the
+  size of each widget and of the JSON around it, rather than measured again.
+  """
+  measure = sizing.size
+
+  # The JSON that starts the card's `sections`, and each section's `widgets`.
+  part = _part(card, 1)
+  empty = measure(wrap(part))
+  probe = Section(header='-')
+  part.sections.append(probe)
+  opening = measure(wrap(part)) - empty - measure(probe)
+
+  n, part, size, count = 1, _part(card, 1), empty, 0
+  for section in card.sections or ():
+    skeleton = dataclasses.replace(section, widgets=[])
+    bare = measure(skeleton)
+    skeleton.widgets.append(Divider())
+    first = measure(skeleton) - bare - measure(skeleton.widgets[0])
+    current = None
+
+    if not section.widgets:
+      # Only the section itself to add, if it renders to anything.
+      if bare > len('{}'):
+        if (part.sections and max_bytes is not None and
+            size + _separator(part, opening) + bare > max_bytes):
+          yield wrap(part)
+          n += 1
+          part = _part(card, n)
+          size, count = measure(wrap(part)), 0
+        size += _separator(part, opening) + bare
+        part.sections.append(dataclasses.replace(section, widgets=[]))
+      continue
+
+    for widget in section.widgets:
+      widget_size = measure(widget)
+      if current is None:
+        cost = _separator(part, opening) + bare + first + widget_size
+      else:
+        cost = len(', ') + widget_size
+
+      if part.sections and (count >= max_widgets or (
+              max_bytes is not None and size + cost > max_bytes)):
+        yield wrap(part)
+        n += 1
+        part = _part(card, n)
+        size, count = measure(wrap(part)), 0
+        current = None
+        cost = opening + bare + first + widget_size
+
+      if current is None:
+        current = dataclasses.replace(section, widgets=[])
+        part.sections.append(current)
+      current.widgets.append(widget)
+      size += cost
+      count += 1
+
+  yield wrap(part)
+
+
+def _separator(part: CardWithId, opening: int) -> int:
+  # Before a section: the start of `sections` or the comma after the last.
+  return len(', ') if part.sections else opening
+
+
+def _part(card: Card, n: int) -> CardWithId:
+  """A copy of the card, with no sections."""
+  if isinstance(card, CardWithId):
+    part = dataclasses.replace(card, sections=[])
+    # Only rename cards which have an ID, not ones which will be given one.
+    if n > 1 and getattr(card, '_CardWithId__card_id'):
+      part.card_id = f'{card.card_id}-{n}'
+    return part
+
+  fields = {f.name: getattr(card, f.name)
+            for f in dataclasses.fields(Card) if f.init}
+  fields['sections'] = []
+  return CardWithId(**fields)
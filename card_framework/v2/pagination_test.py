@@ -0,0 +1,136 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import dataclasses
+import unittest
+from typing import List
+
+from card_framework import compact, sizing
+
+from . import pagination
+from .card import Card, CardWithId
+from .card_header import CardHeader
+from .message import Message
+from .section import Section
+from .widgets.text_paragraph import TextParagraph
+
+
+def _card(sections: int = 3, widgets: int = 40) -> Card:
+  return Card(
+      header=CardHeader(title='The Princess Bride'),
+      sections=[Section(header=f'Chapter {s}', widgets=[
+          TextParagraph(text=f'As you wish ({s}, {w})' + '!' * (w % 7))
+          for w in range(widgets)]) for s in range(sections)])
+
+
+def _widgets(card: Card) -> List[TextParagraph]:
+  return [w for s in card.sections for w in s.widgets]
+
+
+class SplitCardTest(unittest.TestCase):
+  def test_fits(self) -> None:
+    card = _card(2, 10)
+    parts = list(pagination.split_card(card))
+
+    self.assertEqual(1, len(parts))
+    self.assertIsInstance(parts[0], CardWithId)
+    self.assertEqual(card.render()['card'], parts[0].render()['card'])
+
+  def test_widget_budget(self) -> None:
+    card = _card()
+    parts = list(pagination.split_card(card, max_widgets=50))
+
+    self.assertEqual([50, 50, 20], [len(_widgets(p)) for p in parts])
+    self.assertEqual(_widgets(card), [w for p in parts for w in _widgets(p)])
+    self.assertEqual(['Chapter 1', 'Chapter 2'],
+                     [s.header for s in parts[1].sections])
+    for part in parts:
+      self.assertEqual(card.header, part.header)
+
+  def test_byte_budget(self) -> None:
+    card = _card()
+    parts = list(pagination.split_card(card, max_bytes=2000))
+
+    self.assertGreater(len(parts), 1)
+    self.assertEqual(_widgets(card), [w for p in parts for w in _widgets(p)])
+    for part, following in zip(parts, parts[1:]):
+      self.assertLessEqual(sizing.size(part), 2000)
+      # Each part is as full as it can be.
+      fuller = dataclasses.replace(part, sections=part.sections + [
+          dataclasses.replace(following.sections[0],
+                              widgets=following.sections[0].widgets[:1])])
+      self.assertGreater(sizing.size(fuller), 2000)
+
+  def test_card_ids(self) -> None:
+    card = CardWithId(**{f.name: getattr(_card(), f.name)
+                         for f in dataclasses.fields(Card) if f.init})
+    card.card_id = 'westley'
+    parts = list(pagination.split_card(card, max_widgets=50))
+
+    self.assertEqual(['westley', 'westley-2', 'westley-3'],
+                     [p.card_id for p in parts])
+    self.assertEqual('westley', card.card_id)
+
+  def test_compact(self) -> None:
+    card = CardWithId(**{f.name: getattr(_card(), f.name)
+                         for f in dataclasses.fields(Card) if f.init})
+    card.card_id = 'westley'
+    parts = list(pagination.split_card(compact.compact(card), max_widgets=50))
+
+    self.assertEqual(['westley', 'westley-2', 'westley-3'],
+                     [p.card_id for p in parts])
+    self.assertEqual([w.render() for w in _widgets(card)],
+                     [w.render() for p in parts for w in _widgets(p)])
+    for part in parts:
+      self.assertIsInstance(part, CardWithId)
+
+  def test_large_widget(self) -> None:
+    card = Card(sections=[Section(widgets=[
+        TextParagraph(text='Inconceivable!'),
+        TextParagraph(text='You keep using that word. ' * 10),
+        TextParagraph(text='I do not think it means what you think.')])])
+    parts = list(pagination.split_card(card, max_bytes=200))
+
+    self.assertEqual([1, 1, 1], [len(_widgets(p)) for p in parts])
+
+  def test_sections_without_widgets(self) -> None:
+    card = Card(sections=[Section(header='The Fire Swamp'),
+                          Section(widgets=[TextParagraph(text='R.O.U.S.')])])
+    parts = list(pagination.split_card(card))
+
+    self.assertEqual(card.render()['card'], parts[0].render()['card'])
+
+
+class SplitMessageTest(unittest.TestCase):
+  def test_messages(self) -> None:
+    card = _card(5, 40)
+    message = Message(text='Your report, my lord')
+    messages = list(pagination.split_message(card, message, max_bytes=3000))
+
+    self.assertGreater(len(messages), 1)
+    self.assertEqual(_widgets(card),
+                     [w for m in messages for w in _widgets(m.cards_v2[0])])
+    for m in messages:
+      self.assertEqual('Your report, my lord', m.text)
+      self.assertLessEqual(sizing.size(m), 3000)
+    self.assertEqual([], message.cards_v2)
+
+  def test_default_budget(self) -> None:
+    messages = list(pagination.split_message(_card(10, 60)))
+
+    self.assertEqual(600, sum(len(_widgets(m.cards_v2[0])) for m in messages))
+    for m in messages:
+      self.assertTrue(sizing.fits(m))
+      self.assertLessEqual(len(_widgets(m.cards_v2[0])), 100)
@@ -14,14 +14,14 @@
 import dataclasses
 from typing import List, Optional
 
-import dataclasses_json
-from card_framework import Renderable, enum_field, list_field, standard_field
+from card_framework import (Renderable, codec, enum_field, list_field,
+                            standard_field)
 from .enums import HorizontalAlignment
 
 from .widgets.button import Button
 from .widget import Widget
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class CollapseControl(object):
   horizontal_alignment: HorizontalAlignment = enum_field()
@@ -29,7 +29,7 @@ class CollapseControl(object):
   collapse_button: Button = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Section(Renderable):
   """Section
@@ -56,3 +56,4 @@ class Section(Renderable):
         widget (Widget): The widget to be added to the section.
     """
     self.widgets.append(widget)
+    self.mark_dirty()
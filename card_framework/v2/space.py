@@ -15,11 +15,10 @@ from __future__ import annotations
 
 import dataclasses
 
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, standard_field
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Space(object):
   class SpaceType(AutoNumber):
@@ -37,7 +36,7 @@ class Space(object):
   spaceDetails: SpaceDetail = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SpaceDetail(object):
   description: str = standard_field()
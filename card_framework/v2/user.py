@@ -12,12 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import dataclasses
-import dataclasses_json
 
-from card_framework import AutoNumber, enum_field, standard_field
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class User(object):
   class UserType(AutoNumber):
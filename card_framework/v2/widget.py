@@ -16,13 +16,13 @@ from __future__ import annotations
 from typing import Optional
 
 import dataclasses
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, standard_field, Renderable
+from card_framework import (AutoNumber, Renderable, codec, enum_field,
+                            standard_field)
 
 from .enums import HorizontalAlignment
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Widget(Renderable):
   """Widget
@@ -11,28 +11,73 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+"""The card widgets.
 
-from .action import Action, ActionParameter
-from .button import Button
-from .button_list import ButtonList
-from .chip_list import Chip, ChipList
-from .color import Color
-from .columns import Column, Columns
-from .date_time_picker import DateTimePicker
-from .decorated_text import DecoratedText
-from .divider import Divider
-from .grid import BorderStyle, Grid, GridItem, ImageComponent, ImageCropStyle
-from .icon import Icon
-from .image import Image
-from .on_click import OnClick
-from .open_link import OpenLink
-from .overflow_menu import OverflowMenu, OverflowMenuItem
-from .selection_input import SelectionInput
-from .selection_item import SelectionItem
-from .suggestions import SuggestionItem, Suggestions
-from .switch_control import SwitchControl
-from .text_input import TextInput
-from .text_paragraph import TextParagraph
+The public names are imported from their submodules the first time they are
+used (PEP 562) rather than all at once, so that importing one widget doesn't
+import every other one as well.
+"""
+from typing import TYPE_CHECKING
+
+from card_framework import _lazy_module
+
+if TYPE_CHECKING:
+  from .action import Action, ActionParameter
+  from .button import Button
+  from .button_list import ButtonList
+  from .chip_list import Chip, ChipList
+  from .color import Color
+  from .columns import Column, Columns
+  from .date_time_picker import DateTimePicker
+  from .decorated_text import DecoratedText
+  from .divider import Divider
+  from .grid import BorderStyle, Grid, GridItem, ImageComponent, ImageCropStyle
+  from .icon import Icon
+  from .image import Image
+  from .on_click import OnClick
+  from .open_link import OpenLink
+  from .overflow_menu import OverflowMenu, OverflowMenuItem
+  from .selection_input import SelectionInput
+  from .selection_item import SelectionItem
+  from .suggestions import SuggestionItem, Suggestions
+  from .switch_control import SwitchControl
+  from .text_input import TextInput
+  from .text_paragraph import TextParagraph
+
+# The submodule each public name is defined in.
+_LAZY = {
+    "Action": "action",
+    "ActionParameter": "action",
+    "Button": "button",
+    "ButtonList": "button_list",
+    "Chip": "chip_list",
+    "ChipList": "chip_list",
+    "Color": "color",
+    "Column": "columns",
+    "Columns": "columns",
+    "DateTimePicker": "date_time_picker",
+    "DecoratedText": "decorated_text",
+    "Divider": "divider",
+    "BorderStyle": "grid",
+    "Grid": "grid",
+    "GridItem": "grid",
+    "ImageComponent": "grid",
+    "ImageCropStyle": "grid",
+    "Icon": "icon",
+    "Image": "image",
+    "OnClick": "on_click",
+    "OpenLink": "open_link",
+    "OverflowMenu": "overflow_menu",
+    "OverflowMenuItem": "overflow_menu",
+    "SelectionInput": "selection_input",
+    "SelectionItem": "selection_item",
+    "SuggestionItem": "suggestions",
+    "Suggestions": "suggestions",
+    "SwitchControl": "switch_control",
+    "TextInput": "text_input",
+    "TextParagraph": "text_paragraph",
+}
+_SUBMODULES = frozenset(_LAZY.values())
 
 __all__ = [
     "Action",
@@ -66,3 +111,6 @@ __all__ = [
     "TextInput",
     "TextParagraph",
 ]
+
+
+__getattr__, __dir__ = _lazy_module(globals(), _LAZY, _SUBMODULES)
@@ -17,7 +17,7 @@ from dataclasses import dataclass
 from typing import List, Optional
 
 from card_framework import AutoNumber, enum_field, list_field, standard_field
-from dataclasses_json import dataclass_json
+from card_framework.codec import dataclass_json
 
 from ..widget import Widget
 
@@ -14,8 +14,7 @@
 import dataclasses
 from typing import Optional
 
-import dataclasses_json
-from card_framework import standard_field, enum_field, AutoNumber
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 from ..widget import Widget
 from .color import Color
@@ -23,7 +22,7 @@ from .icon import Icon
 from .on_click import OnClick
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Button(Widget):
   """Button
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from typing import List
 
 from card_framework import list_field
-from dataclasses_json import LetterCase, dataclass_json
+from card_framework.codec import LetterCase, dataclass_json
 
 from ..widget import Widget
 from .button import Button
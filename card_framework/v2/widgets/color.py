@@ -14,12 +14,10 @@
 import dataclasses
 from typing import Any, Optional
 
-import dataclasses_json
+from card_framework import codec, standard_field
 
-from card_framework import standard_field
 
-
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Color(object):
   red: Optional[float] = standard_field()
@@ -17,7 +17,7 @@ from ctypes import Union
 from dataclasses import dataclass
 from typing import List, Optional
 
-from dataclasses_json import dataclass_json
+from card_framework.codec import dataclass_json
 
 from card_framework import AutoNumber, enum_field, list_field
 from card_framework.v2.enums import ImageType
@@ -30,12 +30,25 @@ from .selection_input import SelectionInput
 from .text_input import TextInput
 from .text_paragraph import TextParagraph
 
+# The most columns the Chat API allows in one `Columns` widget.
+MAX_COLUMNS = 2
+
 
 @dataclass_json
 @dataclass
 class Columns(Widget):
   column_items: List[Column] = list_field()
 
+  def check(self) -> None:
+    """Checks that there are at most `MAX_COLUMNS` columns.
+
+    Raises:
+        ValueError: if there are more than `MAX_COLUMNS` columns.
+    """
+    if self.column_items and len(self.column_items) > MAX_COLUMNS:
+      raise ValueError(f'There are {len(self.column_items)} columns, but '
+                       f'there can be at most {MAX_COLUMNS}.')
+
 
 @dataclass_json
 @dataclass
@@ -16,7 +16,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Optional
 
-from dataclasses_json import LetterCase, dataclass_json
+from card_framework.codec import LetterCase, dataclass_json
 
 from card_framework import AutoNumber, enum_field, standard_field
 
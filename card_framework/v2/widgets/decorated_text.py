@@ -12,11 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import dataclasses
-from typing import Dict, Optional
+from typing import Optional
 
-import dataclasses_json
-from card_framework import standard_field
-from dataclasses_json.core import Json
+from card_framework import codec, standard_field
 
 from ..widget import Widget
 from .button import Button
@@ -25,7 +23,7 @@ from .on_click import OnClick
 from .switch_control import SwitchControl
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class DecoratedText(Widget):
   """DecoratedText
@@ -45,24 +43,14 @@ class DecoratedText(Widget):
   switch_control: Optional[SwitchControl] = standard_field()
   end_icon: Optional[Icon] = standard_field()
 
-  def to_dict(self, encode_json=False) -> Dict[str, Json]:
-    """Converts the dataclass to a dict.
-
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
-
-    Args:
-        encode_json (bool, optional): encode the json strings. Defaults to False.
+  def check(self) -> None:
+    """Checks that at most one of `button`, `switch_control` and `end_icon`
+    is set.
 
     Raises:
-        ValueError: if both `known_icon` and `icon_url` are set.
-
-    Returns:
-        Dict[str, Json]: The header
+        ValueError: if more than one of them is set.
     """
-    if sum(i is not None
-           for i in [self.button, self.switch_control, self.end_icon]) > 1:
+    if ((self.button is not None) + (self.switch_control is not None) +
+        (self.end_icon is not None)) > 1:
       raise ValueError(
           'Only one of [button, switch_control, end_icon] can be set.')
-
-    return super().to_dict(encode_json)
@@ -16,8 +16,8 @@ from __future__ import annotations
 import dataclasses
 from typing import List
 
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, list_field, standard_field
+from card_framework import (AutoNumber, codec, enum_field, list_field,
+                            standard_field)
 
 from ..enums import HorizontalAlignment
 from ..widget import Widget
@@ -25,7 +25,7 @@ from .color import Color
 from .on_click import OnClick
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Grid(Widget):
   title: str = standard_field()
@@ -35,7 +35,7 @@ class Grid(Widget):
   on_click: OnClick = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class GridItem(object):
   class GridItemLayout(AutoNumber):
@@ -51,7 +51,7 @@ class GridItem(object):
   layout: GridItemLayout = enum_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class ImageComponent(object):
   image_uri: str = standard_field()
@@ -60,7 +60,7 @@ class ImageComponent(object):
   border_style: BorderStyle = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class ImageCropStyle(object):
   class ImageCropType(AutoNumber):
@@ -74,7 +74,7 @@ class ImageCropStyle(object):
   aspect_ratio: float = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class BorderStyle(object):
   class BorderType(AutoNumber):
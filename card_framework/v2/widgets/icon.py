@@ -14,15 +14,13 @@
 import dataclasses
 from typing import Any, Dict, Optional
 
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, standard_field
-from dataclasses_json import core
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 from ..enums import ImageType
 
 
 @dataclasses.dataclass
-class Icon(dataclasses_json.DataClassJsonMixin):
+class Icon(codec.DataClassJsonMixin):
   class KnownIcon(AutoNumber):
     """Icon
 
@@ -60,7 +58,7 @@ class Icon(dataclasses_json.DataClassJsonMixin):
     VIDEO_PLAY = ()
 
   @dataclasses.dataclass
-  class MaterialIcon(dataclasses_json.DataClassJsonMixin):
+  class MaterialIcon(codec.DataClassJsonMixin):
     """MaterialIcon
     """
     name: Optional[str] = standard_field()
@@ -99,26 +97,40 @@ class Icon(dataclasses_json.DataClassJsonMixin):
 
     super().__setattr__(__name, __value)
 
-  def to_dict(self, encode_json=False) -> Dict[str, core.Json]:
+  def check(self) -> None:
+    """Checks that one of `known_icon`, `icon_url` and `material_icon` is set.
+
+    Raises:
+        ValueError: if none of them, or all of them, are set.
+    """
+    if self.known_icon and self.icon_url and self.material_icon:
+      raise ValueError('Only one of [known_icon, icon_url, '
+                       'material_icon] can be set.')
+    elif not (self.known_icon or self.icon_url or self.material_icon):
+      raise ValueError('One of [known_icon, icon_url, '
+                       'material_icon] must be set.')
+
+  def to_dict(self, encode_json=False) -> Dict[str, codec.Json]:
     """Converts the dataclass to a dict.
 
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
+    This is an override of the standard dataclass `to_dict` method which
+    checks that the icon has a `known_icon`, `icon_url` or `material_icon` to
+    show, unless `validation.validate` has already done so (and the icon
+    hasn't been changed since).
 
     Args:
         encode_json (bool, optional): encode the json strings. Defaults to False.
 
     Raises:
-        ValueError: if both `known_icon` and `icon_url` are set.
+        ValueError: if none of `known_icon`, `icon_url` and `material_icon`
+          are set, or all of them are.
 
     Returns:
-        Dict[str, Json]: The header
+        Dict[str, Json]: The icon
     """
-    if all([self.known_icon, self.icon_url, self.material_icon]):
-      raise ValueError('Only one of [known_icon, icon_url, '
-                       'material_icon] can be set.')
-    elif not (any([self.known_icon, self.icon_url, self.material_icon])):
-      raise ValueError('One of [known_icon, icon_url, '
-                       'material_icon] must be set.')
+    from card_framework import validation
+
+    if not validation.is_validated(self):
+      self.check()
 
     return super().to_dict(encode_json)
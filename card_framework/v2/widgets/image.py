@@ -14,14 +14,13 @@
 import dataclasses
 from typing import Optional
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 
 from ..widget import Widget
 from .on_click import OnClick
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Image(Widget):
   """Image widget.
@@ -14,9 +14,7 @@
 import dataclasses
 from typing import Any, Dict, List, Optional
 
-import dataclasses_json
-from card_framework import standard_field
-from dataclasses_json import core
+from card_framework import codec, standard_field
 
 from .action import Action
 from .open_link import OpenLink
@@ -24,7 +22,7 @@ from .overflow_menu import OverflowMenu
 
 
 @dataclasses.dataclass
-class OnClick(dataclasses_json.DataClassJsonMixin):
+class OnClick(codec.DataClassJsonMixin):
   """OnClick
 
   Renders an OnClick widget component.
@@ -67,11 +65,21 @@ class OnClick(dataclasses_json.DataClassJsonMixin):
 
     super().__setattr__(__name, __value)
 
-  def to_dict(self, encode_json=False) -> Dict[str, core.Json]:
+  def check(self) -> None:
+    """Checks that `action` and `open_link` aren't both set.
+
+    Raises:
+        ValueError: if both `action` and `open_link` are set.
+    """
+    if self.action and self.open_link:
+      raise ValueError('Only one of action and open_link can be should be set.')
+
+  def to_dict(self, encode_json=False) -> Dict[str, codec.Json]:
     """Converts the dataclass to a dict.
 
-    This is an override of the standard dataclass `to_dict` method to allow
-    validation that `action` and `open_link` are mutually exclusive.
+    This is an override of the standard dataclass `to_dict` method to check
+    that `action` and `open_link` aren't both set. The check is skipped for
+    an `OnClick` which `validation.validate` has passed, until it is changed.
 
     Args:
         encode_json (bool, optional): encode the json strings. Defaults to False.
@@ -80,9 +88,11 @@ class OnClick(dataclasses_json.DataClassJsonMixin):
         ValueError: if both `action` and `open_link` are set.
 
     Returns:
-        Dict[str, Json]: The header
+        Dict[str, Json]: The click action
     """
-    if self.action and self.open_link:
-      raise ValueError('Only one of action and open_link can be should be set.')
+    from card_framework import validation
+
+    if not validation.is_validated(self):
+      self.check()
 
     return super().to_dict(encode_json)
@@ -14,15 +14,14 @@
 import dataclasses
 from typing import Dict, List, Optional
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 
 from .action import Action
 from .icon import Icon
 from .open_link import OpenLink
 from ..widget import Widget
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class OverflowMenuItem(object):
   start_icon: Optional[Icon] = standard_field()
@@ -33,7 +32,7 @@ class OverflowMenuItem(object):
   disabled: Optional[bool] = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class OverflowMenu(object):
   items: List[OverflowMenuItem] = standard_field()
@@ -14,22 +14,25 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import Any, Dict, List, Mapping, Optional
+from typing import List, Optional
 
-import dataclasses_json
-from dataclasses_json import core
-
-from card_framework import AutoNumber, enum_field, list_field, standard_field
+from card_framework import (AutoNumber, codec, enum_field, list_field,
+                            standard_field)
 
 from ..widget import Widget
 from .action import Action
 from .selection_item import SelectionItem, SelectionItems
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SelectionInput(Widget):
   """SelectionInput
+
+  The `items` can be a list of `SelectionItem`s, a `SelectionItems`, which
+  is rendered as its list, or, for thousands of items, a
+  `SelectionItemColumns`. Rendering doesn't change any of them, so a large
+  dropdown can be built once and rendered (or frozen) and shared.
   """
   class SelectionType(AutoNumber):
     """SelectionType
@@ -49,23 +52,15 @@ class SelectionInput(Widget):
   external_data_source: Action = standard_field()
   platform_data_source: PlatformDataSource = standard_field()
 
-  def to_dict(self, encode_json=False) -> Dict[str, core.Json]:
-    self.items = self.items.items if self.items else None
-
-    return super().to_dict(encode_json)
-
-  def render(self) -> Mapping[str, Any]:
-    return super().render()
-
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class UpdatedWidget(Widget):
   widget: str = standard_field()
   suggestions: SelectionItems = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class PlatformDataSource(object):
   class CommonDataSource(AutoNumber):
@@ -76,19 +71,19 @@ class PlatformDataSource(object):
   host_app_data_source: HostAppDataSourceMarkup = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class HostAppDataSourceMarkup(object):
   chat_data_source: ChatClientDataSourceMarkup = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class ChatClientDataSourceMarkup(object):
   space_data_source: SpaceDataSource = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SpaceDataSource(object):
   default_to_current_space: bool = standard_field(default=False)
@@ -57,3 +57,27 @@ class SelectionInputTest(unittest.TestCase):
                                   {'key': 'Not left handed', 'value': 'right'}
                               ]}}}
                          )
+
+  def test_selection_items(self) -> None:
+    items = [SelectionItem(text='Fezzik', value='f'),
+             SelectionItem(text='Vizzini', value='v', selected=True)]
+    listed = SelectionInput(name='henchman', items=list(items))
+    wrapped = SelectionInput(name='henchman',
+                             items=SelectionItems(items=list(items)))
+
+    self.assertEqual(listed.render(), wrapped.render())
+    self.assertEqual(listed.render_json(), wrapped.render_json())
+    self.assertEqual(listed.render(), wrapped.freeze().render())
+    self.assertEqual({'selectionInput': {'name': 'henchman'}},
+                     SelectionInput(name='henchman',
+                                    items=SelectionItems()).render())
+
+  def test_render_is_repeatable(self) -> None:
+    items = SelectionItems(items=[SelectionItem(text='Fezzik', value='f')])
+    i = SelectionInput(name='henchman', items=items)
+    first = i.render()
+
+    i.to_dict()
+
+    self.assertEqual(first, i.render())
+    self.assertIs(items, i.items)
@@ -11,15 +11,21 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from __future__ import annotations
+
 import dataclasses
-from typing import List, Optional
+import json
+from json.encoder import encode_basestring_ascii
+from typing import (TYPE_CHECKING, Any, Dict, Iterable, Iterator, List,
+                    Optional, Sequence)
 
-import dataclasses_json
+from card_framework import Renderable, codec, list_field, standard_field
 
-from card_framework import Renderable, list_field, standard_field
+if TYPE_CHECKING:
+  from card_framework import serializer
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SelectionItem(Renderable):
   __SUPPRESS_TAG__ = True
@@ -31,9 +37,171 @@ class SelectionItem(Renderable):
   bottom_text: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SelectionItems(Renderable):
+  """A list of `SelectionItem`s.
+
+  This can be used as a `SelectionInput`'s `items` in place of the list
+  itself, as it iterates over (and has the length of) its items.
+  """
   __SUPPRESS_TAG__ = True
 
   items: List[SelectionItem] = list_field()
+
+  def __iter__(self) -> Iterator[SelectionItem]:
+    return iter(self.items or ())
+
+  def __len__(self) -> int:
+    return len(self.items or ())
+
+
+class SelectionItemColumns(object):
+  """`SelectionItem`s kept column by column, for dropdowns and multiselects
+  with thousands of options.
+
+  This holds one sequence per `SelectionItem` field rather than one object
+  per item, and can be used as a `SelectionInput`'s `items`, which renders to
+  the same JSON as the equivalent list of `SelectionItem`s:
+  ```
+  projects = SelectionItemColumns(text=names, value=ids)
+  SelectionInput(name='project', type=SelectionInput.SelectionType.DROPDOWN,
+                 items=projects)
+  ```
+  Columns can be lists, tuples or anything with a `tolist` method (NumPy
+  arrays, `array.array`s...), which is used to convert them in one go. A
+  column left as None is not rendered, and nor is a falsy entry (None, ''
+  or False), just as for a `SelectionItem`.
+
+  Iterating over (or indexing) the items gives each one rendered, as a
+  dictionary, rather than as a `SelectionItem`.
+
+  The columns are copied into tuples, so the items can't be changed once
+  they have been built. Their JSON is worked out once, the first time they
+  are written by `render_json` (or `write_json`), and reused from then on.
+
+  Args:
+      text (Sequence[str]): the text of each item
+      value (Optional[Sequence[Any]], optional): the values. Defaults to None.
+      selected (Optional[Sequence[bool]], optional): whether each item is
+        selected. Defaults to None.
+      start_icon_uri (Optional[Sequence[str]], optional): the icons.
+        Defaults to None.
+      bottom_text (Optional[Sequence[str]], optional): the text under each
+        item. Defaults to None.
+
+  Raises:
+      ValueError: if the columns aren't all the same length
+  """
+  __slots__ = ('_columns', '_json')
+
+  # The field, and rendered key, of each column.
+  FIELDS = ('text', 'value', 'selected', 'start_icon_uri', 'bottom_text')
+  _KEYS = ('text', 'value', 'selected', 'startIconUri', 'bottomText')
+
+  def __init__(self, text: Sequence[str],
+               value: Optional[Sequence[Any]] = None,
+               selected: Optional[Sequence[bool]] = None,
+               start_icon_uri: Optional[Sequence[str]] = None,
+               bottom_text: Optional[Sequence[str]] = None) -> None:
+    columns, length = [], None
+    for (name, column) in zip(self.FIELDS, [text, value, selected,
+                                            start_icon_uri, bottom_text]):
+      if column is None:
+        columns.append(None)
+        continue
+      column = tuple(column.tolist() if hasattr(column, 'tolist')
+                     else column)
+      if name == 'selected':
+        # Arrays of 0s and 1s, too, render as JSON booleans.
+        column = tuple(map(bool, column))
+      if length is None:
+        length = (name, len(column))
+      elif len(column) != length[1]:
+        raise ValueError(f'The {name} column has {len(column)} items, but '
+                         f'the {length[0]} column has {length[1]}.')
+      columns.append(column)
+    object.__setattr__(self, '_columns', tuple(columns))
+    object.__setattr__(self, '_json', None)
+
+  @classmethod
+  def from_rows(cls, rows: Iterable[Sequence[Any]],
+                fields: Sequence[str] = ('text', 'value')
+                ) -> SelectionItemColumns:
+    """Builds the columns from rows, such as a database query's result.
+
+    Args:
+        rows (Iterable[Sequence[Any]]): the rows, with one entry per field
+        fields (Sequence[str], optional): the field each entry of a row is
+          for. Defaults to ('text', 'value').
+
+    Returns:
+        SelectionItemColumns: the items
+    """
+    columns = list(zip(*rows)) or [()] * len(fields)
+    return cls(**dict(zip(fields, columns)))
+
+  def __setattr__(self, name: str, value: Any) -> None:
+    raise dataclasses.FrozenInstanceError(f'cannot assign to field {name!r}')
+
+  def __len__(self) -> int:
+    for column in self._columns:
+      if column is not None:
+        return len(column)
+    return 0
+
+  def __iter__(self) -> Iterator[Dict[str, Any]]:
+    """Renders each item, as `SelectionItem.render` would."""
+    keys = [k for (k, c) in zip(self._KEYS, self._columns) if c is not None]
+    columns = [c for c in self._columns if c is not None]
+    for row in zip(*columns):
+      yield {k: v for (k, v) in zip(keys, row) if v}
+
+  def __getitem__(self, i: int) -> Dict[str, Any]:
+    """Renders one item, as iterating over the items does."""
+    return {k: c[i] for (k, c) in zip(self._KEYS, self._columns)
+            if c is not None and c[i]}
+
+  def __eq__(self, other: Any) -> bool:
+    if other.__class__ is not self.__class__:
+      return NotImplemented
+    return self._columns == other._columns
+
+  def __hash__(self) -> int:
+    return hash(self._columns)
+
+  def __repr__(self) -> str:
+    return f'{self.__class__.__name__}({len(self)} items)'
+
+  def __reduce__(self) -> Any:
+    return (self.__class__, self._columns)
+
+  def __copy__(self) -> SelectionItemColumns:
+    return self
+
+  def __deepcopy__(self, memo: Dict[int, Any]) -> SelectionItemColumns:
+    return self
+
+  def __write_items__(self, out: serializer.Output) -> None:
+    """Writes the items' JSON, as `serializer.write_items` would."""
+    if self._json is None:
+      object.__setattr__(self, '_json', self._encode())
+    out.append(self._json)
+
+  def _encode(self) -> str:
+    encoded = []
+    for (key, column) in zip(self._KEYS, self._columns):
+      if column is not None:
+        prefix = encode_basestring_ascii(key) + ': '
+        encoded.append([(prefix + _encode_value(v)) if v else ''
+                        for v in column])
+    rows = ('{' + ', '.join(filter(None, row)) + '}' for row in zip(*encoded))
+    return '[' + ', '.join(rows) + ']'
+
+
+def _encode_value(value: Any) -> str:
+  if type(value) is str:
+    return encode_basestring_ascii(value)
+  if value is True:
+    return 'true'
+  return json.dumps(value)
@@ -0,0 +1,97 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import array
+import dataclasses
+import pickle
+import unittest
+
+from card_framework import fingerprint, sizing
+from card_framework.v2.widgets.selection_input import SelectionInput
+from card_framework.v2.widgets.selection_item import (SelectionItem,
+                                                      SelectionItemColumns)
+
+
+def _dropdown(items) -> SelectionInput:
+  return SelectionInput(name='henchman', items=items,
+                        type=SelectionInput.SelectionType.DROPDOWN)
+
+
+_COLUMNS = dict(text=['Fezzik', 'Vizzini', 'Inigo Montoya', ''],
+                value=['fezzik', 'vizzini', 3, None],
+                selected=[True, False, None, True],
+                bottom_text=[None, 'Inconceivable!', 'Hola', ''])
+
+
+def _items():
+  return [SelectionItem(**dict(zip(_COLUMNS, row)))
+          for row in zip(*_COLUMNS.values())]
+
+
+class SelectionItemColumnsTest(unittest.TestCase):
+  def test_same_as_selection_items(self) -> None:
+    columns = _dropdown(SelectionItemColumns(**_COLUMNS))
+    items = _dropdown(_items())
+
+    self.assertEqual(items.render(), columns.render())
+    self.assertEqual(items.render_json(), columns.render_json())
+    self.assertEqual(items.render_json(backend='json'),
+                     columns.render_json(backend='json'))
+    self.assertEqual(sizing.size(items), sizing.size(columns))
+    self.assertEqual(fingerprint.fingerprint(items),
+                     fingerprint.fingerprint(columns))
+
+  def test_json_is_kept(self) -> None:
+    dropdown = _dropdown(SelectionItemColumns(**_COLUMNS))
+    first = dropdown.render_json()
+
+    self.assertEqual(first, dropdown.render_json())
+    self.assertEqual(first, dropdown.freeze().render_json())
+    self.assertEqual(first, pickle.loads(pickle.dumps(dropdown)).render_json())
+
+  def test_items(self) -> None:
+    columns = SelectionItemColumns(**_COLUMNS)
+
+    self.assertEqual(list(columns), [columns[i] for i in range(len(columns))])
+    self.assertEqual([i.render() for i in _items()], list(columns))
+
+  def test_tolist(self) -> None:
+    columns = SelectionItemColumns(text=array.array('u', 'ab'),
+                                   selected=array.array('b', [1, 0]))
+
+    self.assertEqual([{'text': 'a', 'selected': True}, {'text': 'b'}],
+                     list(columns))
+
+  def test_from_rows(self) -> None:
+    rows = [('Westley', 'farm-boy'), ('Buttercup', 'princess')]
+    columns = SelectionItemColumns.from_rows(rows)
+
+    self.assertEqual(2, len(columns))
+    self.assertEqual({'text': 'Buttercup', 'value': 'princess'}, columns[1])
+    self.assertEqual(0, len(SelectionItemColumns.from_rows([])))
+    self.assertEqual(
+        SelectionItemColumns(text=['Westley'], bottom_text=['farm-boy']),
+        SelectionItemColumns.from_rows([rows[0]],
+                                       fields=('text', 'bottom_text')))
+
+  def test_lengths_must_match(self) -> None:
+    with self.assertRaises(ValueError):
+      SelectionItemColumns(text=['Westley', 'Buttercup'], value=['farm-boy'])
+
+  def test_read_only(self) -> None:
+    columns = SelectionItemColumns(text=['Westley'])
+
+    with self.assertRaises(dataclasses.FrozenInstanceError):
+      columns._columns = ()
+    self.assertEqual(hash(SelectionItemColumns(text=['Westley'])),
+                     hash(columns))
@@ -14,17 +14,16 @@
 import dataclasses
 from typing import List
 
-from card_framework import standard_field
-import dataclasses_json
+from card_framework import codec, standard_field
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SuggestionItem(object):
   text: str = standard_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Suggestions(object):
   items: List[SuggestionItem] = standard_field()
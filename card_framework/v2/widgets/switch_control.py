@@ -15,14 +15,13 @@ from __future__ import annotations
 
 import dataclasses
 
-import dataclasses_json
-from card_framework import AutoNumber, enum_field, standard_field
+from card_framework import AutoNumber, codec, enum_field, standard_field
 
 from ..widget import Widget
 from .action import Action
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class SwitchControl(Widget):
   """SwitchControl
@@ -14,15 +14,15 @@
 import dataclasses
 from typing import Optional
 
-from card_framework import AutoNumber, enum_field, standard_field, Renderable
-import dataclasses_json
+from card_framework import (AutoNumber, Renderable, codec, enum_field,
+                            standard_field)
 
 from ..widget import Widget
 from .action import Action
 from .suggestions import Suggestions
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class Validation(Renderable):
   class InputType(AutoNumber):
@@ -40,7 +40,7 @@ _
   input_type: Optional[InputType] = enum_field()
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class TextInput(Widget):
   """TextInput
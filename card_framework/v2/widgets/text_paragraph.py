@@ -13,14 +13,13 @@
 # limitations under the License.
 import dataclasses
 
-import dataclasses_json
-from card_framework import standard_field
+from card_framework import codec, standard_field
 from typing import Optional
 
 from ..widget import Widget
 
 
-@dataclasses_json.dataclass_json
+@codec.dataclass_json
 @dataclasses.dataclass
 class TextParagraph(Widget):
   """TextParagraph
@@ -0,0 +1,242 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Checking a widget tree before it is rendered.
+
+Some classes check their fields are consistent (that only one of an
+`OnClick`'s `action` and `open_link` is set, say) in a `check` method, which
+raises a `ValueError` if they aren't. Others check that they are within the
+Chat API's limits (`Message.text` length, widgets per `Card`...). Those whose
+`to_dict` is their own (`OnClick`, `Icon` and `CardHeader`) call it when they
+are converted on their own; nested in a card, they are encoded like any other
+field, as `dataclasses_json` does, so their `check` isn't run when the card
+is rendered.
+
+`violations` runs every `check` in a tree, without rendering anything, and
+returns each failure with the JSON path of the object which failed it:
+```
+for violation in validation.violations(message):
+  print(violation)  # $.cardsV2[0].card.sections[1].widgets[2]...: ...
+```
+
+`validate` raises the first violation, if there is one, and otherwise marks
+every object whose `check` it ran as validated:
+```
+card.validate()
+...
+return card.render_json()
+```
+A marked `OnClick`, `Icon` or `CardHeader` skips its `check` when it is
+converted on its own. Assigning any attribute of a validated object removes
+its mark, so it is checked again the next time it is converted (or
+validated). Changes made in place (appending to a list, say) can't be seen,
+but those checks only look at the object's own attributes. Compact objects
+(see `card_framework.compact`) have a slot for the mark; any other object
+with no `__dict__` (from a `dataclass` with `slots=True`, say) can't hold
+it, so is always checked.
+"""
+from __future__ import annotations
+
+import enum
+from collections.abc import Mapping
+from typing import (Any, Dict, Iterable, Iterator, List, NamedTuple, Optional,
+                    Set, Tuple)
+
+from card_framework import compiler
+
+# The attribute `validate` sets on each object whose `check` passed.
+VALIDATED = '__validated__'
+
+_FIELDS: Dict[type, Tuple[Tuple[str, str, bool], ...]] = {}
+_WATCHED: Set[type] = set()
+
+
+def is_validated(obj: Any) -> bool:
+  """Whether `validate` has run an object's `check`, and nothing has been
+  assigned to the object since.
+
+  Args:
+      obj (Any): the object
+
+  Returns:
+      bool: whether `to_dict` can skip the object's `check`
+  """
+  return getattr(obj, VALIDATED, False)
+
+
+class Violation(NamedTuple):
+  """A `check` which failed.
+
+  Attributes:
+      path (str): where the object is in the rendered JSON, such as
+        `$.cardsV2[0].card.sections[1].widgets[2].decoratedText.startIcon`
+      message (str): what the `check` reported
+  """
+  path: str
+  message: str
+
+  def __str__(self) -> str:
+    return f'{self.path}: {self.message}'
+
+
+def validate(value: Any) -> None:
+  """Runs the `check` of every object in a widget tree.
+
+  Nothing is rendered. If every check passes, each object checked is marked
+  as validated, so that converting it on its own skips its `check` until it
+  is changed.
+
+  Args:
+      value (Any): the message, card, widget or value to check
+
+  Raises:
+      ValueError: for the first `check` which fails, with the object's path
+  """
+  checked: List[Any] = []
+  for violation in _violations(value, checked):
+    raise ValueError(str(violation))
+  for obj in checked:
+    _mark(obj)
+
+
+def violations(value: Any) -> List[Violation]:
+  """Runs the `check` of every object in a widget tree, collecting every
+  failure rather than stopping at the first.
+
+  Nothing is rendered.
+
+  Args:
+      value (Any): the message, card, widget or value to check
+
+  Returns:
+      List[Violation]: the failures, in the order they would be rendered
+  """
+  return list(_violations(value))
+
+
+def _violations(value: Any,
+                checked: Optional[List[Any]] = None) -> Iterator[Violation]:
+  # Paths are kept as (parent, step) pairs and only joined for a violation.
+  pending: List[Tuple[Any, Any]] = [((None, '$'), value)]
+  while pending:
+    path, value = pending.pop()
+    cls = type(value)
+    if cls in compiler._ATOMIC or isinstance(value, enum.Enum):
+      continue
+
+    if hasattr(cls, '__dataclass_fields__'):
+      if (check := getattr(cls, 'check', None)) is not None:
+        try:
+          check(value)
+        except ValueError as e:
+          yield Violation(_join(path), str(e))
+        else:
+          if checked is not None:
+            checked.append(value)
+      pending.extend(_field_children(cls, value, path))
+    else:
+      pending.extend(_entries(value, path))
+
+
+def _field_children(cls: type, value: Any,
+                    path: Tuple[Any, Any]) -> List[Tuple[Any, Any]]:
+  """The (path, value) pairs of a dataclass's fields which can hold anything
+  to check, reversed, so that popping them checks the tree in order."""
+  children = []
+  for (name, key, tagged) in reversed(_fields(cls)):
+    child = getattr(value, name)
+    if type(child) in compiler._ATOMIC or isinstance(child, enum.Enum):
+      continue
+    if tagged and isinstance(child, (list, tuple)):
+      step = (path, f'.{key}')
+      children.extend(((_tag(item, (step, f'[{i}]')), item)
+                       for i, item in reversed(list(enumerate(child)))))
+    else:
+      children.append(((path, f'.{key}'), child))
+  return children
+
+
+def _entries(value: Any, path: Tuple[Any, Any]) -> Iterable[Tuple[Any, Any]]:
+  """The (path, value) pairs of a collection's entries, reversed like
+  `_field_children`."""
+  if isinstance(value, Mapping):
+    return [((path, f'[{k!r}]'), v) for k, v in reversed(value.items())]
+  if isinstance(value, (list, tuple)):
+    return [((path, f'[{i}]'), v) for i, v in reversed(list(enumerate(value)))]
+  if isinstance(value, (set, frozenset)):
+    return [((path, '[]'), v) for v in value]
+  return ()
+
+
+def _tag(item: Any, path: Tuple[Any, Any]) -> Tuple[Any, Any]:
+  # Renderable entries of a `list_field` are rendered inside their tag.
+  cls = type(item)
+  if not callable(getattr(cls, 'render', None)):
+    return path
+  metadata = compiler.render_metadata(cls)
+  return path if metadata.suppress_tag else (path, f'.{metadata.tag}')
+
+
+def _join(path: Tuple[Any, Any]) -> str:
+  steps = []
+  while path is not None:
+    path, step = path
+    steps.append(step)
+  return ''.join(reversed(steps))
+
+
+def _fields(cls: type) -> Tuple[Tuple[str, str, bool], ...]:
+  """The name, rendered key and whether it is a `list_field` of each field."""
+  try:
+    return _FIELDS[cls]
+  except KeyError:
+    fields = []
+    for name, override in compiler.field_overrides(cls).items():
+      letter_case = override.get('letter_case')
+      fields.append((name, letter_case(name) if letter_case else name,
+                     override.get('encoder') is compiler.encode_list))
+    result = _FIELDS[cls] = tuple(fields)
+    return result
+
+
+def _mark(obj: Any) -> None:
+  cls = type(obj)
+  if cls not in _WATCHED and not getattr(cls, '__FROZEN__', False):
+    _watch(cls)
+  try:
+    # Bypass `__setattr__`, which would remove the mark.
+    object.__setattr__(obj, VALIDATED, True)
+  except AttributeError:
+    # An object with neither a slot nor a `__dict__` to keep the mark in.
+    pass
+
+
+def _watch(cls: type) -> None:
+  """Makes setting an attribute of `cls` remove the instance's mark.
+
+  The class's existing `__setattr__` (its own, inherited or `object`'s) is
+  wrapped, as `tracking.track` does, so validation such as `OnClick`'s
+  still runs.
+  """
+  setattr_ = cls.__setattr__
+
+  def __setattr__(self, __name: str, __value: Any) -> None:
+    setattr_(self, __name, __value)
+    if getattr(self, VALIDATED, False):
+      object.__setattr__(self, VALIDATED, False)
+
+  # So that `tracking.track` doesn't wrap the class again.
+  __setattr__.__tracks_renders__ = getattr(setattr_, '__tracks_renders__',
+                                           False)
+  cls.__setattr__ = __setattr__
+  _WATCHED.add(cls)
@@ -0,0 +1,202 @@
+# Copyright 2025 Google Inc. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from card_framework import validation
+from card_framework.v2.annotation import Annotation
+from card_framework.v2.attachment import Attachment
+from card_framework.v2.card import MAX_WIDGETS, Card, CardWithId
+from card_framework.v2.card_header import CardHeader
+from card_framework.v2.emoji import Emoji
+from card_framework.v2.message import MAX_TEXT_LENGTH, Message
+from card_framework.v2.section import Section
+from card_framework.v2.widgets.columns import MAX_COLUMNS, Column, Columns
+from card_framework.v2.widgets.decorated_text import DecoratedText
+from card_framework.v2.widgets.icon import Icon
+from card_framework.v2.widgets.action import Action
+from card_framework.v2.widgets.on_click import OnClick
+from card_framework.v2.widgets.open_link import OpenLink
+
+
+def _card(icon: Icon) -> Card:
+  text = DecoratedText(top_label='Hello, my name is Inigo Montoya',
+                       text='You killed my father. Prepare to die.',
+                       start_icon=icon)
+  return Card(header=CardHeader(title='The Princess Bride'),
+              sections=[Section(widgets=[text])])
+
+
+class ValidateTest(unittest.TestCase):
+  def test_valid(self) -> None:
+    card = _card(Icon(known_icon=Icon.KnownIcon.PERSON))
+
+    validation.validate(Message(cards=[card]))
+    card.validate()
+
+  def test_nested(self) -> None:
+    message = Message(cards=[_card(Icon())])
+
+    with self.assertRaisesRegex(ValueError, 'must be set'):
+      validation.validate(message)
+    with self.assertRaisesRegex(ValueError, 'must be set'):
+      message.validate()
+
+  def test_first_failure_in_order(self) -> None:
+    values = [DecoratedText(text='Inconceivable!', start_icon=Icon()), Emoji()]
+
+    with self.assertRaisesRegex(ValueError, 'known_icon'):
+      validation.validate(values)
+
+  def test_classes_without_their_own_to_dict(self) -> None:
+    tests = {
+        'decorated_text': DecoratedText(button=object(), switch_control=object()),
+        'emoji': Emoji(),
+        'annotation': Annotation(),
+        'attachment': Attachment(),
+    }
+    for name, value in tests.items():
+      with self.subTest(name):
+        self.assertRaises(ValueError, validation.validate, value)
+
+
+class ViolationsTest(unittest.TestCase):
+  def test_none(self) -> None:
+    card = _card(Icon(known_icon=Icon.KnownIcon.PERSON))
+
+    self.assertEqual([], validation.violations(Message(cards_v2=[card])))
+
+  def test_every_violation_with_its_path(self) -> None:
+    card = CardWithId(header=CardHeader(title='The Princess Bride',
+                                        image_url='https://princess.bride'),
+                      sections=[Section(widgets=[
+                          DecoratedText(text='Inconceivable!'),
+                          DecoratedText(start_icon=Icon(), end_icon=Icon()),
+                      ])])
+    message = Message(cards_v2=[card], annotations=[Annotation()])
+
+    self.assertEqual([
+        '$.cardsV2[0].card.header',
+        '$.cardsV2[0].card.sections[0].widgets[1].decoratedText.startIcon',
+        '$.cardsV2[0].card.sections[0].widgets[1].decoratedText.endIcon',
+        '$.annotations[0].annotation',
+    ], [v.path for v in validation.violations(message)])
+
+  def test_mappings_and_lists(self) -> None:
+    value = {'westley': [Icon(known_icon=Icon.KnownIcon.PERSON), Icon()]}
+
+    self.assertEqual(
+        [validation.Violation(
+            path="$['westley'][1]",
+            message='One of [known_icon, icon_url, material_icon] must be set.')],
+        validation.violations(value))
+
+  def test_validate_reports_the_path(self) -> None:
+    with self.assertRaisesRegex(ValueError,
+                                r'^\$\.sections\[0\]\.widgets\[0\]'):
+      _card(Icon()).validate()
+
+  def test_limits(self) -> None:
+    text = DecoratedText(text='Inconceivable!')
+    tests = {
+        'text': Message(text='Never get involved in a land war in Asia. ' *
+                        (MAX_TEXT_LENGTH // 40)),
+        'widgets': Card(sections=[Section(widgets=[text] * MAX_WIDGETS),
+                                  Section(widgets=[text])]),
+        'columns': Columns(column_items=[Column(widgets=[text])] *
+                           (MAX_COLUMNS + 1)),
+    }
+    for name, value in tests.items():
+      with self.subTest(name):
+        self.assertEqual(['$'], [v.path for v in validation.violations(value)])
+
+  def test_within_limits(self) -> None:
+    text = DecoratedText(text='Inconceivable!')
+    card = Card(sections=[Section(widgets=[text] * (MAX_WIDGETS - 1)),
+                          Section(widgets=[text])])
+
+    self.assertEqual([], validation.violations(
+        Message(text='a' * MAX_TEXT_LENGTH, cards=[card])))
+
+
+class ValidatedTest(unittest.TestCase):
+  def test_checks_when_rendering(self) -> None:
+    with self.assertRaises(ValueError):
+      Icon().to_dict()
+
+  def test_validated_objects_are_not_checked(self) -> None:
+    icon = Icon(known_icon=Icon.KnownIcon.PERSON)
+    card = _card(icon)
+    expected = icon.to_dict()
+    card.validate()
+
+    self.assertTrue(validation.is_validated(card.header))
+    with mock.patch.object(Icon, 'check') as check:
+      self.assertEqual(expected, icon.to_dict())
+      check.assert_not_called()
+      # Only the objects `validate` checked are skipped.
+      Icon(known_icon=Icon.KnownIcon.STAR).to_dict()
+      check.assert_called_once()
+
+  def test_changes_remove_the_mark(self) -> None:
+    icon = Icon(known_icon=Icon.KnownIcon.PERSON)
+    validation.validate(icon)
+    icon.known_icon = None
+
+    self.assertFalse(validation.is_validated(icon))
+    with self.assertRaises(ValueError):
+      icon.to_dict()
+
+  def test_nothing_is_marked_if_a_check_fails(self) -> None:
+    icon = Icon(known_icon=Icon.KnownIcon.PERSON)
+
+    with self.assertRaises(ValueError):
+      validation.validate([icon, Icon()])
+    self.assertFalse(validation.is_validated(icon))
+
+  def test_setattr_still_runs(self) -> None:
+    click = OnClick(open_link=OpenLink(url='https://princess.bride'))
+    validation.validate(click)
+    click.action = Action(function='inconceivable')
+
+    self.assertIsNone(click.open_link)
+    self.assertFalse(validation.is_validated(click))
+
+  def test_render_cache(self) -> None:
+    text = DecoratedText(text='Inconceivable!')
+    text.__CACHE_RENDER__ = True
+    text.validate()
+    text.render()
+    setattr_ = DecoratedText.__setattr__
+    text.text = 'As you wish'
+
+    self.assertEqual('As you wish', text.render()['decoratedText']['text'])
+    self.assertFalse(validation.is_validated(text))
+    DecoratedText(text='Vizzini').render()
+    self.assertIs(setattr_, DecoratedText.__setattr__)
+
+  def test_copies(self) -> None:
+    card = _card(Icon(known_icon=Icon.KnownIcon.PERSON))
+    card.validate()
+
+    self.assertTrue(validation.is_validated(card.freeze().header))
+    compacted = card.compact()
+    self.assertFalse(validation.is_validated(compacted.header))
+    compacted.validate()
+    self.assertTrue(validation.is_validated(compacted.header))
+    compacted.header.title = 'Inconceivable!'
+    self.assertFalse(validation.is_validated(compacted.header))
+    self.assertEqual(card.render_json(), card.compact().render_json())